@@ -5,6 +5,28 @@ Typed async client for the taginfo API.
 The `api` package structure is in large parts derived from the endpoint path segments:
 
 * ``aio_taginfo.error``
+* ``aio_taginfo.validation``
+* ``aio_taginfo.client``
+* ``aio_taginfo.cache``
+* ``aio_taginfo.hedging``
+* ``aio_taginfo.breaker``
+* ``aio_taginfo.scheduler``
+* ``aio_taginfo.limiter``
+* ``aio_taginfo.instances``
+* ``aio_taginfo.batch``
+* ``aio_taginfo.report``
+* ``aio_taginfo.autocomplete``
+* ``aio_taginfo.distribution``
+* ``aio_taginfo.export``
+* ``aio_taginfo.snapshots``
+* ``aio_taginfo.replay``
+* ``aio_taginfo.local.keys``
+* ``aio_taginfo.local.projects``
+* ``aio_taginfo.local.relations``
+* ``aio_taginfo.local.similar``
+* ``aio_taginfo.local.stats``
+* ``aio_taginfo.local.unicode``
+* ``aio_taginfo.local.wikidata``
 * ``aio_taginfo.api.v4``
 * ``aio_taginfo.api.v4.key.distribution.nodes``
 * ``aio_taginfo.api.v4.key.distribution.ways``
@@ -40,6 +62,7 @@ The `api` package structure is in large parts derived from the endpoint path seg
 * ``aio_taginfo.api.v4.site.info``
 * ``aio_taginfo.api.v4.site.sources``
 * ``aio_taginfo.api.v4.tag.chronology``
+* ``aio_taginfo.api.v4.tag.combinations``
 * ``aio_taginfo.api.v4.tag.distribution.nodes``
 * ``aio_taginfo.api.v4.tag.distribution.ways``
 * ``aio_taginfo.api.v4.tag.overview``
@@ -79,12 +102,42 @@ __all__ = (
     "key_overview",
     "key_prevalent_values",
     "key_projects",
+    "key_report",
     "key_similar",
     "key_stats",
+    "keys_all",
+    "languages",
+    "project_icon",
+    "project_tags",
+    "projects_all",
+    "projects_keys",
+    "projects_tags",
     "relation_projects",
+    "relation_roles",
+    "relation_stats",
+    "relations_all",
+    "search_by_key_and_value",
+    "search_by_keyword",
+    "search_by_role",
+    "search_by_value",
     "site_config_geodistribution",
+    "site_info",
+    "site_sources",
+    "tag_chronology",
+    "tag_combinations",
+    "tag_distribution_nodes",
+    "tag_distribution_ways",
+    "tag_overview",
     "tag_projects",
+    "tag_report",
+    "tag_stats",
+    "tag_wiki_pages",
+    "tags_list",
     "tags_popular",
+    "unicode_characters",
+    "wiki_languages",
+    "wikidata_all",
+    "wikidata_errors",
 )
 
 from aio_taginfo.api.v4.key.chronology import call as key_chronology
@@ -96,8 +149,37 @@ from aio_taginfo.api.v4.key.prevalent_values import call as key_prevalent_values
 from aio_taginfo.api.v4.key.projects import call as key_projects
 from aio_taginfo.api.v4.key.similar import call as key_similar
 from aio_taginfo.api.v4.key.stats import call as key_stats
+from aio_taginfo.api.v4.keys.all import call as keys_all
+from aio_taginfo.api.v4.languages import call as languages
+from aio_taginfo.api.v4.project.icon import call as project_icon
+from aio_taginfo.api.v4.project.tags import call as project_tags
+from aio_taginfo.api.v4.projects.all import call as projects_all
+from aio_taginfo.api.v4.projects.keys import call as projects_keys
+from aio_taginfo.api.v4.projects.tags import call as projects_tags
 from aio_taginfo.api.v4.relation.projects import call as relation_projects
+from aio_taginfo.api.v4.relation.roles import call as relation_roles
+from aio_taginfo.api.v4.relation.stats import call as relation_stats
+from aio_taginfo.api.v4.relations.all import call as relations_all
+from aio_taginfo.api.v4.search.by_key_and_value import call as search_by_key_and_value
+from aio_taginfo.api.v4.search.by_keyword import call as search_by_keyword
+from aio_taginfo.api.v4.search.by_role import call as search_by_role
+from aio_taginfo.api.v4.search.by_value import call as search_by_value
 from aio_taginfo.api.v4.site.config.geodistribution import call as site_config_geodistribution
+from aio_taginfo.api.v4.site.info import call as site_info
+from aio_taginfo.api.v4.site.sources import call as site_sources
+from aio_taginfo.api.v4.tag.chronology import call as tag_chronology
+from aio_taginfo.api.v4.tag.combinations import call as tag_combinations
+from aio_taginfo.api.v4.tag.distribution.nodes import call as tag_distribution_nodes
+from aio_taginfo.api.v4.tag.distribution.ways import call as tag_distribution_ways
+from aio_taginfo.api.v4.tag.overview import call as tag_overview
 from aio_taginfo.api.v4.tag.projects import call as tag_projects
+from aio_taginfo.api.v4.tag.stats import call as tag_stats
+from aio_taginfo.api.v4.tag.wiki_pages import call as tag_wiki_pages
+from aio_taginfo.api.v4.tags.list import call as tags_list
 from aio_taginfo.api.v4.tags.popular import call as tags_popular
+from aio_taginfo.api.v4.unicode.characters import call as unicode_characters
+from aio_taginfo.api.v4.wiki.languages import call as wiki_languages
+from aio_taginfo.api.v4.wikidata.all import call as wikidata_all
+from aio_taginfo.api.v4.wikidata.errors import call as wikidata_errors
 from aio_taginfo.error import TaginfoError
+from aio_taginfo.report import key_report, tag_report
@@ -0,0 +1,92 @@
+"""
+Command line interface.
+
+```
+python -m aio_taginfo export <directory> [--keys keys.txt]
+```
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+from aio_taginfo.api.v4.keys import all as keys_all
+from aio_taginfo.export import ENDPOINTS, ExportProgress, export_keys
+
+from aiohttp import ClientSession
+
+
+def _read_keys(path: str) -> Iterator[str]:
+    f = sys.stdin if path == "-" else Path(path).open(encoding="utf-8")  # noqa: SIM115
+    with f:
+        for line in f:
+            key = line.strip()
+            if key:
+                yield key
+
+
+async def _all_keys(session: ClientSession) -> AsyncIterator[str]:
+    async for page in keys_all.call_pages(session=session):
+        for item in page.data:
+            yield item.key
+
+
+def _print_progress(progress: ExportProgress) -> None:
+    print(progress, file=sys.stderr, flush=True)  # noqa: T201
+
+
+async def _export(args: argparse.Namespace) -> None:
+    headers = {"User-Agent": args.user_agent} if args.user_agent else None
+    async with ClientSession(headers=headers) as session:
+        await export_keys(
+            keys=_read_keys(args.keys) if args.keys else _all_keys(session),
+            directory=args.directory,
+            endpoints=args.endpoints,
+            concurrency=args.concurrency,
+            rate=args.rate or None,
+            checkpoint_every=args.checkpoint_every,
+            on_progress=_print_progress,
+            session=session,
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the given command."""
+    parser = argparse.ArgumentParser(prog="python -m aio_taginfo")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="export data for many keys to NDJSON files")
+    export.add_argument("directory", help="output directory; an existing export is resumed")
+    export.add_argument(
+        "--keys",
+        help="file with one key per line, or '-' to read from stdin (default: all keys)",
+    )
+    export.add_argument(
+        "--endpoints",
+        nargs="+",
+        choices=ENDPOINTS,
+        default=ENDPOINTS,
+        help="endpoints to export for every key (default: all)",
+    )
+    export.add_argument("--concurrency", type=int, default=4, help="requests in flight")
+    export.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="maximum requests per second, 0 for no limit (default: 2)",
+    )
+    export.add_argument("--checkpoint-every", type=int, default=100, metavar="KEYS")
+    export.add_argument("--user-agent", help="User-Agent header with your contact info")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        asyncio.run(_export(args))
+
+
+if __name__ == "__main__":
+    main()
+
+
+__docformat__ = "google"
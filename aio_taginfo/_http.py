@@ -0,0 +1,173 @@
+"""HTTP requests to the taginfo API, without any caching or other client features."""
+
+import urllib.parse
+from collections.abc import AsyncIterator, Callable
+
+from aio_taginfo import __version__
+from aio_taginfo.error import TaginfoCallError
+
+import aiohttp
+from aiohttp import ClientSession
+
+
+__all__ = (
+    "URL_BASE",
+    "DEFAULT_USER_AGENT",
+    "api_url",
+    "cache_key",
+    "get",
+    "stream",
+    "is_overload",
+)
+
+
+URL_BASE = "https://taginfo.openstreetmap.org/api/4/"
+DEFAULT_USER_AGENT = f"aio-taginfo/{__version__} (https://github.com/timwie/aio-taginfo)"
+
+
+def api_url(path: str, params: dict | None = None, base_url: str = URL_BASE) -> str:
+    """
+    URL of an API request.
+
+    Args:
+        path: the API path after "/api/4/"
+        params: parameters in the request query string
+        base_url: URL of the API of the server that answers the request
+    """
+    assert base_url.endswith("/api/4/"), "'base_url' must end with '/api/4/'"
+    url = urllib.parse.urljoin(base_url, path)
+    assert url.startswith(base_url), "given 'path' cannot start with a '/'"
+    if params:
+        url += "?" + urllib.parse.urlencode(params)
+    return url
+
+
+def cache_key(path: str, params: dict | None = None) -> str:
+    """
+    Key that identifies an API request, regardless of the server that answers it.
+
+    Args:
+        path: the API path after "/api/4/"
+        params: parameters in the request query string
+    """
+    path = api_url(path)[len(URL_BASE) :]
+    if not params:
+        return path
+    return path + "?" + urllib.parse.urlencode(sorted(params.items()))
+
+
+async def get(
+    path: str,
+    content_type: str,
+    session: ClientSession | None,
+    params: dict | None,
+    base_url: str = URL_BASE,
+    on_response: Callable[[aiohttp.ClientResponse, bytes], None] | None = None,
+) -> bytes:
+    """
+    Make a GET request to the taginfo API v4, and read the response body.
+
+    Args:
+        path: the API path after "/api/4/"
+        content_type: expected content type of the response
+        session: request client session, or ``None`` to use a temporary one
+        params: parameters in the request query string
+        base_url: URL of the API of the server that answers the request
+        on_response: called with every response and its body, including error responses
+
+    Raises:
+        TaginfoCallError
+    """
+    url = api_url(path, base_url=base_url)
+
+    ephemeral_session = not session
+    session = session or ClientSession()
+    headers = {"Accept": content_type}
+
+    if "User-Agent" not in session.headers:
+        headers["User-Agent"] = DEFAULT_USER_AGENT
+
+    # TODO: log "path"
+    # TODO: log "params"
+    # TODO: log "url"
+
+    try:
+        async with session.get(
+            url,
+            params=params or {},
+            headers=headers,
+            raise_for_status=on_response is None,
+        ) as response:
+            body = await response.read()
+            if on_response is not None:
+                on_response(response, body)
+                response.raise_for_status()
+            return body
+    except aiohttp.ClientError as err:
+        raise TaginfoCallError(cause=err) from err
+    finally:
+        if ephemeral_session:
+            await session.close()
+
+
+async def stream(
+    path: str,
+    content_type: str,
+    session: ClientSession | None,
+    params: dict | None,
+    chunk_size: int = 64 * 1024,
+    base_url: str = URL_BASE,
+) -> AsyncIterator[bytes]:
+    """
+    Make a GET request to the taginfo API v4, and yield the response body as it arrives.
+
+    Args:
+        path: the API path after "/api/4/"
+        content_type: expected content type of the response
+        session: request client session, or ``None`` to use a temporary one
+        params: parameters in the request query string
+        chunk_size: maximum number of bytes per chunk
+        base_url: URL of the API of the server that answers the request
+
+    Raises:
+        TaginfoCallError
+    """
+    url = api_url(path, base_url=base_url)
+
+    ephemeral_session = not session
+    session = session or ClientSession()
+    headers = {"Accept": content_type}
+
+    if "User-Agent" not in session.headers:
+        headers["User-Agent"] = DEFAULT_USER_AGENT
+
+    try:
+        async with session.get(
+            url,
+            params=params or {},
+            headers=headers,
+            raise_for_status=True,
+        ) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+    except aiohttp.ClientError as err:
+        raise TaginfoCallError(cause=err) from err
+    finally:
+        if ephemeral_session:
+            await session.close()
+
+
+def is_overload(err: TaginfoCallError) -> bool:
+    """
+    Check if a failed request indicates that the server is overloaded or unavailable.
+
+    This is the case for rate limiting (HTTP 429), server errors (HTTP 5xx) and connection
+    errors, but not for other client errors like "404 Not Found".
+    """
+    cause = err.cause
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return cause.status >= 500 or cause.status == 429
+    return True
+
+
+__docformat__ = "google"
@@ -1,17 +1,25 @@
-import urllib.parse
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from dataclasses import asdict, is_dataclass
+import asyncio
+import codecs
+import functools
+import json
+import math
+import re
+import string
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
-from typing import Annotated, Any, TypeAlias, TypeVar
+from typing import Annotated, Any, Generic, NamedTuple, TypeAlias, TypeVar, get_args, get_origin
 
-from aio_taginfo import __version__
-from aio_taginfo.api.v4 import PngResponse
-from aio_taginfo.error import TaginfoCallError, TaginfoValidationError, TaginfoValueError
+from aio_taginfo import _http
+from aio_taginfo.api.v4 import PngResponse, Response, SortOrder
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoValidationError, TaginfoValueError
+from aio_taginfo.validation import RejectedItem, current_report
 
-import aiohttp
 import pydantic
-from aiohttp import ClientResponse, ClientSession
+import pydantic_core
+from aiohttp import ClientSession
 from pydantic import BeforeValidator, HttpUrl, StringConstraints, TypeAdapter
 
 
@@ -20,13 +28,13 @@ __all__ = (
     "OptionalNonEmptyString",
     "api_params",
     "api_get_json",
+    "api_get_json_pages",
     "api_get_png",
+    "api_stream_json",
+    "api_stream_png",
+    "LocalPaging",
 )
 
-
-_URL_BASE = "https://taginfo.openstreetmap.org/api/4/"
-_DEFAULT_USER_AGENT = f"aio-taginfo/{__version__} (https://github.com/timwie/aio-taginfo)"
-
 T = TypeVar("T", bound=Any)
 
 NonEmptyString = Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
@@ -90,11 +98,76 @@ def _params_to_dict(obj: Any) -> dict:  # noqa: ANN401
     return {k: map_value(v) for k, v in asdict(obj).items() if v is not None}
 
 
+@dataclass(frozen=True)
+class LocalPaging(Generic[T]):
+    """
+    How a paginated endpoint sorts, filters and pages its results.
+
+    This lets a `aio_taginfo.client.Client` answer requests for single pages, other sort
+    orders, and substring queries from a cached response that contains all results,
+    instead of making another request.
+
+    Attributes:
+        sort_keys: for every ``sortname``, a function that returns the sort key of an item;
+                   for descending order, the same keys are used in reverse
+        query_fields: function that returns the strings of an item that ``query`` is matched
+                      against, the same way as SQL's case-insensitive ``LIKE '%query%'``
+    """
+
+    sort_keys: Mapping[str, Callable[[T], Any]]
+    query_fields: Callable[[T], Iterable[str]]
+
+    def full_params(self, params: dict) -> dict:
+        """Parameters of the request for all results, in any order."""
+        return {k: v for k, v in params.items() if k not in _VIEW_PARAMS}
+
+    def view(self, full: Response[list[T]], params: dict, url: str) -> Response[list[T]]:
+        """Sort, filter and page all results like the server would for the given parameters."""
+        items = full.data
+
+        query = params.get("query")
+        if query:
+            needle = query.translate(_ASCII_LOWER)
+            items = [
+                item
+                for item in items
+                if any(needle in s.translate(_ASCII_LOWER) for s in self.query_fields(item))
+            ]
+
+        sortname = params.get("sortname")
+        if sortname is not None:
+            reverse = params.get("sortorder") == SortOrder.DESC.value
+            items = sorted(items, key=self.sort_keys[sortname], reverse=reverse)
+
+        total = len(items)
+        page = params.get("page", 1)
+        rp = params.get("rp", 0)
+        if rp:
+            items = items[(page - 1) * rp : page * rp]
+
+        return type(full)(
+            data=items,
+            data_until=full.data_until,
+            url=url,  # type: ignore[arg-type]
+            total=total,
+            page=page if rp else None,
+            rp=rp or None,
+        )
+
+
+# parameters that only change which part of all results is returned, and in what order
+_VIEW_PARAMS = frozenset(("query", "sortname", "sortorder", "page", "rp"))
+
+# SQLite's LIKE only ignores the case of ASCII characters
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
 async def api_get_json(
     path: str,
     cls: type[T],
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
     params: dict | None = None,
+    paging: LocalPaging | None = None,
 ) -> T:
     """
     Make a GET request to the taginfo API v4, and map to the given type.
@@ -104,6 +177,7 @@ async def api_get_json(
         cls: the pydantic dataclass to map to
         session: request client session
         params: parameters in the request query string
+        paging: for paginated endpoints, lets a client derive pages from all results
 
     Raises:
         TaginfoError
@@ -111,24 +185,116 @@ async def api_get_json(
     Returns:
         an instance of ``cls``
     """
-    type_adapter = TypeAdapter(cls)
+    report = current_report()
+    if report is not None and _list_item_type(cls) is not None:
+        salvage = _salvaging_json_decoder(cls)  # type: ignore[arg-type]
+        salvaged = await _get_json(path, salvage, session, params, paging)
+        request = salvaged.request or _http.cache_key(path, params)
+        report.rejected.extend(
+            RejectedItem(path=request, index=index, item=item, error=error)
+            for index, item, error in salvaged.rejected
+        )
+        return salvaged.response
+
+    decode = _json_decoder(cls)  # type: ignore[arg-type]
+    return await _get_json(path, decode, session, params, paging)
+
+
+async def _get_json(
+    path: str,
+    decode: Callable[[bytes], Any],
+    session: ClientSession | Client | None,
+    params: dict | None,
+    paging: LocalPaging | None,
+) -> Any:  # noqa: ANN401
+    if not isinstance(session, Client):
+        payload = await _http.get(path, "application/json", session, params)
+        return decode(payload)
+
+    if paging is None or not params:
+        return await session._fetch(path, params, "application/json", decode)
+
+    # all results are cached without the parameters that only select and order them
+    full_params = paging.full_params(params)
+    full_key = _http.cache_key(path, full_params) + "#all"
+    is_full_request = not params.get("query") and not params.get("rp")
+
+    if not is_full_request and not session._is_cached(full_key):
+        return await session._fetch(path, params, "application/json", decode)
+
+    # when all results are requested again, keep the requested order
+    full_request = {**{k: v for k, v in params.items() if k != "query"}, "page": 1, "rp": 0}
+    full = await session._fetch(path, full_request, "application/json", decode, key=full_key)
+    url = _http.api_url(path, params)
+    if isinstance(full, _Salvaged):
+        # the indices of rejected items are those in all results, not in the view
+        return full._replace(
+            response=paging.view(full.response, params, url=url),
+            request=_http.cache_key(path, full_params),
+        )
+    return paging.view(full, params, url=url)
+
+
+async def api_get_json_pages(
+    path: str,
+    cls: type[Response[list[T]]],
+    rp: int,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+    params: dict | None = None,
+) -> AsyncIterator[Response[list[T]]]:
+    """
+    Request all pages of a paginated endpoint, and yield them in order.
 
-    async with _get(
-        path=path,
-        session=session,
-        params=params,
-        content_type="application/json",
-        headers=None,
-    ) as response:
-        payload = await response.read()
-        # TODO: log "validating response…"
-        return type_adapter.validate_json(payload, strict=True)
-        # TODO: log "validated."
+    The first page is requested on its own to learn the total number of results.
+    After that, up to ``concurrency`` pages are requested ahead of the one that is
+    yielded next. With ``rp=0``, all results are yielded as a single page.
+
+    Args:
+        path: the API path after "/api/4/"
+        cls: the pydantic dataclass of a single page
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+        params: parameters in the request query string, except ``page`` and ``rp``
+
+    Raises:
+        TaginfoError
+    """
+    assert rp >= 0, "'rp' cannot be negative"
+    assert concurrency > 0, "'concurrency' must be positive"
+
+    ephemeral_session = not session
+    session = session or ClientSession()
+    pending: deque[asyncio.Task[Response[list[T]]]] = deque()
+
+    def get_page(page: int) -> asyncio.Task[Response[list[T]]]:
+        page_params = {**(params or {}), "page": page, "rp": rp}
+        return asyncio.create_task(api_get_json(path, cls, session, page_params))
+
+    try:
+        first = await get_page(1)
+        yield first
+
+        n_pages = math.ceil(first.total / rp) if rp else 1
+        next_page = 2
+        while next_page <= n_pages or pending:
+            while next_page <= n_pages and len(pending) < concurrency:
+                pending.append(get_page(next_page))
+                next_page += 1
+            page = await pending.popleft()
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if ephemeral_session:
+            await session.close()
 
 
 async def api_get_png(
     path: str,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
     params: dict | None = None,
 ) -> "PngResponse":
     """
@@ -142,59 +308,321 @@ async def api_get_png(
     Raises:
         TaginfoError
     """
-    async with _get(
-        path=path,
-        params=params,
-        session=session,
-        content_type="image/png",
-        headers=None,
-    ) as response:
-        payload = await response.read()
-        # TODO: log "validating response…"
-        return PngResponse(data=payload)
-        # TODO: log "validated."
+    if isinstance(session, Client):
+        return await session._fetch(path, params, "image/png", _decode_png)
+
+    payload = await _http.get(path, "image/png", session, params)
+    return _decode_png(payload)
 
 
-@asynccontextmanager
-async def _get(
+async def api_stream_json(
     path: str,
-    content_type: str,
-    session: ClientSession | None,
-    params: dict | None,
-    headers: dict | None,
-) -> AsyncIterator[ClientResponse]:
-    url = urllib.parse.urljoin(_URL_BASE, path)
-    assert url.startswith(_URL_BASE), "given 'path' cannot start with a '/'"
+    cls: type[T],
+    session: ClientSession | Client | None = None,
+    params: dict | None = None,
+) -> AsyncIterator[T]:
+    """
+    Make a GET request to the taginfo API v4, and yield the items of its list as they arrive.
 
-    ephemeral_session = not session
-    session = session or ClientSession()
-    params = params or {}
-    headers = headers or {}
+    Each item is validated as soon as its JSON is complete, so neither the whole response body
+    nor all of its items have to be held in memory. With a `aio_taginfo.client.Client`,
+    the response is requested and cached as a whole, like `api_get_json()` does, and then
+    yielded item by item.
+
+    Args:
+        path: the API path after "/api/4/"
+        cls: the pydantic dataclass of a single item
+        session: request client session
+        params: parameters in the request query string
+
+    Raises:
+        TaginfoError
+    """
+    if isinstance(session, Client):
+        response = await api_get_json(path, Response[list[cls]], session, params)  # type: ignore[valid-type]
+        for item in response.data:
+            yield item
+        return
+
+    validate = _item_validator(cls)  # type: ignore[arg-type]
+    report = current_report()
+    splitter = _DataItems()
+    index = 0
+    async for chunk in _http.stream(path, "application/json", session, params):
+        for raw in splitter.feed(chunk):
+            try:
+                yield validate(raw)
+            except TaginfoValidationError as err:
+                if report is None:
+                    raise
+                report.rejected.append(
+                    RejectedItem(
+                        path=_http.cache_key(path, params),
+                        index=index,
+                        item=json.loads(raw),
+                        error=err.cause,
+                    )
+                )
+            index += 1
+    splitter.close()
+
+
+async def api_stream_png(
+    path: str,
+    session: ClientSession | Client | None = None,
+    params: dict | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Request a PNG image from the taginfo API v4, and yield its bytes as they arrive.
+
+    With a `aio_taginfo.client.Client`, the image is requested and cached as a whole,
+    like `api_get_png()` does, and then yielded as a single chunk.
+
+    Args:
+        path: the API path after "/api/4/"
+        session: request client session
+        params: parameters in the request query string
+
+    Raises:
+        TaginfoError
+    """
+    if isinstance(session, Client):
+        png = await api_get_png(path, session, params)
+        yield png.data
+        return
+
+    # nothing is yielded before the PNG magic bytes are checked
+    head = b""
+    checked = False
+    async for chunk in _http.stream(path, "image/png", session, params):
+        if checked:
+            yield chunk
+            continue
+        head += chunk
+        if len(head) >= _PNG_MAGIC_LENGTH:
+            checked = True
+            yield _decode_png(head).data
+    if not checked:
+        _decode_png(head)
+
+
+_PNG_MAGIC_LENGTH = 8
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON = json.JSONDecoder()
+_ENVELOPE: TypeAdapter[Response[list[Any]]] = TypeAdapter(Response[list[Any]])
+
+
+class _DataItems:
+    """
+    Splits a JSON response into the items of its ``data`` list, while its body arrives.
+
+    Every value is only decoded once it is followed by another character, or the body
+    is complete, so that numbers that are cut off between two chunks are not mistaken
+    for shorter ones. The other members of the response are collected in ``envelope``.
+    """
 
-    if "User-Agent" not in session.headers and "User-Agent" not in headers:
-        headers["User-Agent"] = _DEFAULT_USER_AGENT
+    __slots__ = ("_buffer", "_state", "_text", "envelope")
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+        self.envelope: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes, *, final: bool = False) -> list[str]:
+        """Add the next chunk of the body, and return the items that are now complete."""
+        buffer = self._buffer + self._text.decode(chunk, final=final)
+        items: list[str] = []
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                break
+            try:
+                end = self._step(buffer, pos, items, final=final)
+            except json.JSONDecodeError:
+                if final:
+                    raise _invalid(buffer[pos:]) from None
+                break  # the value is not complete yet
+            if end is None:
+                break
+            pos = end
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole body was received.
+
+        Raises:
+            TaginfoValidationError
+        """
+        self.feed(b"", final=True)
+        if self._state != "end" or self._buffer:
+            raise _invalid(self._buffer)
+        try:
+            _ENVELOPE.validate_json(json.dumps({**self.envelope, "data": []}), strict=True)
+        except pydantic.ValidationError as err:
+            raise TaginfoValidationError(cause=err) from err
+
+    def _step(self, buffer: str, pos: int, items: list[str], *, final: bool) -> int | None:
+        """Consume the next token or value at ``pos``, and return where it ends."""
+        char = buffer[pos]
+        if self._state == "start" and char == "{":
+            self._state = "members"
+            return pos + 1
+        if self._state == "items":
+            if char == "]":
+                self._state = "members"
+                return pos + 1
+            return self._item(buffer, pos, items, final=final)
+        if self._state == "members":
+            if char == "}":
+                self._state = "end"
+                return pos + 1
+            return self._member(buffer, pos, final=final)
+        raise _invalid(buffer[pos:])
+
+    def _item(self, buffer: str, pos: int, items: list[str], *, final: bool) -> int | None:
+        if buffer[pos] == ",":
+            return pos + 1
+        _, end = _JSON.raw_decode(buffer, pos)
+        if end == len(buffer) and not final:
+            return None
+        items.append(buffer[pos:end])
+        return end
+
+    def _member(self, buffer: str, pos: int, *, final: bool) -> int | None:
+        if buffer[pos] == ",":
+            return pos + 1
+        name, end = _JSON.raw_decode(buffer, pos)
+        end = _WHITESPACE.match(buffer, end).end()  # type: ignore[union-attr]
+        if end < len(buffer) and buffer[end] != ":":
+            raise _invalid(buffer[pos:])
+        start = _WHITESPACE.match(buffer, end + 1).end()  # type: ignore[union-attr]
+        if start >= len(buffer):
+            return None
+        if name == "data" and buffer[start] == "[":
+            self._state = "items"
+            return start + 1
+        value, end = _JSON.raw_decode(buffer, start)
+        if end == len(buffer) and not final:
+            return None
+        self.envelope[name] = value
+        return end
+
+
+def _invalid(text: str) -> TaginfoValidationError:
+    """An error for a response body that is not valid JSON, starting at ``text``."""
+    cause = pydantic_core.ValidationError.from_exception_data(
+        "Response",
+        [
+            {
+                "type": "json_invalid",
+                "loc": (),
+                "input": text,
+                "ctx": {"error": "unexpected content"},
+            }
+        ],
+    )
+    return TaginfoValidationError(cause=cause)
+
+
+@functools.cache
+def _item_validator(cls: type[T]) -> Callable[[str], T]:
+    type_adapter = TypeAdapter(cls)
+
+    def validate(raw: str) -> T:
+        try:
+            return type_adapter.validate_json(raw, strict=True)
+        except pydantic.ValidationError as err:
+            raise TaginfoValidationError(cause=err) from err
+
+    return validate
 
-    headers["Accept"] = content_type
 
-    # TODO: log "path"
-    # TODO: log "params"
-    # TODO: log "url"
+@functools.cache
+def _json_decoder(cls: type[T]) -> Callable[[bytes], T]:
+    type_adapter = TypeAdapter(cls)
 
+    def decode(payload: bytes) -> T:
+        # TODO: log "validating response…"
+        try:
+            return type_adapter.validate_json(payload, strict=True)
+        except pydantic.ValidationError as err:
+            raise TaginfoValidationError(cause=err) from err
+        # TODO: log "validated."
+
+    return decode
+
+
+class _Salvaged(NamedTuple):
+    """A list response without its invalid items, and the items that were left out."""
+
+    response: Any
+    rejected: tuple[tuple[int, Any, pydantic.ValidationError], ...]
+    request: str | None = None
+    """The request of all results, if the response is a view of them."""
+
+
+def _list_item_type(cls: type) -> type | None:
+    """The item type of ``Response[list[T]]``, or ``None`` for other types."""
+    if get_origin(cls) is not Response:
+        return None
+    (data_type,) = get_args(cls)
+    if get_origin(data_type) is not list:
+        return None
+    return get_args(data_type)[0]
+
+
+@functools.cache
+def _salvaging_json_decoder(cls: type[T]) -> Callable[[bytes], _Salvaged]:
+    decode = _json_decoder(cls)  # type: ignore[arg-type]
+    item_type = _list_item_type(cls)
+    assert item_type is not None
+    envelope_adapter = TypeAdapter(Response[list[Any]])
+    item_adapter: TypeAdapter[Any] = TypeAdapter(item_type)
+
+    def salvage(payload: bytes) -> _Salvaged:
+        try:
+            return _Salvaged(decode(payload), ())
+        except TaginfoValidationError:
+            pass  # the common case is cheaper to validate all at once
+
+        envelope = decode_envelope(payload)
+        valid = []
+        rejected = []
+        for index, item in enumerate(envelope.data):
+            try:
+                valid.append(item_adapter.validate_json(pydantic_core.to_json(item), strict=True))
+            except pydantic.ValidationError as err:
+                rejected.append((index, item, err))
+
+        response = cls(  # type: ignore[call-arg]
+            data=valid,
+            data_until=envelope.data_until,
+            url=envelope.url,
+            total=envelope.total,
+            page=envelope.page,
+            rp=envelope.rp,
+        )
+        return _Salvaged(response, tuple(rejected))
+
+    def decode_envelope(payload: bytes) -> Response[list[Any]]:
+        try:
+            return envelope_adapter.validate_json(payload, strict=True)
+        except pydantic.ValidationError as err:
+            raise TaginfoValidationError(cause=err) from err
+
+    return salvage
+
+
+def _decode_png(payload: bytes) -> PngResponse:
     try:
-        async with session.get(
-            url,
-            params=params,
-            headers=headers,
-            raise_for_status=True,
-        ) as response:
-            yield response
-    except aiohttp.ClientError as err:
-        raise TaginfoCallError(cause=err) from err
+        return PngResponse(data=payload)
     except pydantic.ValidationError as err:
         raise TaginfoValidationError(cause=err) from err
-    finally:
-        if ephemeral_session:
-            await session.close()
 
 
 __docformat__ = "google"
@@ -1,9 +1,16 @@
 """`/api/4/key/chronology` endpoint."""
 
 import datetime
+from collections.abc import AsyncIterator
 
 from aio_taginfo.api.v4 import Response
-from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_json,
+    api_params,
+    api_stream_json,
+)
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -12,6 +19,7 @@ from pydantic.dataclasses import dataclass
 
 __all__ = (
     "call",
+    "call_stream",
     "KeyChronology",
 )
 
@@ -41,7 +49,7 @@ class KeyChronology:
 
 async def call(
     key: str,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[KeyChronology]]:
     """
     Get chronology of key counts.
@@ -63,4 +71,28 @@ async def call(
     )
 
 
+async def call_stream(
+    key: str,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[KeyChronology]:
+    """
+    Get chronology of key counts, and yield its entries while the response arrives.
+
+    Args:
+        key: tag key
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, key=key)
+    async for entry in api_stream_json(
+        path="key/chronology",
+        cls=KeyChronology,
+        session=session,
+        params=params,
+    ):
+        yield entry
+
+
 __docformat__ = "google"
@@ -1,9 +1,16 @@
 """`/api/4/key/combinations` endpoint."""
 
 from enum import Enum
+from operator import attrgetter
 
 from aio_taginfo.api.v4 import ObjectType, Response, SortOrder
-from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.api.v4._internal import (
+    LocalPaging,
+    NonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -56,6 +63,17 @@ class _Params:
     rp: int = Field(ge=0, repr=True)
 
 
+# "filter" changes the counts themselves, so results with different filters are cached separately
+_PAGING = LocalPaging[KeyCombination](
+    sort_keys={
+        KeyCombinationSorting.TOGETHER_COUNT.value: attrgetter("together_count", "other_key"),
+        KeyCombinationSorting.OTHER_KEY.value: attrgetter("other_key"),
+        KeyCombinationSorting.FROM_FRACTION.value: attrgetter("from_fraction", "other_key"),
+    },
+    query_fields=lambda item: (item.other_key,),
+)
+
+
 async def call(
     key: str,
     query: str | None = None,
@@ -64,7 +82,7 @@ async def call(
     filter: ObjectType = ObjectType.ALL,  # noqa: A002
     page: int = 1,
     rp: int = 0,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[KeyCombination]]:
     """
     Find keys that are used together with a given key.
@@ -99,6 +117,7 @@ async def call(
         cls=Response[list[KeyCombination]],
         session=session,
         params=params,
+        paging=_PAGING,
     )
 
 
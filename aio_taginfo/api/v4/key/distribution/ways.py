@@ -1,14 +1,25 @@
 """`/api/4/key/distribution/ways` endpoint."""
 
+from collections.abc import AsyncIterator
+
 from aio_taginfo.api.v4 import PngResponse
-from aio_taginfo.api.v4._internal import NonEmptyString, api_get_png, api_params
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_png,
+    api_params,
+    api_stream_png,
+)
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
 
-__all__ = ("call",)
+__all__ = (
+    "call",
+    "call_stream",
+)
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -16,7 +27,7 @@ class _Params:
     key: NonEmptyString = Field(repr=True)
 
 
-async def call(key: str, session: ClientSession | None = None) -> PngResponse:
+async def call(key: str, session: ClientSession | Client | None = None) -> PngResponse:
     """
     Get map with distribution of this key in the database (ways only).
 
@@ -31,10 +42,32 @@ async def call(key: str, session: ClientSession | None = None) -> PngResponse:
     """
     params = api_params(_Params, key=key)
     return await api_get_png(
-        path="/api/4/key/distribution/ways",
+        path="key/distribution/ways",
         session=session,
         params=params,
     )
 
 
+async def call_stream(
+    key: str, session: ClientSession | Client | None = None
+) -> AsyncIterator[bytes]:
+    """
+    Get map with distribution of this key in the database (ways only), in chunks.
+
+    Args:
+        key: tag key
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, key=key)
+    async for chunk in api_stream_png(
+        path="key/distribution/ways",
+        session=session,
+        params=params,
+    ):
+        yield chunk
+
+
 __docformat__ = "google"
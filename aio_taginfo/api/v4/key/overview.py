@@ -2,6 +2,7 @@
 
 from aio_taginfo.api.v4 import ObjectType, PrintingDirection, Response
 from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -26,7 +27,7 @@ class _Params:
 
 async def call(
     key: str,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response["KeyOverview"]:
     """
     Show various data for given key.
@@ -2,6 +2,7 @@
 
 from aio_taginfo.api.v4 import ObjectType, Response
 from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -41,7 +42,7 @@ async def call(
     key: str,
     min_fraction: float = 0.01,
     filter: ObjectType = ObjectType.ALL,  # noqa: A002
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[PrevalentValue]]:
     """
     Get most prevalent values used with a given key.
@@ -10,6 +10,7 @@ from aio_taginfo.api.v4._internal import (
     api_get_json,
     api_params,
 )
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -83,7 +84,7 @@ async def call(
     filter: ObjectType = ObjectType.ALL,  # noqa: A002
     page: int = 1,
     rp: int = 0,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[KeyProject]]:
     """
     Get projects using a given key.
@@ -1,9 +1,16 @@
 """`/api/4/key/similar` endpoint."""
 
 from enum import Enum
+from operator import attrgetter
 
 from aio_taginfo.api.v4 import Response, SortOrder
-from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.api.v4._internal import (
+    LocalPaging,
+    NonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -51,6 +58,16 @@ class _Params:
     rp: int = Field(ge=0, repr=True)
 
 
+_PAGING = LocalPaging[SimilarKey](
+    sort_keys={
+        SimilarKeySorting.OTHER_KEY.value: attrgetter("other_key"),
+        SimilarKeySorting.COUNT_ALL.value: attrgetter("count_all", "other_key"),
+        SimilarKeySorting.SIMILARITY.value: attrgetter("similarity", "other_key"),
+    },
+    query_fields=lambda item: (item.other_key,),
+)
+
+
 async def call(
     key: str,
     query: str | None = None,
@@ -58,7 +75,7 @@ async def call(
     sortorder: SortOrder = SortOrder.ASC,
     page: int = 1,
     rp: int = 0,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[SimilarKey]]:
     """
     Find keys that are similar to a given key.
@@ -85,6 +102,7 @@ async def call(
         cls=Response[list[SimilarKey]],
         session=session,
         params=params,
+        paging=_PAGING,
     )
 
 
@@ -1 +1,196 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_keys_all."""
+"""`/api/4/keys/all` endpoint."""
+
+from collections.abc import AsyncIterator
+from enum import Enum
+from typing import Any
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_json,
+    api_get_json_pages,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field, field_validator
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_pages",
+    "KeyListItem",
+    "KeyListFilter",
+    "KeyListSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class KeyListItem:
+    """
+    A key and its usage statistics.
+
+    Attributes:
+        key: Tag key
+        count_all: Number of objects in the OSM database with this key
+        count_all_fraction: Number of objects in relation to all objects
+        count_nodes: Number of nodes in the OSM database with this key
+        count_nodes_fraction: Number of nodes in relation to all tagged nodes
+        count_ways: Number of ways in the OSM database with this key
+        count_ways_fraction: Number of ways in relation to all ways
+        count_relations: Number of relations in the OSM database with this key
+        count_relations_fraction: Number of relations in relation to all relations
+        values_all: Number of different values for this key
+        users_all: Number of users owning objects with this key
+        in_wiki: ``True`` if there is at least one wiki page for this key
+        projects: Number of projects mentioning this key
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    count_all: int = Field(ge=0, repr=True)
+    count_all_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_nodes: int = Field(ge=0, repr=True)
+    count_nodes_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_ways: int = Field(ge=0, repr=True)
+    count_ways_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_relations: int = Field(ge=0, repr=True)
+    count_relations_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    values_all: int = Field(ge=0, repr=False)
+    users_all: int = Field(ge=0, repr=False)
+    in_wiki: bool = Field(repr=True)
+    projects: int = Field(default=0, ge=0, repr=False)
+
+    @field_validator("in_wiki", mode="before")
+    def _convert_in_wiki(cls, input_value: Any) -> bool:  # noqa: ANN401, N805
+        if input_value == 0:
+            return False
+        if input_value == 1:
+            return True
+        return input_value
+
+
+class KeyListFilter(str, Enum):
+    """Filter options for the list of all keys."""
+
+    IN_WIKI = "in_wiki"
+    NOT_IN_DB = "not_in_db"
+
+
+class KeyListSorting(str, Enum):
+    """Sort options for the list of all keys."""
+
+    KEY = "key"
+    COUNT_ALL = "count_all"
+    COUNT_NODES = "count_nodes"
+    COUNT_WAYS = "count_ways"
+    COUNT_RELATIONS = "count_relations"
+    VALUES_ALL = "values_all"
+    USERS_ALL = "users_all"
+    IN_WIKI = "in_wiki"
+    LENGTH = "length"
+    PROJECTS = "projects"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString | None = Field(repr=True)
+    filter: KeyListFilter | None = Field(repr=True)
+    sortname: KeyListSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str | None = None,
+    filter: KeyListFilter | None = None,  # noqa: A002
+    sortname: KeyListSorting = KeyListSorting.KEY,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[KeyListItem]]:
+    """
+    Get list of all keys.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_keys_all
+
+    Args:
+        query: only show keys matching this query (substring match)
+        filter: only show keys that have a wiki page, or that are not in the database
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        filter=filter,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="keys/all",
+        cls=Response[list[KeyListItem]],
+        session=session,
+        params=params,
+    )
+
+
+async def call_pages(
+    query: str | None = None,
+    filter: KeyListFilter | None = None,  # noqa: A002
+    sortname: KeyListSorting = KeyListSorting.KEY,
+    sortorder: SortOrder = SortOrder.ASC,
+    rp: int = 1000,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[Response[list[KeyListItem]]]:
+    """
+    Get list of all keys, one page at a time.
+
+    This avoids holding one huge response in memory, and lets you process
+    the first pages while the next ones are still being requested.
+
+    Args:
+        query: only show keys matching this query (substring match)
+        filter: only show keys that have a wiki page, or that are not in the database
+        sortname: what field to sort by
+        sortorder: sort order
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        filter=filter,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=1,
+        rp=rp,
+    )
+    async for page in api_get_json_pages(
+        path="keys/all",
+        cls=Response[list[KeyListItem]],
+        rp=params.pop("rp"),
+        concurrency=concurrency,
+        session=session,
+        params={k: v for k, v in params.items() if k != "page"},
+    ):
+        yield page
+
+
+__docformat__ = "google"
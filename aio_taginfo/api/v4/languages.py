@@ -1 +1,90 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_languages."""
+"""`/api/4/languages` endpoint."""
+
+import datetime
+
+from aio_taginfo.api.v4._internal import OptionalNonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "Language",
+    "LanguageList",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class Language:
+    """
+    A subtag from the IANA language subtag registry.
+
+    Attributes:
+        type: Type of the subtag, like ``"Language"``, ``"Script"``, ``"Region"`` or ``"Variant"``
+        subtag: The subtag itself
+        description: Description of the subtag
+        added: Date at which the subtag was added to the registry
+        notes: Notes about the subtag
+    """
+
+    type: str = Field(min_length=1, repr=True)
+    subtag: str = Field(min_length=1, repr=True)
+    description: str = Field(repr=True)
+    added: datetime.date = Field(repr=False)
+    notes: OptionalNonEmptyString = Field(default=None, repr=False)
+
+
+@dataclass(kw_only=True, frozen=True)
+class LanguageList:
+    """
+    Response of the ``languages`` endpoint, which unlike others does not include its URL.
+
+    Attributes:
+        data: the subtags on this page
+        total: total number of subtags
+        page: the page number, if a page was requested
+        rp: the number of results per page, if a page was requested
+    """
+
+    data: list[Language] = Field(repr=False)
+    total: int = Field(ge=0, repr=True)
+    page: int | None = Field(default=None, gt=0, repr=True)
+    rp: int | None = Field(default=None, gt=0, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> LanguageList:
+    """
+    List languages taginfo knows about, from the IANA language subtag registry.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_languages
+
+    Args:
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="languages",
+        cls=LanguageList,
+        session=session,
+        params=api_params(_Params, page=page, rp=rp),
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,41 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_project_icon."""
+"""`/api/4/project/icon` endpoint."""
+
+from aio_taginfo.api.v4 import PngResponse
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_png, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = ("call",)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    project: NonEmptyString = Field(repr=True)
+
+
+async def call(project: str, session: ClientSession | Client | None = None) -> PngResponse:
+    """
+    Get the icon of a project.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_project_icon
+
+    Args:
+        project: project ID
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, project=project)
+    return await api_get_png(
+        path="project/icon",
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,166 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_project_tags."""
+"""`/api/4/project/tags` endpoint."""
+
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalHttpUrl,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_get_json_pages,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_pages",
+    "ProjectEntry",
+    "ProjectEntrySorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProjectEntry:
+    """
+    A key or tag that a project uses, see https://wiki.openstreetmap.org/wiki/Taginfo/Projects.
+
+    Attributes:
+        key: Key
+        value: Value, or ``None`` if the project uses the key with any value
+        on_node: For nodes?
+        on_way: For ways?
+        on_relation: For relations?
+        on_area: For areas?
+        description: Description
+        doc_url: Documentation URL
+        icon_url: Icon URL
+        count_all: Number of objects in the OSM database with this key or tag
+        in_wiki: ``True`` if there is at least one wiki page for this key or tag
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: OptionalNonEmptyString = Field(repr=True)
+    on_node: bool = Field(repr=False)
+    on_way: bool = Field(repr=False)
+    on_relation: bool = Field(repr=False)
+    on_area: bool = Field(repr=False)
+    description: OptionalNonEmptyString = Field(repr=False)
+    doc_url: OptionalHttpUrl = Field(repr=False)
+    icon_url: OptionalHttpUrl = Field(repr=False)
+    count_all: int = Field(ge=0, repr=True)
+    in_wiki: bool = Field(repr=False)
+
+
+class ProjectEntrySorting(str, Enum):
+    """Sort options for the keys and tags of a project."""
+
+    TAG = "tag"
+    COUNT_ALL = "count_all"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    project: NonEmptyString = Field(repr=True)
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: ProjectEntrySorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    project: str,
+    query: str | None = None,
+    sortname: ProjectEntrySorting = ProjectEntrySorting.TAG,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[ProjectEntry]]:
+    """
+    Get list of all keys and tags used by a project.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_project_tags
+
+    Args:
+        project: project ID
+        query: only show results where the key or value matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        project=project,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="project/tags",
+        cls=Response[list[ProjectEntry]],
+        session=session,
+        params=params,
+    )
+
+
+async def call_pages(
+    project: str,
+    query: str | None = None,
+    sortname: ProjectEntrySorting = ProjectEntrySorting.TAG,
+    sortorder: SortOrder = SortOrder.ASC,
+    rp: int = 1000,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[Response[list[ProjectEntry]]]:
+    """
+    Get list of all keys and tags used by a project, one page at a time.
+
+    Args:
+        project: project ID
+        query: only show results where the key or value matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        project=project,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=1,
+        rp=rp,
+    )
+    async for page in api_get_json_pages(
+        path="project/tags",
+        cls=Response[list[ProjectEntry]],
+        rp=params.pop("rp"),
+        concurrency=concurrency,
+        session=session,
+        params={k: v for k, v in params.items() if k != "page"},
+    ):
+        yield page
+
+
+__docformat__ = "google"
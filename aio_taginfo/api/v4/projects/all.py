@@ -1 +1,112 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_all."""
+"""`/api/4/projects/all` endpoint."""
+
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalHttpUrl,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "Project",
+    "ProjectSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class Project:
+    """
+    A project that uses OSM tags, see https://wiki.openstreetmap.org/wiki/Taginfo/Projects.
+
+    Attributes:
+        id: Project ID
+        name: Project name
+        project_url: Project URL
+        icon_url: Project icon URL
+        doc_url: Documentation URL
+        description: Project description
+        key_entries: Number of entries for keys
+        tag_entries: Number of entries for tags
+        unique_keys: Number of different keys
+        unique_tags: Number of different tags
+    """
+
+    id: str = Field(min_length=1, repr=True)
+    name: str = Field(min_length=1, repr=True)
+    project_url: OptionalHttpUrl = Field(repr=False)
+    icon_url: OptionalHttpUrl = Field(repr=False)
+    doc_url: OptionalHttpUrl = Field(repr=False)
+    description: OptionalNonEmptyString = Field(repr=False)
+    key_entries: int = Field(ge=0, repr=False)
+    tag_entries: int = Field(ge=0, repr=False)
+    unique_keys: int = Field(ge=0, repr=True)
+    unique_tags: int = Field(ge=0, repr=True)
+
+
+class ProjectSorting(str, Enum):
+    """Sort options for the list of all projects."""
+
+    NAME = "name"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: ProjectSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str | None = None,
+    sortname: ProjectSorting = ProjectSorting.NAME,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[Project]]:
+    """
+    Get list of all projects using OSM tags.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_all
+
+    Args:
+        query: only show projects matching this query (substring match on id, name and description)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="projects/all",
+        cls=Response[list[Project]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
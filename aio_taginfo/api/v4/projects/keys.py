@@ -1 +1,98 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_keys."""
+"""`/api/4/projects/keys` endpoint."""
+
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "ProjectKey",
+    "ProjectKeySorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProjectKey:
+    """
+    A key that is used by at least one project.
+
+    Attributes:
+        key: Tag key
+        projects: Number of projects using this key
+        in_wiki: Wiki status of this key as reported by taginfo; zero if there is no wiki page
+        count_all: Number of objects in the OSM database with this key
+        count_all_fraction: Number of objects in relation to all objects
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    projects: int = Field(ge=0, repr=True)
+    in_wiki: int = Field(ge=0, repr=False)
+    count_all: int = Field(ge=0, repr=True)
+    count_all_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+
+
+class ProjectKeySorting(str, Enum):
+    """Sort options for keys used by projects."""
+
+    KEY = "key"
+    PROJECTS = "projects"
+    COUNT_ALL = "count_all"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: ProjectKeySorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str | None = None,
+    sortname: ProjectKeySorting = ProjectKeySorting.KEY,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[ProjectKey]]:
+    """
+    Get list of all keys used by at least one project.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_keys
+
+    Args:
+        query: only show keys matching this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="projects/keys",
+        cls=Response[list[ProjectKey]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,149 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_tags."""
+"""`/api/4/projects/tags` endpoint."""
+
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_get_json_pages,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_pages",
+    "ProjectTag",
+    "ProjectTagSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProjectTag:
+    """
+    A tag that is used by at least one project.
+
+    Attributes:
+        key: Tag key
+        value: Tag value
+        projects: Number of projects using this tag
+        in_wiki: Wiki status of this tag as reported by taginfo; zero if there is no wiki page
+        count_all: Number of objects in the OSM database with this tag
+        count_all_fraction: Number of objects in relation to all objects
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: OptionalNonEmptyString = Field(repr=True)
+    projects: int = Field(ge=0, repr=True)
+    in_wiki: int = Field(ge=0, repr=False)
+    count_all: int = Field(ge=0, repr=True)
+    count_all_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+
+
+class ProjectTagSorting(str, Enum):
+    """Sort options for tags used by projects."""
+
+    TAG = "tag"
+    PROJECTS = "projects"
+    COUNT_ALL = "count_all"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: ProjectTagSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str | None = None,
+    sortname: ProjectTagSorting = ProjectTagSorting.TAG,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[ProjectTag]]:
+    """
+    Get list of all tags used by at least one project.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_projects_tags
+
+    Args:
+        query: only show tags where the key or value matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="projects/tags",
+        cls=Response[list[ProjectTag]],
+        session=session,
+        params=params,
+    )
+
+
+async def call_pages(
+    query: str | None = None,
+    sortname: ProjectTagSorting = ProjectTagSorting.TAG,
+    sortorder: SortOrder = SortOrder.ASC,
+    rp: int = 1000,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[Response[list[ProjectTag]]]:
+    """
+    Get list of all tags used by at least one project, one page at a time.
+
+    Args:
+        query: only show tags where the key or value matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=1,
+        rp=rp,
+    )
+    async for page in api_get_json_pages(
+        path="projects/tags",
+        cls=Response[list[ProjectTag]],
+        rp=params.pop("rp"),
+        concurrency=concurrency,
+        session=session,
+        params={k: v for k, v in params.items() if k != "page"},
+    ):
+        yield page
+
+
+__docformat__ = "google"
@@ -10,6 +10,7 @@ from aio_taginfo.api.v4._internal import (
     api_get_json,
     api_params,
 )
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -70,7 +71,7 @@ async def call(
     sortorder: SortOrder = SortOrder.ASC,
     page: int = 1,
     rp: int = 0,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[RelationProject]]:
     """
     Get projects using a given relation type.
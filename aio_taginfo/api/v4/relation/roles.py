@@ -1 +1,117 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relation_roles."""
+"""`/api/4/relation/roles` endpoint."""
+
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "RelationRole",
+    "RelationRoleSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RelationRole:
+    """
+    A member role in relations of a given type, and its usage statistics.
+
+    Attributes:
+        rtype: Relation type
+        role: Relation member role
+        count_all_members: Number of members with this role
+        count_all_members_fraction: Number of members with this role in relation to all members
+        count_node_members: Number of node members with this role
+        count_node_members_fraction: Number of node members with this role
+                                     in relation to all node members
+        count_way_members: Number of way members with this role
+        count_way_members_fraction: Number of way members with this role
+                                    in relation to all way members
+        count_relation_members: Number of relation members with this role
+        count_relation_members_fraction: Number of relation members with this role
+                                         in relation to all relation members
+    """
+
+    rtype: str = Field(min_length=1, repr=True)
+    role: str = Field(repr=True)
+    count_all_members: int = Field(ge=0, repr=True)
+    count_all_members_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_node_members: int = Field(ge=0, repr=False)
+    count_node_members_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_way_members: int = Field(ge=0, repr=False)
+    count_way_members_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_relation_members: int = Field(ge=0, repr=False)
+    count_relation_members_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+
+
+class RelationRoleSorting(str, Enum):
+    """Sort options for relation roles."""
+
+    ROLE = "role"
+    COUNT_ALL_MEMBERS = "count_all_members"
+    COUNT_NODE_MEMBERS = "count_node_members"
+    COUNT_WAY_MEMBERS = "count_way_members"
+    COUNT_RELATION_MEMBERS = "count_relation_members"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    rtype: NonEmptyString = Field(repr=True)
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: RelationRoleSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    rtype: str,
+    query: str | None = None,
+    sortname: RelationRoleSorting = RelationRoleSorting.ROLE,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[RelationRole]]:
+    """
+    Get member role statistics for a relation type.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relation_roles
+
+    Args:
+        rtype: relation type
+        query: only show results where the role matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        rtype=rtype,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="relation/roles",
+        cls=Response[list[RelationRole]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,61 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relation_stats."""
+"""`/api/4/relation/stats` endpoint."""
+
+from aio_taginfo.api.v4 import ObjectType, Response
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "RelationStats",
+    "call",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RelationStats:
+    """
+    Database statistics for the members of relations of a given type.
+
+    Attributes:
+        type: Member type.
+        count: Number of members with this type.
+    """
+
+    type: ObjectType = Field(repr=True)
+    count: int = Field(ge=0, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    rtype: NonEmptyString = Field(repr=True)
+
+
+async def call(
+    rtype: str,
+    session: ClientSession | Client | None = None,
+) -> Response[list[RelationStats]]:
+    """
+    Show some database statistics for given relation type.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relation_stats
+
+    Args:
+        rtype: relation type
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="relation/stats",
+        cls=Response[list[RelationStats]],
+        session=session,
+        params=api_params(_Params, rtype=rtype),
+    )
+
+
+__docformat__ = "google"
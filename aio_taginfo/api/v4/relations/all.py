@@ -1 +1,160 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relations_all."""
+"""`/api/4/relations/all` endpoint."""
+
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_json,
+    api_get_json_pages,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_pages",
+    "PrevalentRole",
+    "RelationListItem",
+    "RelationListSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class PrevalentRole:
+    """
+    A role that is used often in relations of some type.
+
+    Attributes:
+        role: Relation member role
+        count: Number of members with this role
+        fraction: Number of members with this role in relation to all members
+    """
+
+    role: str = Field(repr=True)
+    count: int = Field(ge=0, repr=True)
+    fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RelationListItem:
+    """
+    A relation type and its usage statistics.
+
+    Attributes:
+        rtype: Relation type
+        count: Number of relations with this type
+        count_fraction: Number of relations with this type in relation to all relations
+        prevalent_roles: Roles that are used often, or ``None`` if there are none
+    """
+
+    rtype: str = Field(repr=True)
+    count: int = Field(ge=0, repr=True)
+    count_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    prevalent_roles: list[PrevalentRole] | None = Field(repr=False)
+
+
+class RelationListSorting(str, Enum):
+    """Sort options for the list of all relation types."""
+
+    RTYPE = "rtype"
+    COUNT = "count"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: RelationListSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str | None = None,
+    sortname: RelationListSorting = RelationListSorting.RTYPE,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[RelationListItem]]:
+    """
+    Get list of all relation types.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_relations_all
+
+    Args:
+        query: only show relation types matching this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="relations/all",
+        cls=Response[list[RelationListItem]],
+        session=session,
+        params=params,
+    )
+
+
+async def call_pages(
+    query: str | None = None,
+    sortname: RelationListSorting = RelationListSorting.RTYPE,
+    sortorder: SortOrder = SortOrder.ASC,
+    rp: int = 1000,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[Response[list[RelationListItem]]]:
+    """
+    Get list of all relation types, one page at a time.
+
+    Args:
+        query: only show relation types matching this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=1,
+        rp=rp,
+    )
+    async for page in api_get_json_pages(
+        path="relations/all",
+        cls=Response[list[RelationListItem]],
+        rp=params.pop("rp"),
+        concurrency=concurrency,
+        session=session,
+        params={k: v for k, v in params.items() if k != "page"},
+    ):
+        yield page
+
+
+__docformat__ = "google"
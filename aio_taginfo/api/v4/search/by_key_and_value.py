@@ -1 +1,70 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_key_and_value."""
+"""`/api/4/search/by_key_and_value` endpoint."""
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "TagMatch",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagMatch:
+    """
+    A tag whose key and value match a search.
+
+    Attributes:
+        key: Key
+        value: Value
+        count_all: Number of objects in the OSM database with this tag
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: str = Field(repr=True)
+    count_all: int = Field(ge=0, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[TagMatch]]:
+    """
+    Search for tags by key and/or value.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_key_and_value
+
+    Args:
+        query: search query of the form ``key=value``; keys and values are matched as substrings
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, query=query, page=page, rp=rp)
+    return await api_get_json(
+        path="search/by_key_and_value",
+        cls=Response[list[TagMatch]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,73 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_keyword."""
+"""`/api/4/search/by_keyword` endpoint."""
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "KeywordMatch",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class KeywordMatch:
+    """
+    A key or tag that is described with a matching keyword in the OSM wiki.
+
+    Attributes:
+        key: Key
+        value: Value
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: OptionalNonEmptyString = Field(repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[KeywordMatch]]:
+    """
+    Search for keys and tags by keyword in the OSM wiki.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_keyword
+
+    Args:
+        query: keyword to search for
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, query=query, page=page, rp=rp)
+    return await api_get_json(
+        path="search/by_keyword",
+        cls=Response[list[KeywordMatch]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
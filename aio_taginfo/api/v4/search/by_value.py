@@ -1 +1,70 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_value."""
+"""`/api/4/search/by_value` endpoint."""
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "ValueMatch",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ValueMatch:
+    """
+    A tag whose value matches a search.
+
+    Attributes:
+        key: Key
+        value: Value
+        count_all: Number of objects in the OSM database with this tag
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: str = Field(repr=True)
+    count_all: int = Field(ge=0, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    query: NonEmptyString = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    query: str,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[ValueMatch]]:
+    """
+    Search for tags by value.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_search_by_value
+
+    Args:
+        query: value to search for (substring match)
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, query=query, page=page, rp=rp)
+    return await api_get_json(
+        path="search/by_value",
+        cls=Response[list[ValueMatch]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
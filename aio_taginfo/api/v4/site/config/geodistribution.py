@@ -1,6 +1,7 @@
 """`/api/4/site/geodistribution` endpoint."""
 
 from aio_taginfo.api.v4._internal import api_get_json
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field
@@ -13,7 +14,7 @@ __all__ = (
 )
 
 
-async def call(session: ClientSession | None = None) -> "SiteConfigGeodistribution":
+async def call(session: ClientSession | Client | None = None) -> "SiteConfigGeodistribution":
     """
     Get information about the background map for distribution charts.
 
@@ -26,7 +27,7 @@ async def call(session: ClientSession | None = None) -> "SiteConfigGeodistributi
         TaginfoError
     """
     return await api_get_json(
-        path="/api/4/site/config/geodistribution",
+        path="site/config/geodistribution",
         cls=SiteConfigGeodistribution,
         session=session,
     )
@@ -1 +1,58 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_site_info."""
+"""`/api/4/site/info` endpoint."""
+
+from aio_taginfo.api.v4._internal import api_get_json
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field, HttpUrl
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "SiteInfo",
+)
+
+
+async def call(session: ClientSession | Client | None = None) -> "SiteInfo":
+    """
+    Get information about this taginfo site.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_site_info
+
+    Args:
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="site/info",
+        cls=SiteInfo,
+        session=session,
+    )
+
+
+@dataclass(kw_only=True, frozen=True)
+class SiteInfo:
+    """
+    Information about a taginfo site.
+
+    Attributes:
+        url: URL of the site
+        name: Name of the site
+        description: Description of the site
+        icon: Path of the site's icon, relative to its URL
+        contact: Contact information of the site's maintainer
+        area: Name of the area covered by the site's data
+    """
+
+    url: HttpUrl = Field(repr=True)
+    name: str = Field(min_length=1, repr=True)
+    description: str = Field(repr=False)
+    icon: str = Field(repr=False)
+    contact: str = Field(repr=False)
+    area: str = Field(repr=True)
+
+
+__docformat__ = "google"
@@ -1 +1,67 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_site_sources."""
+"""`/api/4/site/sources` endpoint."""
+
+from datetime import UTC, datetime
+from typing import Annotated
+
+from aio_taginfo.api.v4._internal import api_get_json
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import AfterValidator, Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "SiteSource",
+)
+
+
+async def call(session: ClientSession | Client | None = None) -> list["SiteSource"]:
+    """
+    Get information about the data sources of this taginfo site.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_site_sources
+
+    Args:
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="site/sources",
+        cls=list[SiteSource],
+        session=session,
+    )
+
+
+def _assume_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+# unlike "data_until" of other responses, these dates do not include a timezone
+_UtcDatetime = Annotated[datetime, AfterValidator(_assume_utc)]
+
+
+@dataclass(kw_only=True, frozen=True)
+class SiteSource:
+    """
+    A data source of a taginfo site, and its last update.
+
+    Attributes:
+        id: Source ID, like ``"db"`` or ``"wiki"``
+        name: Name of the source
+        data_until: All changes in the source until this date (UTC) are reflected
+        update_start: Time (UTC) at which the last update of this source started
+        update_end: Time (UTC) at which the last update of this source ended
+    """
+
+    id: str = Field(min_length=1, repr=True)
+    name: str = Field(min_length=1, repr=False)
+    data_until: _UtcDatetime = Field(repr=True)
+    update_start: _UtcDatetime = Field(repr=False)
+    update_end: _UtcDatetime = Field(repr=False)
+
+
+__docformat__ = "google"
@@ -1 +1,106 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_chronology."""
+"""`/api/4/tag/chronology` endpoint."""
+
+import datetime
+from collections.abc import AsyncIterator
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_json,
+    api_params,
+    api_stream_json,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_stream",
+    "TagChronology",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagChronology:
+    """
+    Chronology of tag counts relative to a previous entry.
+
+    Attributes:
+        date: Date of tag counts
+        nodes: Difference in number of nodes with this tag, relative to the previous entry
+        ways: Difference in number of ways with this tag, relative to the previous entry
+        relations: Difference in number of relations with this tag, relative to the previous entry
+    """
+
+    date: datetime.date = Field(repr=True)
+    nodes: int = Field(repr=True)
+    ways: int = Field(repr=True)
+    relations: int = Field(repr=True)
+
+
+async def call(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> Response[list[TagChronology]]:
+    """
+    Get chronology of tag counts.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_chronology
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="tag/chronology",
+        cls=Response[list[TagChronology]],
+        session=session,
+        params=api_params(_Params, key=key, value=value),
+    )
+
+
+async def call_stream(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[TagChronology]:
+    """
+    Get chronology of tag counts, and yield its entries while the response arrives.
+
+    The chronology of a common tag has an entry for almost every day since 2007.
+    Streaming it avoids holding the whole response body in memory at once.
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, key=key, value=value)
+    async for entry in api_stream_json(
+        path="tag/chronology",
+        cls=TagChronology,
+        session=session,
+        params=params,
+    ):
+        yield entry
+
+
+__docformat__ = "google"
@@ -1 +1,134 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_combinations."""
+"""`/api/4/tag/combinations` endpoint."""
+
+from enum import Enum
+from operator import attrgetter
+
+from aio_taginfo.api.v4 import ObjectType, Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    LocalPaging,
+    NonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "TagCombination",
+    "TagCombinationSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagCombination:
+    """
+    Combination statistics for a given tag with another key or tag.
+
+    Attributes:
+        other_key: Other key.
+        other_value: Other value, or an empty string if this is a combination with any
+                     value of the other key.
+        together_count: Number of objects that have both.
+        to_fraction: Fraction of objects with this tag that also have the other key or tag.
+        from_fraction: Fraction of objects with the other key or tag that also have this tag.
+    """
+
+    other_key: str = Field(repr=True)
+    other_value: str = Field(repr=True)
+    together_count: int = Field(ge=0, repr=True)
+    to_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=True)
+    from_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=True)
+
+
+class TagCombinationSorting(str, Enum):
+    """Sort options for tag combination."""
+
+    TOGETHER_COUNT = "together_count"
+    OTHER_TAG = "other_tag"
+    FROM_FRACTION = "from_fraction"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+    query: NonEmptyString | None = Field(repr=True)
+    sortname: TagCombinationSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    filter: ObjectType = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+# "filter" changes the counts themselves, so results with different filters are cached separately
+_PAGING = LocalPaging[TagCombination](
+    sort_keys={
+        TagCombinationSorting.TOGETHER_COUNT.value: attrgetter(
+            "together_count", "other_key", "other_value"
+        ),
+        TagCombinationSorting.OTHER_TAG.value: attrgetter("other_key", "other_value"),
+        TagCombinationSorting.FROM_FRACTION.value: attrgetter(
+            "from_fraction", "other_key", "other_value"
+        ),
+    },
+    query_fields=lambda item: (item.other_key, item.other_value),
+)
+
+
+async def call(
+    key: str,
+    value: str,
+    query: str | None = None,
+    sortname: TagCombinationSorting = TagCombinationSorting.TOGETHER_COUNT,
+    sortorder: SortOrder = SortOrder.DESC,
+    filter: ObjectType = ObjectType.ALL,  # noqa: A002
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[TagCombination]]:
+    """
+    Find keys and tags that are used together with a given tag.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_combinations
+
+    Args:
+        key: tag key
+        value: tag value
+        query: only show results where the ``other_key`` or ``other_value``
+               matches this query (substring match)
+        sortname: what field to sort by
+        sortorder: sort order
+        filter: can be used to filter only values on tags used on nodes/ways/relations
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        key=key,
+        value=value,
+        query=query,
+        sortname=sortname,
+        sortorder=sortorder,
+        filter=filter,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="tag/combinations",
+        cls=Response[list[TagCombination]],
+        session=session,
+        params=params,
+        paging=_PAGING,
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,90 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_distribution_ways."""
+"""`/api/4/tag/distribution/ways` endpoint."""
+
+from collections.abc import AsyncIterator
+
+from aio_taginfo.api.v4 import PngResponse
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    api_get_png,
+    api_params,
+    api_stream_png,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_stream",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+
+
+async def call(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> PngResponse:
+    """
+    Get map with distribution of this tag in the database (ways only).
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_distribution_ways
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, key=key, value=value)
+    return await api_get_png(
+        path="tag/distribution/ways",
+        session=session,
+        params=params,
+    )
+
+
+async def call_stream(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Get map with distribution of this tag in the database (ways only), in chunks.
+
+    The chunks can be written to a file or forwarded while the image is downloaded:
+
+    ```python
+    with open("map.png", "wb") as f:
+        async for chunk in call_stream("highway", "residential"):
+            f.write(chunk)
+    ```
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, key=key, value=value)
+    async for chunk in api_stream_png(
+        path="tag/distribution/ways",
+        session=session,
+        params=params,
+    ):
+        yield chunk
+
+
+__docformat__ = "google"
@@ -1 +1,94 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_overview."""
+"""`/api/4/tag/overview` endpoint."""
+
+from aio_taginfo.api.v4 import ObjectType, Response
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.api.v4.key.overview import KeyDescription, KeyWikiPage
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "TagOverview",
+    "TagObjectCount",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+
+
+async def call(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> Response["TagOverview"]:
+    """
+    Show various data for given tag.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_overview
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="tag/overview",
+        cls=Response[TagOverview],
+        session=session,
+        params=api_params(_Params, key=key, value=value),
+    )
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagObjectCount:
+    """
+    Usage statistic of a given tag for a given type of object.
+
+    Attributes:
+        type: Object type
+        count: Number of objects with this type and tag
+        count_fraction: Number of objects in relation to all objects
+    """
+
+    type: ObjectType = Field(repr=True)
+    count: int = Field(ge=0, repr=True)
+    count_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagOverview:
+    """
+    Various data for a given tag.
+
+    Descriptions and wiki pages have the same structure as those of keys.
+
+    Attributes:
+        key: The tag key that was requested
+        value: The tag value that was requested
+        counts: Objects counts
+        description: Description of this tag (hash key is language code)
+        wiki_pages: Language codes for which wiki pages about this tag are available
+        has_map: Is a map with the geographical distribution of this tag available?
+        projects: Number of projects mentioning this tag
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: str = Field(min_length=1, repr=True)
+    counts: list[TagObjectCount] = Field(repr=False)
+    description: dict[str, KeyDescription] = Field(repr=False)
+    wiki_pages: list[KeyWikiPage] = Field(repr=False)
+    has_map: bool = Field(repr=False)
+    projects: int = Field(default=0, ge=0, repr=False)
+
+
+__docformat__ = "google"
@@ -1 +1,66 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_stats."""
+"""`/api/4/tag/stats` endpoint."""
+
+from aio_taginfo.api.v4 import ObjectType, Response
+from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "TagStats",
+    "call",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagStats:
+    """
+    Database statistics for given tag.
+
+    Attributes:
+        type: Object type.
+        count: Number of objects with this type and tag.
+        count_fraction: Number of objects in relation to all objects.
+    """
+
+    type: ObjectType = Field(repr=True)
+    count: int = Field(ge=0, repr=True)
+    count_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+
+
+async def call(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> Response[list[TagStats]]:
+    """
+    Show some database statistics for given tag.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_stats
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="tag/stats",
+        cls=Response[list[TagStats]],
+        session=session,
+        params=api_params(_Params, key=key, value=value),
+    )
+
+
+__docformat__ = "google"
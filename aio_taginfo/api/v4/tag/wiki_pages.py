@@ -1 +1,122 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_wiki_pages."""
+"""`/api/4/tag/wiki_pages` endpoint."""
+
+from aio_taginfo.api.v4 import PrintingDirection, Response
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalHttpUrl,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "WikiPage",
+    "WikiPageImage",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikiPageImage:
+    """
+    Image on a wiki page.
+
+    Attributes:
+        title: Title of the image file on the wiki, like ``"File:Residential.jpg"``
+        width: Width of the image in pixels
+        height: Height of the image in pixels
+        mime: MIME type of the image
+        image_url: URL of the image
+        thumb_url_prefix: Start of the URL of a thumbnail; add the width in pixels
+                          and ``thumb_url_suffix`` to get the full URL
+        thumb_url_suffix: End of the URL of a thumbnail
+    """
+
+    title: OptionalNonEmptyString = Field(default=None, repr=True)
+    width: int | None = Field(default=None, ge=0, repr=False)
+    height: int | None = Field(default=None, ge=0, repr=False)
+    mime: OptionalNonEmptyString = Field(default=None, repr=False)
+    image_url: OptionalHttpUrl = Field(default=None, repr=False)
+    thumb_url_prefix: OptionalHttpUrl = Field(default=None, repr=False)
+    thumb_url_suffix: OptionalNonEmptyString = Field(default=None, repr=False)
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikiPage:
+    """
+    Wiki page about a given tag in some language.
+
+    Attributes:
+        lang: Language code
+        dir: Printing direction for this language
+        language: Native name of this language
+        language_en: English name of this language
+        title: Title of the wiki page
+        description: Short description of the tag from the infobox on the page
+        image: Image from the infobox on the page
+        on_node: Should this tag be used on nodes?
+        on_way: Should this tag be used on ways?
+        on_area: Should this tag be used on areas?
+        on_relation: Should this tag be used on relations?
+        tags_implies: Keys and tags that are implied by this tag
+        tags_combination: Keys and tags that are often used together with this tag
+        tags_linked: Keys and tags that are mentioned on the page
+        status: Approval status of the tag, like ``"approved"`` or ``"de facto"``
+    """
+
+    lang: str = Field(min_length=2, repr=True)
+    dir: PrintingDirection = Field(repr=False)
+    language: str = Field(min_length=1, repr=False)
+    language_en: str = Field(min_length=1, repr=False)
+    title: str = Field(min_length=1, repr=True)
+    description: OptionalNonEmptyString = Field(default=None, repr=False)
+    image: WikiPageImage | None = Field(default=None, repr=False)
+    on_node: bool = Field(repr=False)
+    on_way: bool = Field(repr=False)
+    on_area: bool = Field(repr=False)
+    on_relation: bool = Field(repr=False)
+    tags_implies: list[str] = Field(default_factory=list, repr=False)
+    tags_combination: list[str] = Field(default_factory=list, repr=False)
+    tags_linked: list[str] = Field(default_factory=list, repr=False)
+    status: OptionalNonEmptyString = Field(default=None, repr=False)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    key: NonEmptyString = Field(repr=True)
+    value: NonEmptyString = Field(repr=True)
+
+
+async def call(
+    key: str,
+    value: str,
+    session: ClientSession | Client | None = None,
+) -> Response[list[WikiPage]]:
+    """
+    Get list of wiki pages in different languages describing a tag.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tag_wiki_pages
+
+    Args:
+        key: tag key
+        value: tag value
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="tag/wiki_pages",
+        cls=Response[list[WikiPage]],
+        session=session,
+        params=api_params(_Params, key=key, value=value),
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,186 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tags_list."""
+"""`/api/4/tags/list` endpoint."""
+
+from collections.abc import Iterable
+from typing import Annotated, Any
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import OptionalNonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoValueError
+
+import pydantic
+from aiohttp import ClientSession
+from pydantic import Field, HttpUrl, StringConstraints, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "encode_tags",
+    "TagListItem",
+    "TagWikiPage",
+    "WikiImage",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikiImage:
+    """
+    Image on a wiki page.
+
+    Attributes:
+        image: Name of the image file on the wiki
+        width: Width of the image in pixels
+        height: Height of the image in pixels
+        mime: MIME type of the image
+        image_url: URL of the image
+        thumb_url_prefix: Start of the URL of a thumbnail; add the width in pixels
+                          and ``thumb_url_suffix`` to get the full URL
+        thumb_url_suffix: End of the URL of a thumbnail
+    """
+
+    image: str = Field(min_length=1, repr=True)
+    width: int | None = Field(default=None, ge=0, repr=False)
+    height: int | None = Field(default=None, ge=0, repr=False)
+    mime: str | None = Field(default=None, repr=False)
+    image_url: HttpUrl | None = Field(default=None, repr=False)
+    thumb_url_prefix: HttpUrl | None = Field(default=None, repr=False)
+    thumb_url_suffix: str | None = Field(default=None, repr=False)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagWikiPage:
+    """
+    Information from the wiki page about a tag in some language.
+
+    Attributes:
+        description: Description of the tag
+        image: Image that shows the tag
+        osmcarto_rendering: How the tag is rendered in the OpenStreetMap Carto map style
+    """
+
+    description: OptionalNonEmptyString = Field(default=None, repr=True)
+    image: WikiImage | None = Field(default=None, repr=False)
+    osmcarto_rendering: WikiImage | None = Field(default=None, repr=False)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagListItem:
+    """
+    A tag, its usage statistics, and its wiki pages.
+
+    Attributes:
+        key: Tag key name, the left side of the ``key=value`` pair
+        value: Tag value, the right side of the ``key=value`` pair
+        in_wiki: ``True`` if there is at least one wiki page for this tag
+        count_all: Number of objects in the OSM database with this tag
+        count_all_fraction: Number of objects with this tag as percentage of all objects
+        count_nodes: Number of nodes in the OSM database with this tag
+        count_nodes_fraction: Number of nodes with this tag as percentage of all tagged nodes
+        count_ways: Number of ways in the OSM database with this tag
+        count_ways_fraction: Number of ways with this tag as percentage of all ways
+        count_relations: Number of relations in the OSM database with this tag
+        count_relations_fraction: Number of relations with this tag as percentage of all relations
+        wiki: Information from the wiki pages about this tag (hash key is language code)
+        on_node: Should this tag be used on nodes, according to the wiki?
+        on_way: Should this tag be used on ways, according to the wiki?
+        on_area: Should this tag be used on areas, according to the wiki?
+        on_relation: Should this tag be used on relations, according to the wiki?
+        projects: Number of projects using this tag
+    """
+
+    key: str = Field(min_length=1, repr=True)
+    value: str = Field(min_length=1, repr=True)
+    in_wiki: bool = Field(repr=True)
+    count_all: int = Field(ge=0, repr=True)
+    count_all_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_nodes: int = Field(ge=0, repr=True)
+    count_nodes_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_ways: int = Field(ge=0, repr=True)
+    count_ways_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    count_relations: int = Field(ge=0, repr=True)
+    count_relations_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    wiki: dict[str, TagWikiPage] = Field(default_factory=dict, repr=False)
+    on_node: bool = Field(default=False, repr=False)
+    on_way: bool = Field(default=False, repr=False)
+    on_area: bool = Field(default=False, repr=False)
+    on_relation: bool = Field(default=False, repr=False)
+    projects: int = Field(default=0, ge=0, repr=False)
+
+    @field_validator("in_wiki", mode="before")
+    def _convert_in_wiki(cls, input_value: Any) -> bool:  # noqa: ANN401, N805
+        if input_value == 0:
+            return False
+        if input_value == 1:
+            return True
+        return input_value
+
+
+# the list of tags is separated by commas, and keys are separated from values by "="
+_TagKey = Annotated[str, StringConstraints(min_length=1, pattern=r"^[^=,]+$")]
+_TagValue = Annotated[str, StringConstraints(min_length=1, pattern=r"^[^,]+$")]
+_TAGS_ADAPTER = TypeAdapter(list[tuple[_TagKey, _TagValue]])
+
+
+def encode_tags(tags: Iterable[tuple[str, str]]) -> str:
+    """
+    Encode tags for the ``tags`` parameter.
+
+    Consecutive tags with the same key are written as ``key=value1,value2``,
+    unless a value contains ``=`` itself.
+
+    Args:
+        tags: ``(key, value)`` pairs
+
+    Raises:
+        TaginfoValueError: if a key contains ``=`` or ``,``, or a value contains ``,``,
+                           since they cannot be encoded
+    """
+    try:
+        validated = _TAGS_ADAPTER.validate_python(list(tags))
+    except pydantic.ValidationError as err:
+        raise TaginfoValueError(cause=err) from err
+
+    parts = []
+    prev_key = None
+    for key, value in validated:
+        parts.append(value if key == prev_key and "=" not in value else f"{key}={value}")
+        prev_key = key
+    return ",".join(parts)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    # validated by encode_tags(), and not stripped, since whitespace can be part of a value
+    tags: str = Field(min_length=1, repr=True)
+
+
+async def call(
+    tags: Iterable[tuple[str, str]],
+    session: ClientSession | Client | None = None,
+) -> Response[list[TagListItem]]:
+    """
+    Get information on given tags.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_tags_list
+
+    Tags that are not in the database are missing from the results.
+    To look up many tags with as few requests as possible, see `aio_taginfo.batch.TagBatcher`.
+
+    Args:
+        tags: ``(key, value)`` pairs
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(_Params, tags=encode_tags(tags))
+    return await api_get_json(
+        path="tags/list",
+        cls=Response[list[TagListItem]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
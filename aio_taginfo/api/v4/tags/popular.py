@@ -1,9 +1,11 @@
 """`/api/4/tags/popular` endpoint."""
 
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
 from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.client import Client
 
 from aiohttp import ClientSession
 from pydantic import Field, field_validator
@@ -16,7 +18,12 @@ __all__ = (
     "PopularTagSorting",
 )
 
-from aio_taginfo.api.v4._internal import NonEmptyString, api_get_json, api_params
+from aio_taginfo.api.v4._internal import (
+    LocalPaging,
+    NonEmptyString,
+    api_get_json,
+    api_params,
+)
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -82,13 +89,25 @@ class _Params:
     rp: int = Field(ge=0, repr=True)
 
 
+_PAGING = LocalPaging[PopularTag](
+    sort_keys={
+        PopularTagSorting.TAG.value: attrgetter("key", "value"),
+        PopularTagSorting.COUNT_ALL.value: attrgetter("count_all", "key", "value"),
+        PopularTagSorting.COUNT_NODES.value: attrgetter("count_nodes", "key", "value"),
+        PopularTagSorting.COUNT_WAYS.value: attrgetter("count_ways", "key", "value"),
+        PopularTagSorting.COUNT_RELATIONS.value: attrgetter("count_relations", "key", "value"),
+    },
+    query_fields=attrgetter("key", "value"),
+)
+
+
 async def call(
     query: str | None = None,
     sortname: PopularTagSorting = PopularTagSorting.COUNT_ALL,
     sortorder: SortOrder = SortOrder.DESC,
     page: int = 1,
     rp: int = 0,
-    session: ClientSession | None = None,
+    session: ClientSession | Client | None = None,
 ) -> Response[list[PopularTag]]:
     """
     Get list of most often used tags.
@@ -114,6 +133,7 @@ async def call(
         cls=Response[list[PopularTag]],
         session=session,
         params=params,
+        paging=_PAGING,
     )
 
 
@@ -1 +1,71 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_unicode_characters."""
+"""`/api/4/unicode/characters` endpoint."""
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import OptionalNonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "UnicodeCharacter",
+    "call",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class UnicodeCharacter:
+    """
+    Unicode properties of a character.
+
+    Attributes:
+        char: The character itself
+        codepoint: Unicode code point of the character
+        script: ISO 15924 code of the script of the character, like ``"Latn"``
+        script_name: Name of the script of the character, like ``"Latin"``
+        category: Unicode general category of the character, like ``"Ll"``
+        name: Unicode name of the character, if it has one
+    """
+
+    char: str = Field(min_length=1, max_length=1, repr=True)
+    codepoint: int = Field(ge=0, repr=False)
+    script: str = Field(min_length=4, max_length=4, repr=True)
+    script_name: str = Field(min_length=1, repr=False)
+    category: str = Field(min_length=2, max_length=2, repr=True)
+    name: OptionalNonEmptyString = Field(repr=True)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    string: str = Field(min_length=1, repr=True)
+
+
+async def call(
+    string: str,
+    session: ClientSession | Client | None = None,
+) -> Response[list[UnicodeCharacter]]:
+    """
+    Get information about unicode characters.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_unicode_characters
+
+    `aio_taginfo.local.unicode.characters` gives the same information without a request.
+
+    Args:
+        string: characters to get information about
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="unicode/characters",
+        cls=Response[list[UnicodeCharacter]],
+        session=session,
+        params=api_params(_Params, string=string),
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,89 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wiki_languages."""
+"""`/api/4/wiki/languages` endpoint."""
+
+from enum import Enum
+
+from aio_taginfo.api.v4 import PrintingDirection, Response, SortOrder
+from aio_taginfo.api.v4._internal import OptionalNonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "WikiLanguage",
+    "WikiLanguageSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikiLanguage:
+    """
+    A language of the OSM wiki, and how many key and tag pages are written in it.
+
+    Attributes:
+        code: Language code
+        dir: Printing direction for this language
+        native_name: Name of this language in this language, if taginfo knows it
+        english_name: English name of this language, if taginfo knows it
+        wiki_key_pages: Number of "Key:" wiki pages in this language
+        wiki_key_pages_fraction: Number of "Key:" wiki pages in relation to all of them
+        wiki_tag_pages: Number of "Tag:" wiki pages in this language
+        wiki_tag_pages_fraction: Number of "Tag:" wiki pages in relation to all of them
+    """
+
+    code: str = Field(min_length=1, repr=True)
+    dir: PrintingDirection = Field(repr=False)
+    native_name: OptionalNonEmptyString = Field(repr=False)
+    english_name: OptionalNonEmptyString = Field(repr=True)
+    wiki_key_pages: int = Field(ge=0, repr=False)
+    wiki_key_pages_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+    wiki_tag_pages: int = Field(ge=0, repr=False)
+    wiki_tag_pages_fraction: float = Field(ge=0.0, le=1.0, allow_inf_nan=False, repr=False)
+
+
+class WikiLanguageSorting(str, Enum):
+    """Sort options for wiki languages."""
+
+    CODE = "code"
+    NATIVE_NAME = "native_name"
+    ENGLISH_NAME = "english_name"
+    WIKI_KEY_PAGES = "wiki_key_pages"
+    WIKI_TAG_PAGES = "wiki_tag_pages"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    sortname: WikiLanguageSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+
+
+async def call(
+    sortname: WikiLanguageSorting = WikiLanguageSorting.WIKI_KEY_PAGES,
+    sortorder: SortOrder = SortOrder.DESC,
+    session: ClientSession | Client | None = None,
+) -> Response[list[WikiLanguage]]:
+    """
+    List languages of the wiki, and how many pages about keys and tags are written in them.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wiki_languages
+
+    Args:
+        sortname: what field to sort by
+        sortorder: sort order
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    return await api_get_json(
+        path="wiki/languages",
+        cls=Response[list[WikiLanguage]],
+        session=session,
+        params=api_params(_Params, sortname=sortname, sortorder=sortorder),
+    )
+
+
+__docformat__ = "google"
@@ -1 +1,154 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wikidata_all."""
+"""`/api/4/wikidata/all` endpoint."""
+
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import (
+    NonEmptyString,
+    OptionalNonEmptyString,
+    api_get_json,
+    api_get_json_pages,
+    api_params,
+)
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "call_pages",
+    "WikidataLink",
+    "WikidataLinkSorting",
+    "WikidataLinkType",
+)
+
+
+class WikidataLinkType(str, Enum):
+    """Whether a Wikidata item is linked to a key or to a tag."""
+
+    KEY = "key"
+    TAG = "tag"
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikidataLink:
+    """
+    A Wikidata item that is linked to a key or tag in the OSM wiki.
+
+    Attributes:
+        type: whether the item is linked to a key or to a tag
+        item: Wikidata item ID, like ``"Q16917"``, or property ID, like ``"P17"``
+        description: description of the item in the requested language
+        key: Key
+        value: Value, or ``None`` if the item is linked to a key
+    """
+
+    type: WikidataLinkType = Field(repr=False)
+    item: str = Field(min_length=1, repr=True)
+    description: OptionalNonEmptyString = Field(repr=False)
+    key: str = Field(min_length=1, repr=True)
+    value: OptionalNonEmptyString = Field(default=None, repr=True)
+
+
+class WikidataLinkSorting(str, Enum):
+    """Sort options for Wikidata links."""
+
+    ITEM = "item"
+    TAG = "tag"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    lang: NonEmptyString = Field(repr=True)
+    sortname: WikidataLinkSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    lang: str = "en",
+    sortname: WikidataLinkSorting = WikidataLinkSorting.ITEM,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[WikidataLink]]:
+    """
+    Get all Wikidata items that are linked to keys or tags in the OSM wiki.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wikidata_all
+
+    Args:
+        lang: language of the item descriptions
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        lang=lang,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="wikidata/all",
+        cls=Response[list[WikidataLink]],
+        session=session,
+        params=params,
+    )
+
+
+async def call_pages(
+    lang: str = "en",
+    sortname: WikidataLinkSorting = WikidataLinkSorting.ITEM,
+    sortorder: SortOrder = SortOrder.ASC,
+    rp: int = 1000,
+    concurrency: int = 1,
+    session: ClientSession | Client | None = None,
+) -> AsyncIterator[Response[list[WikidataLink]]]:
+    """
+    Get all Wikidata items that are linked to keys or tags in the OSM wiki, one page at a time.
+
+    Args:
+        lang: language of the item descriptions
+        sortname: what field to sort by
+        sortorder: sort order
+        rp: results per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session, which is used for all pages
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        lang=lang,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=1,
+        rp=rp,
+    )
+    async for page in api_get_json_pages(
+        path="wikidata/all",
+        cls=Response[list[WikidataLink]],
+        rp=params.pop("rp"),
+        concurrency=concurrency,
+        session=session,
+        params={k: v for k, v in params.items() if k != "page"},
+    ):
+        yield page
+
+
+__docformat__ = "google"
@@ -1 +1,91 @@
-"""TODO: https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wikidata_errors."""
+"""`/api/4/wikidata/errors` endpoint."""
+
+from enum import Enum
+
+from aio_taginfo.api.v4 import Response, SortOrder
+from aio_taginfo.api.v4._internal import OptionalNonEmptyString, api_get_json, api_params
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "call",
+    "WikidataError",
+    "WikidataErrorSorting",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class WikidataError:
+    """
+    A problem with the OSM key or tag of a Wikidata item.
+
+    Attributes:
+        code: Error code
+        item: Wikidata item ID
+        propvalue: Value of the "OSM tag or key" property of the item
+        description: Description of the item
+    """
+
+    code: str = Field(min_length=1, repr=True)
+    item: str = Field(min_length=1, repr=True)
+    propvalue: OptionalNonEmptyString = Field(repr=True)
+    description: OptionalNonEmptyString = Field(repr=False)
+
+
+class WikidataErrorSorting(str, Enum):
+    """Sort options for Wikidata errors."""
+
+    CODE = "code"
+    ITEM = "item"
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Params:
+    sortname: WikidataErrorSorting = Field(repr=True)
+    sortorder: SortOrder = Field(repr=True)
+    page: int = Field(gt=0, repr=True)
+    rp: int = Field(ge=0, repr=True)
+
+
+async def call(
+    sortname: WikidataErrorSorting = WikidataErrorSorting.CODE,
+    sortorder: SortOrder = SortOrder.ASC,
+    page: int = 1,
+    rp: int = 0,
+    session: ClientSession | Client | None = None,
+) -> Response[list[WikidataError]]:
+    """
+    Get Wikidata items whose OSM key or tag could not be matched.
+
+    https://taginfo.openstreetmap.org/taginfo/apidoc#api_4_wikidata_errors
+
+    Args:
+        sortname: what field to sort by
+        sortorder: sort order
+        page: page number (starting at 1)
+        rp: results per page
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    params = api_params(
+        _Params,
+        sortname=sortname,
+        sortorder=sortorder,
+        page=page,
+        rp=rp,
+    )
+    return await api_get_json(
+        path="wikidata/errors",
+        cls=Response[list[WikidataError]],
+        session=session,
+        params=params,
+    )
+
+
+__docformat__ = "google"
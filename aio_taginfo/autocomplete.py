@@ -0,0 +1,247 @@
+"""
+Search-as-you-type with the ``search/*`` endpoints.
+
+A search box that makes a request for every keystroke mostly makes requests whose
+results are never shown. `Autocomplete` sends fewer requests, and only returns
+the results of the latest query:
+
+```python
+autocomplete = Autocomplete(search_by_value, rp=10, session=client)
+
+async def on_input(text: str) -> None:
+    response = await autocomplete.query(text)
+    if response is not None:  # otherwise, a later query superseded this one
+        show(response.data)
+```
+
+* **Debouncing**: a query waits for ``delay`` seconds before it is sent, and is dropped if
+  another query is made in the meantime.
+* **Cancellation**: a new query cancels the request of the previous one, which closes
+  its connection right away instead of waiting for a response that would be dropped.
+* **Blank text**: leading and trailing whitespace is ignored, and blank text, like in an empty
+  search box, has no results without making a request. Its ``data_until`` is that of the latest
+  cached response, or `NO_DATA_UNTIL` if no query was answered yet.
+* **Caching**: the responses of recent queries are kept. For ``search/by_value`` and
+  ``search/by_role``, which match substrings, a query that extends a previous one is answered
+  by filtering the previous results, as long as those were complete.
+"""
+
+import asyncio
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any, Generic, TypeVar
+
+from aio_taginfo import _http
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4._internal import _ASCII_LOWER, LocalPaging
+from aio_taginfo.api.v4.search import by_key_and_value, by_keyword, by_role, by_value
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+
+
+__all__ = (
+    "NO_DATA_UNTIL",
+    "Autocomplete",
+)
+
+
+T = TypeVar("T")
+
+NO_DATA_UNTIL = datetime.fromtimestamp(0, UTC)
+"""
+The ``data_until`` of the empty result of blank text, if no query was answered before.
+
+An empty result has no data of its own to be dated by. This is the Unix epoch,
+which is older than any data of taginfo.
+"""
+
+_Search = Callable[..., Awaitable[Response[list[T]]]]
+
+# searches with substring matches, where the results of a query are a subset
+# of the results of any query that it contains
+_LOCAL_QUERIES: dict[Callable[..., Any], LocalPaging[Any]] = {
+    by_role.call: LocalPaging(sort_keys={}, query_fields=lambda item: (item.role,)),
+    by_value.call: LocalPaging(sort_keys={}, query_fields=lambda item: (item.value,)),
+}
+
+_PATHS: dict[Callable[..., Any], str] = {
+    by_key_and_value.call: "search/by_key_and_value",
+    by_keyword.call: "search/by_keyword",
+    by_role.call: "search/by_role",
+    by_value.call: "search/by_value",
+}
+
+
+def _with_query(url: str, query: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    params = dict(urllib.parse.parse_qsl(parts.query))
+    params["query"] = query
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(params)))
+
+
+class Autocomplete(Generic[T]):
+    """
+    Debounced queries to a search endpoint, of which only the latest one is answered.
+
+    Attributes:
+        requests: number of requests that were sent
+        cache_hits: number of queries that were answered from the cache
+    """
+
+    __slots__ = ("_cache", "_generation", "_local", "_task", "cache_hits", "cache_size", "delay",
+                 "requests", "rp", "search", "session")  # fmt: skip
+
+    def __init__(
+        self,
+        search: _Search[T],
+        rp: int = 10,
+        delay: float = 0.15,
+        cache_size: int = 64,
+        session: ClientSession | Client | None = None,
+    ) -> None:
+        """
+        Create an autocomplete for a search endpoint.
+
+        Args:
+            search: the ``call`` function of a ``search/*`` endpoint, like `search_by_value`
+            rp: number of results per query
+            delay: seconds to wait for another query, before a request is sent
+            cache_size: number of recent responses to keep
+            session: request client session, which is used for all requests
+        """
+        assert rp > 0, "'rp' must be positive"
+        assert delay >= 0, "'delay' must not be negative"
+        assert cache_size > 0, "'cache_size' must be positive"
+        self.search = search
+        self.rp = rp
+        self.delay = delay
+        self.cache_size = cache_size
+        self.session = session
+        self.requests = 0
+        self.cache_hits = 0
+        self._local = _LOCAL_QUERIES.get(search)
+        self._cache: OrderedDict[str, Response[list[T]]] = OrderedDict()
+        self._generation = 0
+        self._task: asyncio.Future[Response[list[T]]] | None = None
+
+    async def query(self, text: str) -> Response[list[T]] | None:
+        """
+        Search for the given text.
+
+        Leading and trailing whitespace is ignored. Blank text has no results,
+        and does not make a request.
+
+        Returns:
+            the first ``rp`` results, or ``None`` if another query was made before they arrived;
+            the empty result of blank text has the ``data_until`` of the latest cached response,
+            or `NO_DATA_UNTIL` if there is none
+
+        Raises:
+            TaginfoError
+        """
+        self._generation += 1
+        generation = self._generation
+        self.cancel()
+
+        text = text.strip()
+        if not text:
+            return self._empty()
+
+        cached = self._cached(text)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        if self.delay:
+            await asyncio.sleep(self.delay)
+            if generation != self._generation:
+                return None
+
+        self.requests += 1
+        task = asyncio.ensure_future(
+            self.search(query=text, page=1, rp=self.rp, session=self.session)
+        )
+        self._task = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            if self._task is task:
+                self._task = None
+
+        if task.cancelled():
+            return None  # superseded by a later query
+        if generation != self._generation:
+            if task.exception() is None:
+                self._store(text, task.result())
+            return None
+        response = task.result()
+        self._store(text, response)
+        return response
+
+    def cancel(self) -> None:
+        """Cancel the request that is in flight, if any."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _cached(self, text: str) -> Response[list[T]] | None:
+        response = self._cache.get(text)
+        if response is not None:
+            self._cache.move_to_end(text)
+            return response
+        if self._local is None:
+            return None
+
+        # the results of the longest previous query that is contained in this one,
+        # if they are complete, contain all results of this query
+        needle = text.translate(_ASCII_LOWER)
+        previous = [
+            (query, response)
+            for query, response in self._cache.items()
+            if query.translate(_ASCII_LOWER) in needle and response.total == len(response.data)
+        ]
+        if not previous:
+            return None
+        _, response = max(previous, key=lambda p: len(p[0]))
+        params = {"query": text, "page": 1, "rp": self.rp}
+        response = self._local.view(response, params, _with_query(str(response.url), text))
+        self._store(text, response)
+        return response
+
+    def _empty(self) -> Response[list[T]]:
+        # there is no data to date an empty result, other than that of a previous one
+        latest = next(reversed(self._cache.values()), None)
+        if latest is None:
+            params = {"query": "", "page": 1, "rp": self.rp}
+            url = _http.api_url(_PATHS.get(self.search, "search"), params)
+            data_until = NO_DATA_UNTIL
+        else:
+            url = _with_query(str(latest.url), "")
+            data_until = latest.data_until
+        return Response(
+            data=[],
+            data_until=data_until,
+            url=url,  # type: ignore[arg-type]
+            total=0,
+            page=1,
+            rp=self.rp,
+        )
+
+    def _store(self, text: str, response: Response[list[T]]) -> None:
+        self._cache[text] = response
+        self._cache.move_to_end(text)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def __repr__(self) -> str:
+        """String representation that includes the numbers of requests and cache hits."""
+        return f"{self.__class__.__name__}(requests={self.requests}, cache_hits={self.cache_hits})"
+
+
+__docformat__ = "google"
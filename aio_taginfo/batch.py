@@ -0,0 +1,175 @@
+"""
+Automatic batching of lookups for single tags.
+
+The ``tags/list`` endpoint returns statistics for many tags at once. A `TagBatcher`
+collects the tags that are looked up concurrently within a short time window, and requests
+them with as few calls to that endpoint as the maximum URL length allows:
+
+```python
+async with TagBatcher(session=session) as batcher:
+    items = await asyncio.gather(*(batcher.get(key, value) for key, value in tags))
+```
+"""
+
+import asyncio
+import urllib.parse
+from collections.abc import Iterable
+
+from aio_taginfo import _http
+from aio_taginfo.api.v4.tags import list as tags_list
+from aio_taginfo.api.v4.tags.list import TagListItem, encode_tags
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+
+
+__all__ = ("TagBatcher",)
+
+
+_Tag = tuple[str, str]
+
+
+def _pack(tags: Iterable[_Tag], max_url_length: int) -> list[list[_Tag]]:
+    """Split tags into batches whose request URLs are no longer than the given length."""
+    base_length = len(_http.api_url("tags/list", {"tags": ""}))
+    separator_length = len(urllib.parse.quote_plus(","))
+
+    batches: list[list[_Tag]] = []
+    batch: list[_Tag] = []
+    length = base_length
+    prev_key = None
+
+    # tags with the same key are encoded more compactly when they are next to each other
+    for key, value in sorted(tags):
+        if batch:
+            part = value if key == prev_key and "=" not in value else f"{key}={value}"
+            added = separator_length + len(urllib.parse.quote_plus(part))
+            if length + added <= max_url_length:
+                batch.append((key, value))
+                length += added
+                prev_key = key
+                continue
+            batches.append(batch)
+
+        batch = [(key, value)]
+        length = base_length + len(urllib.parse.quote_plus(f"{key}={value}"))
+        prev_key = key
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class TagBatcher:
+    """
+    Merges concurrent lookups of single tags into few ``tags/list`` requests.
+
+    Lookups are collected for ``window`` seconds after the first one, and then requested
+    in batches. Every tag is only requested once per batch, no matter how often it was
+    looked up. If a request fails, all lookups of tags in that batch fail with its error.
+    """
+
+    __slots__ = ("_pending", "_session", "_tasks", "_timer", "max_url_length", "window")
+
+    def __init__(
+        self,
+        session: ClientSession | Client | None = None,
+        window: float = 0.01,
+        max_url_length: int = 4000,
+    ) -> None:
+        """
+        Create a batcher.
+
+        Args:
+            session: request client session, which is used for all requests
+            window: seconds to wait for more lookups after the first one of a batch
+            max_url_length: maximum length of request URLs
+        """
+        assert window >= 0, "'window' cannot be negative"
+        self._session = session
+        self.window = window
+        self.max_url_length = max_url_length
+        self._pending: dict[_Tag, list[asyncio.Future[TagListItem | None]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def get(self, key: str, value: str) -> TagListItem | None:
+        """
+        Look up a single tag.
+
+        Returns:
+            ``None`` if the tag is not in the database
+
+        Raises:
+            TaginfoError
+        """
+        encode_tags([(key, value)])  # fail early, and only for this lookup
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[TagListItem | None] = loop.create_future()
+        self._pending.setdefault((key, value), []).append(future)
+        if self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    async def get_many(self, tags: Iterable[_Tag]) -> dict[_Tag, TagListItem | None]:
+        """
+        Look up multiple tags.
+
+        Returns:
+            results by ``(key, value)``, with ``None`` for tags that are not in the database
+
+        Raises:
+            TaginfoError
+        """
+        tags = list(dict.fromkeys(tags))
+        results = await asyncio.gather(*(self.get(key, value) for key, value in tags))
+        return dict(zip(tags, results, strict=True))
+
+    def _flush(self) -> None:
+        """Request all pending lookups."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for batch in _pack(pending, self.max_url_length):
+            waiters = {tag: pending[tag] for tag in batch}
+            task = asyncio.create_task(self._request(waiters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _request(self, waiters: dict[_Tag, list[asyncio.Future[TagListItem | None]]]) -> None:
+        futures = [future for futures in waiters.values() for future in futures]
+        try:
+            response = await tags_list.call(tags=list(waiters), session=self._session)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            for future in futures:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        items = {(item.key, item.value): item for item in response.data}
+        for tag, tag_futures in waiters.items():
+            for future in tag_futures:
+                if not future.done():
+                    future.set_result(items.get(tag))
+
+    async def close(self) -> None:
+        """Request all pending lookups, and wait for all requests to finish."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "TagBatcher":
+        """Return this batcher."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Request all pending lookups, and wait for all requests to finish."""
+        await self.close()
+
+
+__docformat__ = "google"
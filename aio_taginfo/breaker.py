@@ -0,0 +1,213 @@
+"""
+Circuit breaker, which lets a `aio_taginfo.client.Client` fail fast while taginfo is degraded.
+
+Every endpoint of every server has its own circuit:
+
+* While it is **closed**, calls are made as usual. If too many of the recent calls failed,
+  or were too slow, the circuit opens.
+* While it is **open**, calls fail right away with `aio_taginfo.error.TaginfoCircuitOpenError`,
+  instead of waiting for a timeout. If the client has a stale cached response for the call,
+  that response is returned instead.
+* After some time, the circuit is **half-open**, and lets a few trial calls through.
+  If they succeed, the circuit closes again; otherwise it opens again.
+
+```python
+client = Client(breaker=CircuitBreaker(failure_rate=0.5, open_duration=30.0))
+```
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TypeVar
+
+from aio_taginfo import _http
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError
+
+import aiohttp
+
+
+__all__ = (
+    "CircuitBreaker",
+    "CircuitState",
+)
+
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """State of a circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(kw_only=True)
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    # (failed, slow) for recent calls while closed
+    outcomes: deque[tuple[bool, bool]] = field(default_factory=deque)
+    opened_at: float = 0.0
+    trials: int = 0
+    last_error: aiohttp.ClientError | None = None
+
+
+class CircuitBreaker:
+    """Circuits for all endpoints that a client calls."""
+
+    __slots__ = ("_circuits", "_lock", "failure_rate", "half_open_calls", "min_calls",
+                 "open_duration", "slow_call_duration", "slow_call_rate", "window")  # fmt: skip
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 1.0,
+        slow_call_duration: float = 10.0,
+        window: int = 20,
+        min_calls: int = 5,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        """
+        Create circuits that are closed.
+
+        Args:
+            failure_rate: open a circuit if at least this fraction of recent calls failed
+            slow_call_rate: open a circuit if at least this fraction of recent calls were slow
+            slow_call_duration: calls that take at least this many seconds are slow
+            window: number of recent calls per circuit that are considered
+            min_calls: number of recent calls needed to open a circuit
+            open_duration: seconds that a circuit stays open before trial calls are made
+            half_open_calls: number of concurrent trial calls while a circuit is half-open
+        """
+        assert 0.0 < failure_rate <= 1.0, "'failure_rate' must be in (0, 1]"
+        assert 0.0 < slow_call_rate <= 1.0, "'slow_call_rate' must be in (0, 1]"
+        assert 0 < min_calls <= window, "need 0 < 'min_calls' <= 'window'"
+        assert half_open_calls > 0, "'half_open_calls' must be positive"
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_duration = slow_call_duration
+        self.window = window
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> CircuitState:
+        """The state of the circuit of an endpoint."""
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            return CircuitState.CLOSED
+        if circuit.state is CircuitState.OPEN and self._retry_after(circuit) <= 0:
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    async def run(self, endpoint: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a call, unless the circuit of its endpoint is open.
+
+        Args:
+            endpoint: identifies the circuit, like ``"taginfo.openstreetmap.org/key/overview"``
+            call: makes the call
+
+        Raises:
+            TaginfoCircuitOpenError: if the circuit is open
+            TaginfoCallError: if the call failed
+        """
+        circuit, is_trial = self._admit(endpoint)
+        started = time.monotonic()
+        try:
+            result = await call()
+        except TaginfoCallError as err:
+            # errors like "404 Not Found" still mean that the server is fine
+            failed = _http.is_overload(err)
+            with self._lock:
+                if failed:
+                    circuit.last_error = err.cause
+                self._record(circuit, failed=failed, slow=False, trial=is_trial)
+            raise
+        except BaseException:
+            if is_trial:
+                with self._lock:
+                    circuit.trials -= 1
+            raise
+
+        slow = time.monotonic() - started >= self.slow_call_duration
+        with self._lock:
+            self._record(circuit, failed=False, slow=slow, trial=is_trial)
+        return result
+
+    def _admit(self, endpoint: str) -> tuple[_Circuit, bool]:
+        """Let a call through, or raise if the circuit is open; returns if it is a trial call."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(outcomes=deque(maxlen=self.window))
+
+            if circuit.state is CircuitState.OPEN and self._retry_after(circuit) <= 0:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trials = 0
+
+            is_trial = circuit.state is CircuitState.HALF_OPEN
+            if circuit.state is CircuitState.OPEN or (
+                is_trial and circuit.trials >= self.half_open_calls
+            ):
+                raise TaginfoCircuitOpenError(
+                    endpoint=endpoint,
+                    retry_after=max(self._retry_after(circuit), 0.0),
+                    cause=circuit.last_error,
+                )
+
+            if is_trial:
+                circuit.trials += 1
+            return circuit, is_trial
+
+    def _record(self, circuit: _Circuit, *, failed: bool, slow: bool, trial: bool) -> None:
+        if trial:
+            circuit.trials -= 1
+            if circuit.state is not CircuitState.HALF_OPEN:
+                return  # another trial call already decided the state
+            if failed or slow:
+                self._open(circuit)
+            elif circuit.trials == 0:
+                circuit.state = CircuitState.CLOSED
+                circuit.outcomes.clear()
+            return
+
+        if circuit.state is not CircuitState.CLOSED:
+            return  # a call that was made before the circuit opened
+
+        circuit.outcomes.append((failed, slow))
+        n = len(circuit.outcomes)
+        if n < self.min_calls:
+            return
+        failures = sum(failed for failed, _ in circuit.outcomes)
+        slow_calls = sum(slow for _, slow in circuit.outcomes)
+        if failures >= self.failure_rate * n or slow_calls >= self.slow_call_rate * n:
+            self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+
+    def _retry_after(self, circuit: _Circuit) -> float:
+        return circuit.opened_at + self.open_duration - time.monotonic()
+
+    def __repr__(self) -> str:
+        """String representation that includes the endpoints whose circuits are not closed."""
+        not_closed = {
+            endpoint: self.state(endpoint).value
+            for endpoint in self._circuits
+            if self.state(endpoint) is not CircuitState.CLOSED
+        }
+        return f"{self.__class__.__name__}({not_closed})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,162 @@
+"""In-memory cache for API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+
+__all__ = (
+    "CacheEntry",
+    "ResponseCache",
+)
+
+
+@dataclass(kw_only=True)
+class CacheEntry:
+    """
+    A cached response.
+
+    Attributes:
+        payload: the raw response body
+        created: time at which the response was received, from ``time.monotonic()``
+        ttl: seconds after which the response is no longer used, or ``None`` to keep it
+             until it is evicted
+        decoded: objects that were already decoded from the payload, by their type
+        stale: whether the response was marked as outdated, regardless of its age
+    """
+
+    payload: bytes
+    created: float
+    ttl: float | None = None
+    decoded: dict[Any, Any] = field(default_factory=dict, repr=False)
+    stale: bool = False
+
+
+class ResponseCache:
+    """
+    Least recently used cache of raw API responses.
+
+    Entries are keyed by the request path and its parameters, but not by the server that
+    answered the request. Objects decoded from a cached response are kept alongside it,
+    so that repeated hits do not have to validate the same payload again.
+
+    A cache can be shared by clients on several threads.
+
+    Attributes:
+        ttls: TTLs of the responses of some API paths, like ``"site/info"``, instead of ``ttl``;
+              a response keeps the TTL that applied when it was stored
+    """
+
+    __slots__ = ("_entries", "_lock", "max_entries", "ttl", "ttls")
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = 3600.0,
+        ttls: Mapping[str, float | None] | None = None,
+    ) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: maximum number of cached responses; ``0`` disables the cache
+            ttl: seconds after which a response is no longer used, or ``None`` to keep
+                 responses until they are evicted
+            ttls: TTLs of the responses of some API paths, instead of ``ttl``
+        """
+        assert max_entries >= 0, "'max_entries' cannot be negative"
+        assert ttl is None or ttl > 0, "'ttl' must be positive"
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls: dict[str, float | None] = dict(ttls or {})
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if there is a fresh response for the given key."""
+        return isinstance(key, str) and self.get(key) is not None
+
+    def get(self, key: str, *, stale: bool = False) -> CacheEntry | None:
+        """
+        Look up a response.
+
+        Args:
+            key: the key of the response
+            stale: also return the response if it is no longer fresh
+
+        Returns:
+            ``None`` if there is no response for this key, or if it is stale
+            and ``stale=False``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not stale and not self.is_fresh(entry):
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check if a response was neither marked as stale, nor exceeded the TTL."""
+        if entry.stale:
+            return False
+        return entry.ttl is None or time.monotonic() - entry.created <= entry.ttl
+
+    def put(self, key: str, payload: bytes) -> CacheEntry:
+        """Store a response, evicting the least recently used one if the cache is full."""
+        path, _, _ = key.partition("?")
+        ttl = self.ttls.get(path, self.ttl)
+        entry = CacheEntry(payload=payload, created=time.monotonic(), ttl=ttl)
+        if self.max_entries == 0:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def mark_stale(self, created_before: float | None = None) -> None:
+        """
+        Mark responses as stale, for example when taginfo has imported new data.
+
+        Stale responses are kept, and can still be looked up with ``get(key, stale=True)``.
+
+        Args:
+            created_before: only mark responses that were received before this time,
+                            from ``time.monotonic()``; by default, mark all responses
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if created_before is None or entry.created < created_before:
+                    entry.stale = True
+
+    def keys(self) -> list[str]:
+        """Keys of all cached responses, including expired ones, from least recently used."""
+        with self._lock:
+            return list(self._entries)
+
+    def discard(self, key: str) -> None:
+        """Remove a response, if it is cached."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of cached responses."""
+        return f"{self.__class__.__name__}(len={len(self)}, max_entries={self.max_entries})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,550 @@
+"""
+Long-lived API client.
+
+A `Client` can be passed as ``session`` to every call function. Unlike a plain
+``aiohttp.ClientSession``, it keeps responses in a `aio_taginfo.cache.ResponseCache`,
+so that repeated requests are answered without a round trip:
+
+```python
+from aio_taginfo import key_similar
+from aio_taginfo.client import Client
+
+async with Client(headers={"User-Agent": "your contact info"}) as client:
+    everything = await key_similar(key="highway", session=client)
+
+    # answered from the cached result above
+    second_page = await key_similar(key="highway", page=2, rp=20, session=client)
+```
+
+For paginated endpoints that support it, a cached response that contains all results
+(``rp=0``) is also used to answer requests for single pages, other sort orders, or
+substring queries, the same way the server would.
+
+## Refreshing stale responses
+With ``stale_while_revalidate=True``, a response that is no longer fresh is still returned
+right away, while it is requested again in the background.
+
+Taginfo imports new data about once a day. Instead of waiting for responses to expire,
+a client can poll for new data, and then request frequently used calls again
+in the background, so that callers never have to wait for them:
+
+```python
+hot_calls = [functools.partial(key_overview, key=key) for key in ("amenity", "highway")]
+
+client = Client(stale_while_revalidate=True, cache=ResponseCache(ttl=None))
+client.start_refreshing(hot_calls, interval=600)
+```
+
+## Servers
+By default, all requests are made to https://taginfo.openstreetmap.org. Another server,
+like a mirror, can be used with ``base_url``:
+
+```python
+client = Client(base_url="https://taginfo.example.com/api/4/")
+```
+
+To balance requests across several equivalent servers, and fail over between them,
+use `aio_taginfo.instances.Instances` instead.
+
+To record the responses of a workload, and replay them later without a network,
+use the ``transport`` of `aio_taginfo.replay`.
+
+## Threads and event loops
+A `aiohttp.ClientSession` can only be used on the event loop that it was created on.
+A client that creates its own session instead keeps one per event loop, so that the same
+client can be shared by several threads that run their own loops. Each session is created
+when the first request is made on its loop, and closed when the loop shuts down its
+asynchronous generators, which `asyncio.run()` does before it closes the loop:
+
+```python
+client = Client()
+
+def worker() -> None:
+    asyncio.run(key_overview(key="amenity", session=client))
+
+threads = [threading.Thread(target=worker) for _ in range(4)]
+```
+
+The cache and the policies of the client are shared by all loops, except for a
+`aio_taginfo.scheduler.Scheduler` or `aio_taginfo.limiter.AdaptiveConcurrency`, which
+make requests wait on a single loop. A client with either of them, or with a given
+``session``, can only be used on one event loop.
+
+## Other policies
+* `aio_taginfo.hedging.Hedging` makes a second request when the first one takes too long
+* `aio_taginfo.breaker.CircuitBreaker` fails fast while an endpoint keeps failing,
+  and falls back to stale cached responses
+* `aio_taginfo.limiter.AdaptiveConcurrency` adjusts the number of requests in flight
+  to the observed latencies and errors
+* `aio_taginfo.scheduler.Scheduler` limits concurrent requests, and keeps bulk requests
+  from delaying interactive ones
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+import urllib.parse
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping
+from datetime import datetime
+from typing import NamedTuple, TypeVar
+
+from aio_taginfo import _http
+from aio_taginfo.breaker import CircuitBreaker
+from aio_taginfo.cache import CacheEntry, ResponseCache
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError, TaginfoValidationError
+from aio_taginfo.hedging import Hedging
+from aio_taginfo.instances import Instances
+from aio_taginfo.limiter import AdaptiveConcurrency
+from aio_taginfo.scheduler import Scheduler
+
+import pydantic
+from aiohttp import ClientSession
+from pydantic import TypeAdapter
+from pydantic.dataclasses import dataclass
+
+
+__all__ = (
+    "Client",
+    "HotCall",
+    "Transport",
+)
+
+
+T = TypeVar("T")
+
+HotCall = Callable[..., Awaitable[object]]
+"""A call function that is called with ``session=client``, and no other arguments."""
+
+Transport = Callable[[str, str, ClientSession | None, dict | None, str], Awaitable[bytes]]
+"""
+Makes a GET request, and returns the response body.
+
+It is called with the API path after "/api/4/", the expected content type, the client's
+session, the query parameters, and the API URL of the server. It raises
+`aio_taginfo.error.TaginfoCallError` if the request fails.
+"""
+
+# set while calls are made to replace cached responses
+_REVALIDATING: contextvars.ContextVar[bool] = contextvars.ContextVar("revalidating", default=False)
+
+
+@dataclass(frozen=True)
+class _DataUntil:
+    data_until: datetime
+
+
+_DATA_UNTIL_ADAPTER = TypeAdapter(_DataUntil)
+
+# a small request that tells the date of the current data
+_DATA_UNTIL_PATH = "keys/all"
+_DATA_UNTIL_PARAMS = {"page": 1, "rp": 1, "sortname": "key", "sortorder": "asc"}
+
+# a small request that tells whether a server is healthy
+_HEALTH_CHECK_PATH = "site/info"
+
+
+class _LoopSession(NamedTuple):
+    """A session that was created for an event loop, and closes it with the loop."""
+
+    session: ClientSession
+    closer: AsyncGenerator[None, None]
+
+
+class Client:
+    """Client that reuses one session for all requests, and caches their responses."""
+
+    __slots__ = ("_background", "_data_until", "_headers", "_health_checker", "_lock",
+                 "_refresher", "_revalidations", "_session", "_sessions", "breaker", "cache",
+                 "hedging", "instances", "limiter", "scheduler", "stale_while_revalidate",
+                 "transport")  # fmt: skip
+
+    def __init__(
+        self,
+        session: ClientSession | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        headers: Mapping[str, str] | None = None,
+        base_url: str | None = None,
+        instances: Instances | None = None,
+        stale_while_revalidate: bool = False,
+        hedging: Hedging | None = None,
+        breaker: CircuitBreaker | None = None,
+        scheduler: Scheduler | None = None,
+        limiter: AdaptiveConcurrency | None = None,
+        transport: Transport | None = None,
+    ) -> None:
+        """
+        Create a client.
+
+        Args:
+            session: request client session; by default, the client creates its own for
+                     each event loop when it makes the first request on it, and closes it
+                     when the loop shuts down, or in `close()`
+            cache: cache for responses; a new one by default
+            headers: headers of the session that is created by the client
+            base_url: URL of the API of the server that answers all requests;
+                      https://taginfo.openstreetmap.org/api/4/ by default
+            instances: servers to balance requests across, instead of ``base_url``
+            stale_while_revalidate: return stale responses right away,
+                                    and request them again in the background
+            hedging: policy for hedged requests, which are not made by default
+            breaker: circuit breaker that fails fast while an endpoint keeps failing;
+                     by default, every request is made
+            scheduler: limits concurrent requests, and orders them by priority;
+                       by default, requests are only limited by the session's connector
+            limiter: adaptive concurrency limit; to use one with a scheduler,
+                     pass it as the scheduler's ``concurrency`` instead
+            transport: makes the requests instead of the session, like a
+                       `aio_taginfo.replay.Replayer`; by default, they are made with the session
+        """
+        assert session is None or headers is None, "cannot set 'headers' of a given 'session'"
+        assert scheduler is None or limiter is None, "pass 'limiter' to the 'scheduler' instead"
+        assert base_url is None or instances is None, "cannot set both 'base_url' and 'instances'"
+        self._session = session
+        self._sessions: dict[asyncio.AbstractEventLoop, _LoopSession] = {}
+        self._lock = threading.Lock()
+        self._headers = dict(headers or {})
+        self.cache = ResponseCache() if cache is None else cache
+        self.instances = Instances([base_url or _http.URL_BASE]) if instances is None else instances
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hedging = hedging
+        self.breaker = breaker
+        self.scheduler = scheduler
+        self.limiter = limiter
+        self.transport: Transport = _http.get if transport is None else transport
+        self._data_until: datetime | None = None
+        self._refresher: asyncio.Task[None] | None = None
+        self._health_checker: asyncio.Task[None] | None = None
+        self._revalidations: dict[str, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+
+    @property
+    def session(self) -> ClientSession:
+        """The session used for requests on the running event loop."""
+        if self._session is not None:
+            return self._session
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_session = self._sessions.get(loop)
+            if loop_session is not None:
+                return loop_session.session
+            assert (self.scheduler is None and self.limiter is None) or all(
+                other.is_closed() for other in self._sessions
+            ), "a client with a 'scheduler' or 'limiter' can only be used on one event loop"
+            session = ClientSession(headers=self._headers)
+            closer = self._close_with_loop(loop, session)
+            self._sessions[loop] = _LoopSession(session, closer)
+
+        # asyncio has no callback for a closing loop, but the loop closes all asynchronous
+        # generators that were started on it first, so this one closes the session
+        with contextlib.suppress(StopIteration):
+            closer.asend(None).send(None)
+        return session
+
+    async def _close_with_loop(
+        self, loop: asyncio.AbstractEventLoop, session: ClientSession
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                loop_session = self._sessions.get(loop)
+                if loop_session is not None and loop_session.session is session:
+                    del self._sessions[loop]
+            await session.close()
+
+    @property
+    def data_until(self) -> datetime | None:
+        """The date of taginfo's data when it was last checked with `refresh()`."""
+        return self._data_until
+
+    async def refresh(self, hot_calls: Iterable[HotCall] = ()) -> bool:
+        """
+        Check if taginfo has imported new data, and if so, request the given calls again.
+
+        Until they are answered, their previous responses are returned to other callers.
+        All other cached responses are marked as stale once the given calls are done.
+        The first check only makes the given calls, so that their responses are cached.
+
+        Args:
+            hot_calls: frequently used calls, like ``partial(key_overview, key="amenity")``
+
+        Raises:
+            TaginfoError
+
+        Returns:
+            ``True`` if there was new data, or this was the first check
+        """
+        payload = await self._send(_DATA_UNTIL_PATH, "application/json", _DATA_UNTIL_PARAMS)
+        try:
+            data_until = _DATA_UNTIL_ADAPTER.validate_json(payload).data_until
+        except pydantic.ValidationError as err:
+            raise TaginfoValidationError(cause=err) from err
+
+        if data_until == self._data_until:
+            return False
+
+        first_check = self._data_until is None
+        self._data_until = data_until
+        started = time.monotonic()
+
+        token = None if first_check else _REVALIDATING.set(True)
+        try:
+            await asyncio.gather(
+                *(call(session=self) for call in hot_calls), return_exceptions=True
+            )
+        finally:
+            if token is not None:
+                _REVALIDATING.reset(token)
+
+        if not first_check:
+            self.cache.mark_stale(created_before=started)
+        return True
+
+    def revalidate(self, hot_calls: Iterable[HotCall]) -> None:
+        """
+        Make the given calls again in the background, and replace their cached responses.
+
+        Until they are answered, their cached responses are returned to other callers.
+        Failed calls are ignored, and keep the cached responses.
+
+        Args:
+            hot_calls: calls like ``partial(key_overview, key="amenity")``
+        """
+        token = _REVALIDATING.set(True)
+        try:
+            for call in hot_calls:
+                task = asyncio.ensure_future(call(session=self))
+                with self._lock:
+                    self._background.add(task)
+                task.add_done_callback(self._background_done)
+        finally:
+            _REVALIDATING.reset(token)
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        with self._lock:
+            self._background.discard(task)
+        if not task.cancelled():
+            task.exception()  # TODO: log
+
+    def start_refreshing(self, hot_calls: Iterable[HotCall] = (), interval: float = 600.0) -> None:
+        """
+        Call `refresh()` periodically in the background, until the client is closed.
+
+        Failed checks are ignored, and tried again after the interval.
+
+        Args:
+            hot_calls: frequently used calls, like ``partial(key_overview, key="amenity")``
+            interval: seconds between checks for new data
+        """
+        assert self._refresher is None, "already refreshing"
+        self._refresher = asyncio.create_task(self._refresh_periodically(list(hot_calls), interval))
+
+    async def _refresh_periodically(self, hot_calls: list[HotCall], interval: float) -> None:
+        while True:
+            with contextlib.suppress(TaginfoCallError, TaginfoValidationError):  # TODO: log
+                await self.refresh(hot_calls)
+            await asyncio.sleep(interval)
+
+    def start_health_checks(self, interval: float = 30.0) -> None:
+        """
+        Check periodically in the background if the `instances` are healthy.
+
+        Checks continue until the client is closed. Failed checks mark an instance as
+        unhealthy, and are tried again after the interval.
+
+        Args:
+            interval: seconds between checks
+        """
+        assert self._health_checker is None, "already checking"
+        self._health_checker = asyncio.create_task(self._check_periodically(interval))
+
+    async def _check_periodically(self, interval: float) -> None:
+        def probe(base_url: str) -> Awaitable[bytes]:
+            return self.transport(
+                _HEALTH_CHECK_PATH, "application/json", self.session, None, base_url
+            )
+
+        while True:
+            await self.instances.check(probe)
+            await asyncio.sleep(interval)
+
+    async def close(self) -> None:
+        """
+        Stop all background requests, and close the sessions that were created by this client.
+
+        Background requests and sessions of other event loops are stopped and closed
+        on their loops, if they are still running.
+        """
+        with self._lock:
+            tasks = [*self._revalidations.values(), *self._background]
+            self._revalidations.clear()
+            self._background.clear()
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        if self._refresher is not None:
+            tasks.append(self._refresher)
+        if self._health_checker is not None:
+            tasks.append(self._health_checker)
+        self._refresher = None
+        self._health_checker = None
+
+        loop = asyncio.get_running_loop()
+        for task in tasks:
+            if task.get_loop() is loop:
+                task.cancel()
+            elif not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+        await asyncio.gather(*(t for t in tasks if t.get_loop() is loop), return_exceptions=True)
+
+        closing: list[Awaitable[None]] = []
+        for session_loop, (_, closer) in sessions:
+            if session_loop is loop:
+                closing.append(closer.aclose())
+            elif session_loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(closer.aclose(), session_loop)
+                closing.append(asyncio.wrap_future(future))
+            # otherwise, the session is closed when its loop runs again, or shuts down
+        await asyncio.gather(*closing, return_exceptions=True)
+
+    async def __aenter__(self) -> "Client":
+        """Return this client."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop all background requests, and close the session if it was created by this client."""
+        await self.close()
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict | None,
+        content_type: str,
+        decode: Callable[[bytes], T],
+        key: str | None = None,
+    ) -> T:
+        """
+        Request a response, or use a cached one.
+
+        Args:
+            path: the API path after "/api/4/"
+            params: parameters in the request query string
+            content_type: expected content type of the response
+            decode: validates the response body; its result is cached alongside the body,
+                    so the same function should be used for all requests of the same type
+            key: the key of the response in the cache, if it differs from the request's
+
+        Raises:
+            TaginfoError
+        """
+        key = key or _http.cache_key(path, params)
+
+        if _REVALIDATING.get():
+            return await asyncio.shield(self._revalidate(key, path, params, content_type, decode))
+
+        entry = self.cache.get(key, stale=self.stale_while_revalidate)
+        if entry is not None:
+            if not self.cache.is_fresh(entry):
+                self._revalidate(key, path, params, content_type, decode)
+            return self._decoded(entry, decode)
+
+        try:
+            return await self._request(key, path, params, content_type, decode)
+        except TaginfoCircuitOpenError:
+            entry = self.cache.get(key, stale=True)
+            if entry is None:
+                raise
+            return self._decoded(entry, decode)
+
+    def _is_cached(self, key: str) -> bool:
+        """Check if `_fetch()` would use the cached response for the given key."""
+        return self.cache.get(key, stale=self.stale_while_revalidate) is not None
+
+    async def _request(
+        self,
+        key: str,
+        path: str,
+        params: dict | None,
+        content_type: str,
+        decode: Callable[[bytes], T],
+    ) -> T:
+        payload = await self._send(path, content_type, params)
+        result = decode(payload)
+        self.cache.put(key, payload).decoded[decode] = result
+        return result
+
+    async def _send(self, path: str, content_type: str, params: dict | None) -> bytes:
+        """Make a request, without using the cache."""
+        session = self.session
+
+        endpoint = _http.cache_key(path)
+        transport = self.transport
+        hedging = self.hedging
+
+        breaker = self.breaker
+
+        def instance_call(base_url: str) -> Awaitable[bytes]:
+            def attempt() -> Awaitable[bytes]:
+                return transport(path, content_type, session, params, base_url)
+
+            def call() -> Awaitable[bytes]:
+                return attempt() if hedging is None else hedging.run(endpoint, attempt)
+
+            if breaker is None:
+                return call()
+            host = urllib.parse.urlsplit(base_url).netloc
+            return breaker.run(f"{host}/{endpoint}", call)
+
+        def guarded_call() -> Awaitable[bytes]:
+            return self.instances.run(instance_call)
+
+        if self.scheduler is not None:
+            return await self.scheduler.run(guarded_call)
+        if self.limiter is not None:
+            return await self.limiter.run(guarded_call)
+        return await guarded_call()
+
+    def _revalidate(
+        self,
+        key: str,
+        path: str,
+        params: dict | None,
+        content_type: str,
+        decode: Callable[[bytes], T],
+    ) -> "asyncio.Task[T]":
+        """Request a response in the background, unless it is already being requested."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._revalidations.get(key)
+            # a request on another event loop cannot be awaited on this one
+            if task is not None and task.get_loop() is loop:
+                return task
+            task = loop.create_task(self._request(key, path, params, content_type, decode))
+            self._revalidations[key] = task
+        task.add_done_callback(lambda t: self._revalidation_done(key, t))
+        return task
+
+    def _revalidation_done(self, key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._revalidations.get(key) is task:
+                del self._revalidations[key]
+        if not task.cancelled():
+            task.exception()  # the stale response is kept on errors; TODO: log
+
+    @staticmethod
+    def _decoded(entry: CacheEntry, decode: Callable[[bytes], T]) -> T:
+        try:
+            return entry.decoded[decode]
+        except KeyError:
+            result = entry.decoded[decode] = decode(entry.payload)
+            return result
+
+    def __repr__(self) -> str:
+        """String representation that includes the cache."""
+        return f"{self.__class__.__name__}(cache={self.cache!r})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,471 @@
+"""
+Density grids decoded from distribution maps.
+
+The ``*/distribution/*`` endpoints return PNG images of the world in an equirectangular
+projection, where every pixel covers the same number of degrees of longitude and latitude.
+The dimensions of these maps are described by ``site_config_geodistribution``.
+
+This module decodes such a `PngResponse` into a `DistributionGrid` without any image library.
+If NumPy is installed, it is used to speed up decoding and the operations on grids;
+otherwise everything is done in pure Python.
+"""
+
+import math
+import struct
+import zlib
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from aio_taginfo.api.v4 import PngResponse
+from aio_taginfo.api.v4.site.config.geodistribution import SiteConfigGeodistribution
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+__all__ = (
+    "BoundingBox",
+    "DistributionGrid",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class BoundingBox:
+    """
+    Area on the map, in degrees.
+
+    A box with ``min_lon > max_lon`` crosses the antimeridian.
+
+    Attributes:
+        min_lon: western edge
+        min_lat: southern edge
+        max_lon: eastern edge
+        max_lat: northern edge
+    """
+
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+
+class DistributionGrid:
+    """
+    Density values of a distribution map, with one cell per pixel.
+
+    The density of a cell is the opacity of its pixel, which is a value between ``0.0``
+    (no objects in that area) and ``1.0``. For images without transparency, the brightness
+    of a pixel is used instead.
+
+    Cells are stored row by row, starting at the north-west corner of the map.
+
+    Attributes:
+        width: number of cells from west to east
+        height: number of cells from north to south
+        values: density values of all cells
+    """
+
+    __slots__ = ("height", "values", "width")
+
+    def __init__(self, width: int, height: int, values: array) -> None:
+        """Wrap the given density values."""
+        if width <= 0 or height <= 0 or len(values) != width * height:
+            msg = f"expected {width}x{height} values, got {len(values)}"
+            raise ValueError(msg)
+        self.width = width
+        self.height = height
+        self.values = values
+
+    @classmethod
+    def from_png(
+        cls,
+        png: PngResponse,
+        geodistribution: SiteConfigGeodistribution | None = None,
+    ) -> "DistributionGrid":
+        """
+        Decode a distribution map.
+
+        Args:
+            png: response of one of the ``*/distribution/*`` endpoints
+            geodistribution: if given, check that the map has the expected dimensions
+
+        Raises:
+            ValueError: if the image is not a PNG this decoder supports,
+                        or does not match the given dimensions
+        """
+        width, height, values = _decode_png(png.data)
+
+        if geodistribution is not None:
+            expected = {
+                (geodistribution.width, geodistribution.height),
+                (
+                    round(geodistribution.width * geodistribution.scale_image),
+                    round(geodistribution.height * geodistribution.scale_image),
+                ),
+            }
+            if (width, height) not in expected:
+                msg = f"unexpected map size {width}x{height}"
+                raise ValueError(msg)
+
+        return cls(width, height, values)
+
+    @property
+    def cell_width(self) -> float:
+        """Degrees of longitude covered by one cell."""
+        return 360.0 / self.width
+
+    @property
+    def cell_height(self) -> float:
+        """Degrees of latitude covered by one cell."""
+        return 180.0 / self.height
+
+    def value_at(self, lat: float, lon: float) -> float:
+        """Density of the cell that contains the given coordinate."""
+        x = min(math.floor((lon + 180.0) / self.cell_width), self.width - 1)
+        y = min(math.floor((90.0 - lat) / self.cell_height), self.height - 1)
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            msg = f"coordinate out of range: {lat}, {lon}"
+            raise ValueError(msg)
+        return self.values[y * self.width + x]
+
+    def cell_bounds(self, x: int, y: int) -> BoundingBox:
+        """Area covered by the cell in the given column and row."""
+        return BoundingBox(
+            min_lon=-180.0 + x * self.cell_width,
+            min_lat=90.0 - (y + 1) * self.cell_height,
+            max_lon=-180.0 + (x + 1) * self.cell_width,
+            max_lat=90.0 - y * self.cell_height,
+        )
+
+    def bbox(self, threshold: float = 0.0) -> BoundingBox | None:
+        """
+        Smallest area that contains all cells with a density above the given threshold.
+
+        Returns:
+            ``None`` if there is no such cell
+        """
+        if np is not None:
+            rows, cols = np.nonzero(self.to_numpy() > threshold)
+            if rows.size == 0:
+                return None
+            x0, x1, y0, y1 = int(cols.min()), int(cols.max()), int(rows.min()), int(rows.max())
+        else:
+            xs: list[int] = []
+            ys: list[int] = []
+            for y, row in enumerate(self._rows()):
+                cols_in_row = [x for x, v in enumerate(row) if v > threshold]
+                if cols_in_row:
+                    xs.extend((cols_in_row[0], cols_in_row[-1]))
+                    ys.append(y)
+            if not ys:
+                return None
+            x0, x1, y0, y1 = min(xs), max(xs), ys[0], ys[-1]
+
+        north_west = self.cell_bounds(x0, y0)
+        south_east = self.cell_bounds(x1, y1)
+        return BoundingBox(
+            min_lon=north_west.min_lon,
+            min_lat=south_east.min_lat,
+            max_lon=south_east.max_lon,
+            max_lat=north_west.max_lat,
+        )
+
+    def sum(self, region: BoundingBox | None = None) -> float:
+        """
+        Sum of the densities of all cells whose center lies in the given region.
+
+        Args:
+            region: area to sum up, or ``None`` for the whole map
+        """
+        if region is None:
+            return float(self.to_numpy().sum()) if np is not None else math.fsum(self.values)
+
+        if region.min_lon > region.max_lon:
+            west = BoundingBox(
+                min_lon=region.min_lon,
+                min_lat=region.min_lat,
+                max_lon=180.0,
+                max_lat=region.max_lat,
+            )
+            east = BoundingBox(
+                min_lon=-180.0,
+                min_lat=region.min_lat,
+                max_lon=region.max_lon,
+                max_lat=region.max_lat,
+            )
+            return self.sum(west) + self.sum(east)
+
+        x0 = max(math.ceil((region.min_lon + 180.0) / self.cell_width - 0.5), 0)
+        x1 = min(math.floor((region.max_lon + 180.0) / self.cell_width - 0.5), self.width - 1)
+        y0 = max(math.ceil((90.0 - region.max_lat) / self.cell_height - 0.5), 0)
+        y1 = min(math.floor((90.0 - region.min_lat) / self.cell_height - 0.5), self.height - 1)
+        if x0 > x1 or y0 > y1:
+            return 0.0
+
+        if np is not None:
+            return float(self.to_numpy()[y0 : y1 + 1, x0 : x1 + 1].sum())
+
+        w = self.width
+        return math.fsum(
+            chain.from_iterable(self.values[y * w + x0 : y * w + x1 + 1] for y in range(y0, y1 + 1))
+        )
+
+    def sums(self, regions: Mapping[str, BoundingBox]) -> dict[str, float]:
+        """Sum up the densities in several named regions; see `sum`."""
+        return {name: self.sum(region) for name, region in regions.items()}
+
+    def normalized_difference(self, other: "DistributionGrid") -> "DistributionGrid":
+        """
+        Compare this map to another one of the same size.
+
+        Every cell of the result is ``(a - b) / (a + b)`` for the densities ``a`` of this map,
+        and ``b`` of the other one. It is ``1.0`` where only this map has a non-zero density,
+        ``-1.0`` where only the other one does, and ``0.0`` where both are equal.
+
+        Raises:
+            ValueError: if the maps differ in size
+        """
+        if (self.width, self.height) != (other.width, other.height):
+            msg = "cannot compare maps of different sizes"
+            raise ValueError(msg)
+
+        if np is not None:
+            a, b = self.to_numpy(), other.to_numpy()
+            total = a + b
+            diff = np.divide(a - b, total, out=np.zeros_like(total), where=total != 0)
+            values = array("d", diff.tobytes())
+        else:
+            values = array(
+                "d",
+                (
+                    (a - b) / (a + b) if a + b else 0.0
+                    for a, b in zip(self.values, other.values, strict=True)
+                ),
+            )
+
+        return DistributionGrid(self.width, self.height, values)
+
+    def to_numpy(self) -> Any:  # noqa: ANN401
+        """
+        View of the values as a NumPy array of shape ``(height, width)``.
+
+        Raises:
+            ModuleNotFoundError: if NumPy is not installed
+        """
+        if np is None:
+            msg = "NumPy is not installed"
+            raise ModuleNotFoundError(msg)
+        return np.frombuffer(self.values, dtype=np.float64).reshape(self.height, self.width)
+
+    def _rows(self) -> Iterator[array]:
+        for y in range(self.height):
+            yield self.values[y * self.width : (y + 1) * self.width]
+
+    def __repr__(self) -> str:
+        """String representation that includes the size of the grid."""
+        return f"{self.__class__.__name__}(width={self.width}, height={self.height})"
+
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# number of samples per pixel for every PNG color type
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _decode_png(data: bytes) -> tuple[int, int, array]:  # noqa: C901, PLR0912
+    if not data.startswith(_PNG_MAGIC):
+        msg = "did not find PNG magic bytes"
+        raise ValueError(msg)
+
+    header = b""
+    palette = b""
+    transparency = b""
+    idat = []
+
+    pos = len(_PNG_MAGIC)
+    while pos + 8 <= len(data):
+        (length,) = struct.unpack_from(">I", data, pos)
+        if pos + 12 + length > len(data):
+            msg = "truncated PNG chunk"
+            raise ValueError(msg)
+        chunk_type = data[pos + 4 : pos + 8]
+        chunk = data[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack_from(">I", data, pos + 8 + length)
+        if zlib.crc32(chunk, zlib.crc32(chunk_type)) != crc:
+            msg = f"bad checksum in {chunk_type!r} chunk"
+            raise ValueError(msg)
+        pos += 12 + length
+
+        if chunk_type == b"IHDR":
+            header = chunk
+        elif chunk_type == b"PLTE":
+            palette = chunk
+        elif chunk_type == b"tRNS":
+            transparency = chunk
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+
+    if len(header) != 13 or not idat:
+        msg = "missing PNG header or image data"
+        raise ValueError(msg)
+
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", header)
+    if color_type not in _CHANNELS or interlace != 0:
+        msg = f"unsupported PNG (color type {color_type}, interlace {interlace})"
+        raise ValueError(msg)
+
+    channels = _CHANNELS[color_type]
+    bits_per_pixel = channels * bit_depth
+    stride = (width * bits_per_pixel + 7) // 8
+    raw = zlib.decompress(b"".join(idat))
+    if len(raw) < height * (stride + 1):
+        msg = "truncated PNG image data"
+        raise ValueError(msg)
+
+    pixels = _unfilter(raw, height, stride, max(1, bits_per_pixel // 8))
+
+    if channels == 1 and bit_depth <= 8:
+        lut = _sample_lut(color_type, bit_depth, palette, transparency)
+        return width, height, _expand_packed(pixels, width, height, stride, bit_depth, lut)
+
+    return (
+        width,
+        height,
+        _expand_channels(pixels, width, height, color_type, bit_depth, transparency),
+    )
+
+
+def _unfilter(raw: bytes, height: int, stride: int, bpp: int) -> bytearray:
+    out = bytearray(height * stride)
+    prev = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        filter_type = raw[pos]
+        line = bytearray(raw[pos + 1 : pos + 1 + stride])
+        pos += stride + 1
+
+        if filter_type == 1:  # Sub
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif filter_type == 2:  # Up
+            line = bytearray((a + b) & 0xFF for a, b in zip(line, prev, strict=True))
+        elif filter_type == 3:  # Average
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif filter_type == 4:  # Paeth
+            for i in range(stride):
+                a = line[i - bpp] if i >= bpp else 0
+                b = prev[i]
+                c = prev[i - bpp] if i >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                line[i] = (line[i] + pred) & 0xFF
+        elif filter_type != 0:
+            msg = f"unknown PNG filter type {filter_type}"
+            raise ValueError(msg)
+
+        out[y * stride : (y + 1) * stride] = line
+        prev = line
+    return out
+
+
+def _sample_lut(
+    color_type: int, bit_depth: int, palette: bytes, transparency: bytes
+) -> list[float]:
+    """Density for every possible sample value of a single-channel image."""
+    max_value = (1 << bit_depth) - 1
+
+    if color_type == 3:
+        n_colors = len(palette) // 3
+        if transparency:
+            alphas = [transparency[i] if i < len(transparency) else 255 for i in range(n_colors)]
+            lut = [a / 255.0 for a in alphas]
+        else:
+            lut = [max(palette[3 * i : 3 * i + 3]) / 255.0 for i in range(n_colors)]
+        return lut + [0.0] * (max_value + 1 - len(lut))
+
+    if transparency:
+        (transparent,) = struct.unpack(">H", transparency[:2])
+        return [0.0 if v == transparent else 1.0 for v in range(max_value + 1)]
+
+    return [v / max_value for v in range(max_value + 1)]
+
+
+def _expand_packed(
+    pixels: bytearray,
+    width: int,
+    height: int,
+    stride: int,
+    bit_depth: int,
+    lut: list[float],
+) -> array:
+    """Map packed single-channel samples to densities, one byte at a time."""
+    per_byte = 8 // bit_depth
+    mask = (1 << bit_depth) - 1
+    shifts = range(8 - bit_depth, -1, -bit_depth)
+    byte_lut = [tuple(lut[(b >> s) & mask] for s in shifts) for b in range(256)]
+
+    if np is not None:
+        table = np.array(byte_lut, dtype=np.float64)
+        grid = table[np.frombuffer(pixels, dtype=np.uint8)].reshape(height, stride * per_byte)
+        return array("d", np.ascontiguousarray(grid[:, :width]).tobytes())
+
+    values = array("d")
+    for y in range(height):
+        row = pixels[y * stride : (y + 1) * stride]
+        values.extend(list(chain.from_iterable(byte_lut[b] for b in row))[:width])
+    return values
+
+
+def _expand_channels(
+    pixels: bytearray,
+    width: int,
+    height: int,
+    color_type: int,
+    bit_depth: int,
+    transparency: bytes,
+) -> array:
+    """Map multi-channel or 16-bit samples to densities."""
+    channels = _CHANNELS[color_type]
+    n_samples = width * height * channels
+    if bit_depth == 16:
+        samples: Any = struct.unpack(f">{n_samples}H", bytes(pixels[: 2 * n_samples]))
+    elif bit_depth == 8:
+        samples = pixels
+    else:
+        msg = f"unsupported bit depth {bit_depth} for color type {color_type}"
+        raise ValueError(msg)
+
+    max_value = float((1 << bit_depth) - 1)
+    has_alpha = color_type in (4, 6)
+
+    if has_alpha:
+        alpha = samples[channels - 1 :: channels]
+        return array("d", (a / max_value for a in alpha))
+
+    if color_type == 0:
+        gray = samples[:n_samples]
+        if transparency:
+            (transparent,) = struct.unpack(">H", transparency[:2])
+            return array("d", (0.0 if v == transparent else 1.0 for v in gray))
+        return array("d", (v / max_value for v in gray))
+
+    red, green, blue = samples[0:n_samples:3], samples[1:n_samples:3], samples[2:n_samples:3]
+    rgb = zip(red, green, blue, strict=True)
+    if transparency:
+        transparent_rgb = struct.unpack(">3H", transparency[:6])
+        return array("d", (0.0 if px == transparent_rgb else 1.0 for px in rgb))
+    return array("d", (max(px) / max_value for px in rgb))
+
+
+__docformat__ = "google"
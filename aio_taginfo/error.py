@@ -1,6 +1,7 @@
 """Error types."""
 
 from dataclasses import dataclass
+from datetime import datetime
 
 import aiohttp
 import pydantic
@@ -11,21 +12,52 @@ class TaginfoError(Exception):
 
 
 @dataclass(kw_only=True, frozen=True)
-class TaginfoValueError(Exception):
+class TaginfoValueError(TaginfoError):
     """Failed to validate given parameters; did not call the taginfo API."""
 
     cause: pydantic.ValidationError
 
 
 @dataclass(kw_only=True, frozen=True)
-class TaginfoCallError(Exception):
+class TaginfoCallError(TaginfoError):
     """Failed HTTP call to the taginfo API."""
 
     cause: aiohttp.ClientError
 
 
 @dataclass(kw_only=True, frozen=True)
-class TaginfoValidationError(Exception):
+class TaginfoCircuitOpenError(TaginfoCallError):
+    """
+    Did not call the taginfo API, since too many recent calls to the same endpoint failed.
+
+    Attributes:
+        endpoint: the endpoint that is not called
+        retry_after: seconds until calls to the endpoint are tried again
+        cause: the error of the last failed call, if there was one
+    """
+
+    endpoint: str
+    retry_after: float
+    cause: aiohttp.ClientError | None = None  # type: ignore[assignment]
+
+
+@dataclass(kw_only=True, frozen=True)
+class TaginfoDataChangedError(TaginfoError):
+    """
+    Taginfo's data changed during a download, every time it was tried.
+
+    Responses with different ``data_until`` dates are not combined, since they would
+    mix two versions of the data.
+
+    Attributes:
+        data_until: the dates of the responses of the last attempt
+    """
+
+    data_until: tuple[datetime, ...]
+
+
+@dataclass(kw_only=True, frozen=True)
+class TaginfoValidationError(TaginfoError):
     """
     Failed to validate the response of the taginfo API.
 
@@ -0,0 +1,325 @@
+"""
+Resumable bulk export of key data.
+
+`export_keys` fetches the overview, statistics, combinations and projects of many keys,
+and appends every response as one line to a newline-delimited JSON file per endpoint:
+
+```
+<directory>/key_overview.ndjson
+<directory>/key_stats.ndjson
+<directory>/key_combinations.ndjson
+<directory>/key_projects.ndjson
+<directory>/errors.ndjson
+<directory>/checkpoint.json
+```
+
+The checkpoint is written periodically, and records which keys are done, as well as the size
+of every file at that point. Running the export again with the same directory truncates
+the files to those sizes, and skips all keys that were already exported. A key is only
+considered done once all of its responses were written, so interrupting an export at any
+point never leaves partial or duplicate lines behind.
+
+The same export is available on the command line, where all keys in the database
+are exported unless a file with keys is given:
+
+```
+python -m aio_taginfo export <directory> [--keys keys.txt]
+```
+
+When exporting with a `aio_taginfo.client.Client` that has a
+`aio_taginfo.scheduler.Scheduler`, all requests have `aio_taginfo.scheduler.Priority.BULK`.
+
+Please keep the general rules of the taginfo API in mind before exporting large parts
+of its database, and consider using the database downloads instead.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from aio_taginfo import _http
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.key import combinations, overview, projects, stats
+from aio_taginfo.client import Client
+from aio_taginfo.error import (
+    TaginfoCallError,
+    TaginfoCircuitOpenError,
+    TaginfoValidationError,
+    TaginfoValueError,
+)
+from aio_taginfo.scheduler import Priority, priority
+
+import aiohttp
+from aiohttp import ClientSession
+from pydantic import TypeAdapter
+
+
+__all__ = (
+    "ENDPOINTS",
+    "ExportProgress",
+    "export_keys",
+)
+
+
+_Call = Callable[..., Awaitable[Any]]
+
+_CALLS: dict[str, tuple[_Call, TypeAdapter]] = {
+    "key_overview": (overview.call, TypeAdapter(Response[overview.KeyOverview])),
+    "key_stats": (stats.call, TypeAdapter(Response[list[stats.KeyStats]])),
+    "key_combinations": (
+        combinations.call,
+        TypeAdapter(Response[list[combinations.KeyCombination]]),
+    ),
+    "key_projects": (projects.call, TypeAdapter(Response[list[projects.KeyProject]])),
+}
+
+ENDPOINTS: tuple[str, ...] = tuple(_CALLS)
+"""Names of the endpoints that can be exported for every key."""
+
+_CHECKPOINT_FILE = "checkpoint.json"
+_ERRORS_FILE = "errors"
+
+
+@dataclass(kw_only=True)
+class ExportProgress:
+    """
+    Statistics of a running or finished export.
+
+    Attributes:
+        keys_done: Number of keys exported in this run
+        keys_failed: Number of keys that could not be exported in this run
+        keys_skipped: Number of keys skipped, since they were exported in a previous run
+        requests: Number of requests made, including retries
+        retries: Number of requests that were retried
+        elapsed: Seconds since the export started
+    """
+
+    keys_done: int = 0
+    keys_failed: int = 0
+    keys_skipped: int = 0
+    requests: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def keys_per_second(self) -> float:
+        """Throughput of exported keys."""
+        return self.keys_done / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        """Throughput of requests."""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        """Summary in a single line."""
+        return (
+            f"{self.keys_done} keys done, {self.keys_failed} failed, "
+            f"{self.keys_skipped} skipped, {self.requests} requests "
+            f"({self.retries} retries) in {self.elapsed:.1f}s: "
+            f"{self.keys_per_second:.2f} keys/s, {self.requests_per_second:.2f} requests/s"
+        )
+
+
+@dataclass(kw_only=True)
+class _Checkpoint:
+    # keys in the order they were done, which is kept as is in the file, instead of
+    # sorting all of them every time a checkpoint is saved
+    done: dict[str, None] = field(default_factory=dict)
+    offsets: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, directory: Path) -> "_Checkpoint":
+        path = directory / _CHECKPOINT_FILE
+        if not path.exists():
+            return cls()
+        obj = json.loads(path.read_text(encoding="utf-8"))
+        return cls(done=dict.fromkeys(obj["done"]), offsets=dict(obj["offsets"]))
+
+    def save(self, directory: Path, files: dict[str, BinaryIO]) -> None:
+        for name, f in files.items():
+            f.flush()
+            os.fsync(f.fileno())
+            self.offsets[name] = f.tell()
+
+        obj = {"done": list(self.done), "offsets": self.offsets}
+        tmp = directory / f"{_CHECKPOINT_FILE}.tmp"
+        tmp.write_text(json.dumps(obj), encoding="utf-8")
+        tmp.replace(directory / _CHECKPOINT_FILE)
+
+
+class _RateLimiter:
+    """Spaces out requests evenly, and lets all of them back off together."""
+
+    def __init__(self, rate: float | None) -> None:
+        self._interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        wait = self._next - now
+        self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def defer(self, delay: float) -> None:
+        now = asyncio.get_running_loop().time()
+        self._next = max(self._next, now + delay)
+
+
+def _retry_delay(err: TaginfoCallError, attempt: int) -> float | None:
+    """Seconds to wait before retrying, or ``None`` if the error is permanent."""
+    if isinstance(err, TaginfoCircuitOpenError):
+        return err.retry_after  # any earlier retry would fail right away
+    if not _http.is_overload(err):
+        return None
+    cause = err.cause
+    if isinstance(cause, aiohttp.ClientResponseError) and cause.headers:
+        retry_after = cause.headers.get("Retry-After")
+        if retry_after is not None and retry_after.strip().isdigit():
+            return float(retry_after)
+    return float(min(2**attempt, 60))
+
+
+async def _aiter(keys: Iterable[str] | AsyncIterable[str]) -> AsyncIterable[str]:
+    if isinstance(keys, AsyncIterable):
+        async for key in keys:
+            yield key
+    else:
+        for key in keys:
+            yield key
+
+
+async def export_keys(  # noqa: C901, PLR0915
+    keys: Iterable[str] | AsyncIterable[str],
+    directory: str | os.PathLike,
+    endpoints: Iterable[str] = ENDPOINTS,
+    concurrency: int = 4,
+    rate: float | None = 2.0,
+    max_retries: int = 5,
+    checkpoint_every: int = 100,
+    on_progress: Callable[[ExportProgress], None] | None = None,
+    session: ClientSession | Client | None = None,
+) -> ExportProgress:
+    """
+    Export data for the given keys, or resume a previous export.
+
+    Args:
+        keys: keys to export
+        directory: output directory, which may contain a previous export
+        endpoints: the subset of `ENDPOINTS` to export
+        concurrency: maximum number of requests in flight
+        rate: maximum number of requests per second, or ``None`` for no limit
+        max_retries: maximum number of retries per request after rate limiting (HTTP 429),
+                     server or connection errors
+        checkpoint_every: save a checkpoint after this many keys
+        on_progress: called with the current progress after every checkpoint
+        session: request client session, which is used for all requests
+
+    Returns:
+        statistics of this run
+    """
+    names = tuple(endpoints)
+    unknown = set(names) - set(_CALLS)
+    if unknown:
+        msg = f"unknown endpoints: {sorted(unknown)}"
+        raise ValueError(msg)
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    checkpoint = _Checkpoint.load(directory)
+
+    files: dict[str, BinaryIO] = {}
+    for name in (*names, _ERRORS_FILE):
+        ndjson = (directory / f"{name}.ndjson").open("ab")
+        ndjson.truncate(checkpoint.offsets.get(name, 0))
+        ndjson.seek(0, os.SEEK_END)
+        files[name] = ndjson
+
+    progress = ExportProgress()
+    started = time.monotonic()
+    limiter = _RateLimiter(rate)
+    queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=2 * concurrency)
+
+    ephemeral_session = not session
+    session = session or ClientSession()
+
+    def save_checkpoint() -> None:
+        checkpoint.save(directory, files)
+        progress.elapsed = time.monotonic() - started
+        if on_progress:
+            on_progress(progress)
+
+    def write_line(name: str, obj: dict) -> None:
+        files[name].write(json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    async def fetch(name: str, key: str) -> Any:  # noqa: ANN401
+        func, _ = _CALLS[name]
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            progress.requests += 1
+            try:
+                return await func(key=key, session=session)
+            except TaginfoCallError as err:
+                delay = _retry_delay(err, attempt)
+                if delay is None or attempt >= max_retries:
+                    raise
+                limiter.defer(delay)
+                progress.retries += 1
+                attempt += 1
+
+    async def export_key(key: str) -> None:
+        lines = {}
+        for name in names:
+            try:
+                response = await fetch(name, key)
+            except (TaginfoCallError, TaginfoValidationError, TaginfoValueError) as err:
+                write_line(_ERRORS_FILE, {"key": key, "endpoint": name, "error": repr(err)})
+                progress.keys_failed += 1
+                return
+            _, type_adapter = _CALLS[name]
+            lines[name] = {"key": key, "response": type_adapter.dump_python(response, mode="json")}
+
+        for name, line in lines.items():
+            write_line(name, line)
+        checkpoint.done[key] = None
+        progress.keys_done += 1
+        if progress.keys_done % checkpoint_every == 0:
+            save_checkpoint()
+
+    async def produce() -> None:
+        async for key in _aiter(keys):
+            if key in checkpoint.done:
+                progress.keys_skipped += 1
+                continue
+            await queue.put(key)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def work() -> None:
+        with priority(Priority.BULK):
+            while (key := await queue.get()) is not None:
+                await export_key(key)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(concurrency):
+                tg.create_task(work())
+    finally:
+        save_checkpoint()
+        for f in files.values():
+            f.close()
+        if ephemeral_session:
+            await session.close()
+
+    return progress
+
+
+__docformat__ = "google"
@@ -0,0 +1,163 @@
+"""
+Hedged requests, which cut the tail latency of a `aio_taginfo.client.Client`.
+
+If a request takes longer than most requests to the same endpoint, a second, identical
+request is made, and whichever response arrives first is used. Since the delay is a high
+percentile of recent latencies, only a small fraction of requests is hedged; a budget
+makes sure that this stays true when the server is slow for every request.
+
+```python
+client = Client(hedging=Hedging(percentile=0.95, budget=0.05))
+```
+
+All endpoints are idempotent GET requests, so making a request twice is safe.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+
+__all__ = ("Hedging",)
+
+
+T = TypeVar("T")
+
+
+class Hedging:
+    """
+    Policy for hedged requests, and the latencies it learned from.
+
+    Attributes:
+        requests: number of requests, not counting hedged ones
+        hedged: number of requests that were hedged
+    """
+
+    __slots__ = ("_latencies", "_lock", "_tokens", "budget", "burst", "hedged", "initial_delay",
+                 "max_delay", "min_delay", "min_samples", "percentile", "requests",
+                 "window")  # fmt: skip
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Create a policy.
+
+        Args:
+            percentile: requests are hedged after this percentile of recent latencies
+            budget: maximum number of hedged requests per request, on average
+            burst: maximum number of hedged requests in a row, when the budget was not used
+            initial_delay: seconds after which requests are hedged, until enough latencies
+                           of an endpoint are known
+            min_delay: minimum number of seconds after which requests are hedged
+            max_delay: maximum number of seconds after which requests are hedged
+            window: number of recent latencies per endpoint that are remembered
+            min_samples: number of latencies needed for an endpoint's percentile
+        """
+        assert 0.0 < percentile < 1.0, "'percentile' must be between 0 and 1"
+        assert budget >= 0.0, "'budget' cannot be negative"
+        assert 0.0 <= min_delay <= max_delay, "need 0 <= 'min_delay' <= 'max_delay'"
+        assert 0 < min_samples <= window, "need 0 < 'min_samples' <= 'window'"
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedged = 0
+        self._tokens = burst
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> float:
+        """Seconds after which a request to the given endpoint is hedged."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        delay = ordered[min(int(self.percentile * len(ordered)), len(ordered) - 1)]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    async def run(self, endpoint: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a request, and hedge it if it takes too long.
+
+        Args:
+            endpoint: the endpoint whose latencies determine the delay
+            attempt: makes the request; called a second time to hedge it
+
+        Raises:
+            the error of the last failed attempt, if all of them failed
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.budget, self.burst)
+
+        # the latency of the response that is used, from the start of its own request,
+        # since a hedged request that wins was started later than the first one
+        started: dict[asyncio.Future[T], float] = {}
+
+        def start() -> asyncio.Future[T]:
+            task = asyncio.ensure_future(attempt())
+            started[task] = loop.time()
+            return task
+
+        pending = {start()}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.delay(endpoint))
+            if not done and self._take_token():
+                pending.add(start())
+
+            error: BaseException | None = None
+            while True:
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self._record(endpoint, loop.time() - started[task])
+                        return task.result()
+                if not pending:
+                    assert error is not None
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.hedged += 1
+            return True
+
+    def _record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of (hedged) requests."""
+        return f"{self.__class__.__name__}(requests={self.requests}, hedged={self.hedged})"
+
+
+__docformat__ = "google"
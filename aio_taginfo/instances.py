@@ -0,0 +1,204 @@
+"""
+Load balancing across equivalent taginfo instances, like regional servers or mirrors.
+
+A `aio_taginfo.client.Client` with `Instances` sends every request to the instance with
+the lowest expected latency, which is the average of its recent response times, multiplied
+by the number of its requests in flight, and divided by its weight. A preferred instance
+with a higher weight gets all requests, until it is so loaded that another one would be
+faster:
+
+```python
+instances = Instances([
+    Instance(base_url="https://taginfo.example.com/api/4/", weight=4.0),
+    Instance(base_url="https://taginfo.openstreetmap.org/api/4/"),
+])
+client = Client(instances=instances)
+client.start_health_checks(interval=30.0)
+```
+
+If an instance fails with HTTP 429, a server or a connection error, it is considered
+unhealthy, and the request is made again with the next instance. Unhealthy instances
+are only used again after they passed a health check, or if all instances are unhealthy.
+
+Cached responses are shared by all instances, since they are keyed by the request path and
+parameters only.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+from aio_taginfo import _http
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError
+
+
+__all__ = (
+    "Instance",
+    "Instances",
+)
+
+
+T = TypeVar("T")
+
+
+@dataclass(kw_only=True)
+class Instance:
+    """
+    A taginfo server, and what a client learned about it.
+
+    Attributes:
+        base_url: the URL of its API, like ``"https://taginfo.openstreetmap.org/api/4/"``
+        weight: how much this instance is preferred over the others
+        latency: moving average of response times in seconds, or ``None`` if not known yet
+        in_flight: number of requests in flight
+        healthy: whether the last request or health check succeeded
+        failed_at: time of the last failure, from ``time.monotonic()``
+    """
+
+    base_url: str
+    weight: float = 1.0
+    latency: float | None = None
+    in_flight: int = 0
+    healthy: bool = True
+    failed_at: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the instance."""
+        assert self.base_url.endswith("/api/4/"), "'base_url' must end with '/api/4/'"
+        assert self.weight > 0, "'weight' must be positive"
+
+
+class Instances:
+    """Equivalent taginfo instances, and a policy to choose between them."""
+
+    __slots__ = ("_instances", "_lock", "initial_latency", "smoothing")
+
+    def __init__(
+        self,
+        instances: Iterable[Instance | str],
+        initial_latency: float = 0.5,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Create a set of instances that are all healthy.
+
+        Args:
+            instances: instances, or the base URLs of instances with the same weight
+            initial_latency: expected response time in seconds of an instance without requests
+            smoothing: weight of the latest response time in the average of an instance
+        """
+        self._instances = [Instance(base_url=i) if isinstance(i, str) else i for i in instances]
+        assert self._instances, "need at least one instance"
+        assert len({i.base_url for i in self._instances}) == len(self._instances), (
+            "duplicate instances"
+        )
+        assert initial_latency > 0, "'initial_latency' must be positive"
+        assert 0.0 < smoothing <= 1.0, "'smoothing' must be in (0, 1]"
+        self.initial_latency = initial_latency
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[Instance]:
+        """Iterate over all instances."""
+        return iter(self._instances)
+
+    def __len__(self) -> int:
+        """Number of instances."""
+        return len(self._instances)
+
+    def _cost(self, instance: Instance) -> float:
+        latency = self.initial_latency if instance.latency is None else instance.latency
+        return latency * (instance.in_flight + 1) / instance.weight
+
+    def ranked(self) -> list[Instance]:
+        """
+        All instances in the order in which they are tried for the next request.
+
+        Healthy instances come first, ordered by their expected latency; unhealthy instances
+        come last, ordered by the time since they last failed.
+        """
+        healthy = sorted((i for i in self._instances if i.healthy), key=self._cost)
+        unhealthy = sorted(
+            (i for i in self._instances if not i.healthy), key=lambda i: i.failed_at or 0.0
+        )
+        return healthy + unhealthy
+
+    async def run(self, attempt: Callable[[str], Awaitable[T]]) -> T:
+        """
+        Make a request, and fail over to other instances if it fails.
+
+        Args:
+            attempt: makes the request to the instance with the given base URL
+
+        Raises:
+            TaginfoCircuitOpenError: if all instances failed, and a circuit breaker did not let
+                                     the request through to at least one of them; this is the
+                                     one that will let requests through again first
+            TaginfoCallError: the error of the last instance, if all of them failed,
+                              or the error of an instance that was not overloaded
+        """
+        error: TaginfoCallError | None = None
+        circuit_open: TaginfoCircuitOpenError | None = None
+        for instance in self.ranked():
+            try:
+                return await self._attempt(instance, attempt)
+            except TaginfoCircuitOpenError as err:
+                # a circuit breaker did not let the request through
+                if circuit_open is None or err.retry_after < circuit_open.retry_after:
+                    circuit_open = err
+            except TaginfoCallError as err:
+                if not _http.is_overload(err):
+                    raise
+                error = err
+        # so that a client can still answer with a stale response
+        if circuit_open is not None:
+            raise circuit_open
+        assert error is not None
+        raise error
+
+    async def check(self, probe: Callable[[str], Awaitable[object]]) -> None:
+        """
+        Check all instances at once, and update whether they are healthy.
+
+        Args:
+            probe: makes a small request to the instance with the given base URL
+        """
+        await asyncio.gather(
+            *(self._attempt(i, probe) for i in self._instances), return_exceptions=True
+        )
+
+    async def _attempt(self, instance: Instance, attempt: Callable[[str], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        with self._lock:
+            instance.in_flight += 1
+        try:
+            result = await attempt(instance.base_url)
+        except TaginfoCircuitOpenError:
+            raise
+        except TaginfoCallError as err:
+            if _http.is_overload(err):
+                instance.healthy = False
+                instance.failed_at = time.monotonic()
+            raise
+        finally:
+            with self._lock:
+                instance.in_flight -= 1
+
+        latency = time.monotonic() - started
+        with self._lock:
+            if instance.latency is None:
+                instance.latency = latency
+            else:
+                instance.latency += self.smoothing * (latency - instance.latency)
+            instance.healthy = True
+        return result
+
+    def __repr__(self) -> str:
+        """String representation that includes all instances."""
+        return f"{self.__class__.__name__}({self._instances!r})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,209 @@
+"""
+Adaptive concurrency limit, which follows how many requests the server can handle right now.
+
+The limit is adjusted with additive increase and multiplicative decrease (AIMD):
+
+* Every request that succeeds with a latency close to the lowest recent one increases
+  the limit a little, by about one per ``limit`` requests.
+* If a request fails because the server is overloaded (HTTP 429, 5xx or connection errors),
+  or the latency rises well above the lowest latency seen recently, the limit is multiplied
+  by ``backoff``. Other requests that were already in flight at that point do not decrease it
+  any further.
+
+```python
+client = Client(limiter=AdaptiveConcurrency(initial_limit=4, max_limit=32))
+
+# or, to also order requests by priority:
+client = Client(scheduler=Scheduler(concurrency=AdaptiveConcurrency()))
+```
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from aio_taginfo import _http
+from aio_taginfo.error import TaginfoCallError
+
+
+__all__ = ("AdaptiveConcurrency",)
+
+
+T = TypeVar("T")
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that is adjusted to the observed latencies and errors.
+
+    Attributes:
+        limit: the current limit; the number of requests in flight is its integer part
+        increases: number of times the limit was increased
+        decreases: number of times the limit was decreased
+    """
+
+    __slots__ = ("_epoch", "_in_flight", "_latencies", "_latency", "_limit", "_listeners",
+                 "_waiting", "backoff", "decreases", "increases", "latency_tolerance", "max_limit",
+                 "min_limit", "smoothing")  # fmt: skip
+
+    def __init__(
+        self,
+        initial_limit: float = 4.0,
+        min_limit: float = 1.0,
+        max_limit: float = 64.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        window: int = 100,
+    ) -> None:
+        """
+        Create a limit.
+
+        Args:
+            initial_limit: the limit before any request was made
+            min_limit: the limit is never decreased below this
+            max_limit: the limit is never increased above this
+            backoff: factor by which the limit is decreased
+            latency_tolerance: decrease the limit when the average latency exceeds the lowest
+                               recent latency by this factor
+            smoothing: weight of the latest latency in the average latency
+            window: number of recent latencies of which the lowest one is the baseline
+        """
+        assert 1.0 <= min_limit <= initial_limit <= max_limit, (
+            "need 1 <= 'min_limit' <= 'initial_limit' <= 'max_limit'"
+        )
+        assert 0.0 < backoff < 1.0, "'backoff' must be between 0 and 1"
+        assert latency_tolerance > 1.0, "'latency_tolerance' must be greater than 1"
+        assert 0.0 < smoothing <= 1.0, "'smoothing' must be in (0, 1]"
+        assert window > 0, "'window' must be positive"
+        self._limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.increases = 0
+        self.decreases = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._latency: float | None = None
+        self._epoch = 0
+        self._in_flight = 0
+        self._waiting: deque[asyncio.Future[None]] = deque()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def limit(self) -> float:
+        """The current limit; the number of requests in flight is its integer part."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: float) -> None:
+        capacity = self.capacity
+        self._limit = value
+        if self.capacity > capacity:
+            self._dispatch()
+            for listener in self._listeners:
+                listener()
+
+    def on_capacity_increase(self, listener: Callable[[], None]) -> None:
+        """
+        Call a function whenever the capacity increases.
+
+        This lets `aio_taginfo.scheduler.Scheduler`, which enforces the limit itself,
+        start waiting requests without waiting for another request to complete.
+        """
+        self._listeners.append(listener)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight that were made with `run()`."""
+        return self._in_flight
+
+    @property
+    def capacity(self) -> int:
+        """Number of requests that may be in flight."""
+        return int(self.limit)
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a call once fewer requests than the limit are in flight.
+
+        Args:
+            call: makes the request
+        """
+        if self._in_flight >= self.capacity or self._waiting:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiting.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()  # the slot was already given to this request
+                else:
+                    self._waiting.remove(waiter)
+                raise
+        else:
+            self._in_flight += 1
+
+        try:
+            return await self.measure(call)
+        finally:
+            self._release()
+
+    async def measure(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a call without waiting, and adjust the limit to its outcome.
+
+        This is used by `aio_taginfo.scheduler.Scheduler`, which enforces the limit itself.
+
+        Args:
+            call: makes the request
+        """
+        epoch = self._epoch
+        started = time.monotonic()
+        try:
+            result = await call()
+        except TaginfoCallError as err:
+            if _http.is_overload(err):
+                self._decrease(epoch)
+            raise
+        self._record(time.monotonic() - started, epoch)
+        return result
+
+    def _record(self, latency: float, epoch: int) -> None:
+        self._latencies.append(latency)
+        average = latency if self._latency is None else self._latency
+        self._latency = average = (1 - self.smoothing) * average + self.smoothing * latency
+
+        if average > self.latency_tolerance * min(self._latencies):
+            self._decrease(epoch)
+        else:
+            self.limit = min(self.limit + 1.0 / self.limit, self.max_limit)
+            self.increases += 1
+
+    def _decrease(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            return  # the request was made before the last decrease
+        self._epoch += 1
+        self.limit = max(self.limit * self.backoff, self.min_limit)
+        self.decreases += 1
+        # latencies from before the decrease would trigger another one
+        self._latency = None
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._waiting and self._in_flight < self.capacity:
+            self._in_flight += 1
+            self._waiting.popleft().set_result(None)
+
+    def __repr__(self) -> str:
+        """String representation that includes the current limit."""
+        return f"{self.__class__.__name__}(limit={self.limit:.2f}, in_flight={self._in_flight})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,6 @@
+"""
+Local indexes that answer queries without calling the taginfo API.
+
+These are built from bulk downloads of paginated endpoints, and are meant for
+applications that would otherwise make the same kind of request over and over.
+"""
@@ -0,0 +1,85 @@
+"""Bulk downloads whose responses must all come from the same version of taginfo's data."""
+
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import Any, TypeVar
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.client import _REVALIDATING
+from aio_taginfo.error import TaginfoDataChangedError
+
+
+__all__ = (
+    "download_consistent",
+    "has_newer_data",
+)
+
+
+T = TypeVar("T")
+
+# a download is repeated if the data changed between its first and last request
+_MAX_DOWNLOAD_ATTEMPTS = 3
+
+
+async def download_consistent(
+    attempt: Callable[[], Awaitable[tuple[T, Iterable[datetime]]]],
+    max_attempts: int = _MAX_DOWNLOAD_ATTEMPTS,
+    *,
+    revalidate: bool = False,
+) -> tuple[T, datetime]:
+    """
+    Make all requests of a download, and repeat them until their responses have the same date.
+
+    Repeated attempts do not use the responses that a `aio_taginfo.client.Client` cached,
+    since those may be the outdated ones; their new responses replace them in the cache.
+
+    Args:
+        attempt: makes all requests, and returns the result and the ``data_until`` of
+                 every response
+        max_attempts: maximum number of attempts
+        revalidate: do not use cached responses in the first attempt either, like when
+                    it is known that taginfo has newer data than the cached responses
+
+    Raises:
+        TaginfoDataChangedError: if the responses still had different dates in the last attempt
+        TaginfoError
+
+    Returns:
+        the result of the first consistent attempt, and the date of its data
+    """
+    assert max_attempts > 0, "'max_attempts' must be positive"
+    data_until: set[datetime] = set()
+    for n in range(max_attempts):
+        token = _REVALIDATING.set(True) if revalidate or n > 0 else None
+        try:
+            result, dates = await attempt()
+        finally:
+            if token is not None:
+                _REVALIDATING.reset(token)
+        data_until = set(dates)
+        assert data_until, "a download needs at least one response"
+        if len(data_until) == 1:
+            return result, data_until.pop()
+    raise TaginfoDataChangedError(data_until=tuple(sorted(data_until)))
+
+
+async def has_newer_data(latest: Awaitable[Response[Any]], data_until: datetime | None) -> bool:
+    """
+    Check if taginfo has imported other data than that of a previous download.
+
+    The request is made even if a `aio_taginfo.client.Client` cached its response,
+    which would be as old as the previous download.
+
+    Args:
+        latest: a small request, like the first result of the downloaded endpoint
+        data_until: the date of the data of the previous download, or ``None`` if there was none
+    """
+    token = _REVALIDATING.set(True)
+    try:
+        response = await latest
+    finally:
+        _REVALIDATING.reset(token)
+    return response.data_until != data_until
+
+
+__docformat__ = "google"
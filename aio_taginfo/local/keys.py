@@ -0,0 +1,218 @@
+"""Local index of all keys, for autocompletion and other frequent lookups."""
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from itertools import groupby
+from operator import itemgetter
+
+from aio_taginfo.api.v4.keys import all as keys_all
+from aio_taginfo.api.v4.keys.all import KeyListItem
+from aio_taginfo.client import Client
+
+from aiohttp import ClientSession
+
+
+__all__ = (
+    "KeyIndex",
+    "download_counts",
+)
+
+
+# prefixes up to this length have precomputed ranges and most used keys
+_PREFIX_LEN = 2
+_PREFIX_TOP = 32
+
+# separates keys in the string used for substring search
+_SEP = "\0"
+
+
+async def download_counts(
+    rp: int = 1000,
+    concurrency: int = 2,
+    session: ClientSession | Client | None = None,
+) -> dict[str, int]:
+    """
+    Download the number of uses of every key in the database.
+
+    Args:
+        rp: number of keys to request per page
+        concurrency: maximum number of pages that are requested at the same time
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    counts: dict[str, int] = {}
+    async for page in keys_all.call_pages(rp=rp, concurrency=concurrency, session=session):
+        counts.update((item.key, item.count_all) for item in page.data)
+    return counts
+
+
+class KeyIndex:
+    """
+    Immutable index of keys and their number of uses.
+
+    Keys are kept in a sorted list with a parallel array of counts, so that prefix queries
+    are a binary search. For short prefixes, the range of matching keys and the most used ones
+    among them are precomputed. Substring queries scan a single string of all keys.
+
+    All queries that return multiple keys order them by their count, from most used down.
+    """
+
+    __slots__ = ("_blob", "_counts", "_keys", "_offsets", "_prefixes", "_rank", "_ranked")
+
+    def __init__(self, counts: Mapping[str, int] | Iterable[tuple[str, int]]) -> None:
+        """
+        Build an index.
+
+        Args:
+            counts: the number of uses of every key
+        """
+        pairs = sorted(dict(counts).items())
+        n = len(pairs)
+
+        self._keys: list[str] = [key for key, _ in pairs]
+        self._counts = array("q", (count for _, count in pairs))
+
+        # indices of all keys, ordered by count (descending), then key
+        self._ranked = array("l", sorted(range(n), key=lambda i: -self._counts[i]))
+        self._rank = array("l", [0]) * n
+        for rank, i in enumerate(self._ranked):
+            self._rank[i] = rank
+
+        self._blob = _SEP.join(self._keys)
+        self._offsets = array("q")
+        offset = 0
+        for key in self._keys:
+            self._offsets.append(offset)
+            offset += len(key) + len(_SEP)
+
+        self._prefixes: dict[str, tuple[int, int, tuple[int, ...]]] = {}
+        for length in range(1, _PREFIX_LEN + 1):
+            lo = 0
+            for prefix, group in groupby(self._keys, key=itemgetter(slice(length))):
+                hi = lo + sum(1 for _ in group)
+                if len(prefix) == length:
+                    top = tuple(heapq.nsmallest(_PREFIX_TOP, range(lo, hi), key=self._rank_of))
+                    self._prefixes[prefix] = (lo, hi, top)
+                lo = hi
+
+    @classmethod
+    def from_items(cls, items: Iterable[KeyListItem]) -> "KeyIndex":
+        """Build an index from the results of the ``keys/all`` endpoint."""
+        return cls((item.key, item.count_all) for item in items)
+
+    @classmethod
+    async def download(
+        cls,
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> "KeyIndex":
+        """
+        Build an index of all keys in the database.
+
+        Args:
+            rp: number of keys to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoError
+        """
+        return cls(await download_counts(rp=rp, concurrency=concurrency, session=session))
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the given key is in the index."""
+        return isinstance(key, str) and self._find(key) is not None
+
+    def count(self, key: str) -> int | None:
+        """
+        Number of uses of the given key.
+
+        Returns:
+            ``None`` if the key is not in the index
+        """
+        i = self._find(key)
+        return None if i is None else self._counts[i]
+
+    def top(self, n: int = 10) -> list[str]:
+        """The ``n`` most used keys."""
+        return [self._keys[i] for i in self._ranked[:n]]
+
+    def prefix(self, prefix: str, limit: int | None = 10) -> list[str]:
+        """
+        Keys that start with the given prefix.
+
+        Args:
+            prefix: the start of matching keys
+            limit: maximum number of keys to return, or ``None`` for all of them
+        """
+        if not prefix:
+            return self.top(len(self._keys) if limit is None else limit)
+
+        entry = self._prefixes.get(prefix[:_PREFIX_LEN])
+        if entry is None:
+            return []
+        lo, hi, top = entry
+
+        if len(prefix) <= _PREFIX_LEN:
+            if limit is not None and limit <= len(top):
+                return [self._keys[i] for i in top[:limit]]
+        else:
+            lo = bisect_left(self._keys, prefix, lo, hi)
+            hi = bisect_right(self._keys, prefix, lo, hi, key=itemgetter(slice(len(prefix))))
+
+        return self._most_used(range(lo, hi), limit)
+
+    def substring(self, query: str, limit: int | None = 10) -> list[str]:
+        """
+        Keys that contain the given string.
+
+        Args:
+            query: the string that matching keys contain
+            limit: maximum number of keys to return, or ``None`` for all of them
+        """
+        if not query:
+            return self.prefix(query, limit)
+        if _SEP in query:
+            return []
+
+        matches = []
+        blob, offsets = self._blob, self._offsets
+        pos = blob.find(query)
+        while pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            matches.append(i)
+            if i + 1 >= len(offsets):
+                break
+            pos = blob.find(query, offsets[i + 1])
+
+        return self._most_used(matches, limit)
+
+    def _find(self, key: str) -> int | None:
+        i = bisect_left(self._keys, key)
+        return i if i < len(self._keys) and self._keys[i] == key else None
+
+    def _rank_of(self, i: int) -> int:
+        return self._rank[i]
+
+    def _most_used(self, indices: Iterable[int], limit: int | None) -> list[str]:
+        if limit is None:
+            ordered = sorted(indices, key=self._rank_of)
+        else:
+            ordered = heapq.nsmallest(limit, indices, key=self._rank_of)
+        return [self._keys[i] for i in ordered]
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of keys."""
+        return f"{self.__class__.__name__}(len={len(self)})"
+
+
+__docformat__ = "google"
@@ -0,0 +1,345 @@
+"""
+Local replacement for the ``key/projects``, ``tag/projects`` and ``project/tags`` endpoints.
+
+Taginfo lists the keys and tags of every project that registered with it. These lists
+are small enough to download all at once: one ``projects/all`` request, and one
+``project/tags`` request per project. `ProjectTagStore` keeps them in a SQLite database
+that is indexed by key, value and project, and answers the same questions as the endpoints
+above with a local query:
+
+```python
+store = await ProjectTagStore.download("projects.sqlite", session=client)
+store.tag_projects("highway", "residential")  # which projects use highway=residential?
+store.project_tags("id_editor")                # which tags does the iD editor use?
+```
+
+The database can be opened again later, without downloading anything. `refresh()` only
+downloads the projects again if taginfo has imported new data since the last download.
+
+The ``projects/tags`` endpoint is not used here, since it only counts the projects of
+every tag, and does not say which projects these are.
+"""
+
+import asyncio
+import os
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.key.projects import KeyProject
+from aio_taginfo.api.v4.project import tags as project_tags
+from aio_taginfo.api.v4.project.tags import ProjectEntry
+from aio_taginfo.api.v4.projects import all as projects_all
+from aio_taginfo.api.v4.projects.all import Project
+from aio_taginfo.api.v4.tag.projects import TagProject
+from aio_taginfo.client import Client
+from aio_taginfo.local._download import download_consistent, has_newer_data
+from aio_taginfo.scheduler import Priority, priority
+
+from aiohttp import ClientSession
+
+
+__all__ = ("ProjectTagStore",)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    project_url TEXT,
+    icon_url TEXT,
+    doc_url TEXT,
+    description TEXT,
+    key_entries INTEGER NOT NULL,
+    tag_entries INTEGER NOT NULL,
+    unique_keys INTEGER NOT NULL,
+    unique_tags INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS entries (
+    project_id TEXT NOT NULL REFERENCES projects (id),
+    key TEXT NOT NULL,
+    value TEXT,
+    on_node INTEGER NOT NULL,
+    on_way INTEGER NOT NULL,
+    on_relation INTEGER NOT NULL,
+    on_area INTEGER NOT NULL,
+    description TEXT,
+    doc_url TEXT,
+    icon_url TEXT,
+    count_all INTEGER NOT NULL,
+    in_wiki INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS entries_by_tag ON entries (key, value);
+CREATE INDEX IF NOT EXISTS entries_by_project ON entries (project_id);
+"""
+
+_PROJECT_COLUMNS = (
+    "id",
+    "name",
+    "project_url",
+    "icon_url",
+    "doc_url",
+    "description",
+    "key_entries",
+    "tag_entries",
+    "unique_keys",
+    "unique_tags",
+)
+
+_ENTRY_COLUMNS = (
+    "key",
+    "value",
+    "on_node",
+    "on_way",
+    "on_relation",
+    "on_area",
+    "description",
+    "doc_url",
+    "icon_url",
+)
+
+# the columns of an entry in key/projects and tag/projects, which include its project
+_PROJECT_ENTRY_SELECT = f"""
+SELECT p.id, p.name, p.icon_url, {", ".join(f"e.{c}" for c in _ENTRY_COLUMNS)}
+FROM entries e JOIN projects p ON p.id = e.project_id
+"""  # noqa: S608
+_PROJECT_ENTRY_FIELDS = ("project_id", "project_name", "project_icon_url", *_ENTRY_COLUMNS)
+
+_Entries = list[tuple[str, ProjectEntry]]
+_DownloadedProjects = tuple[datetime, list[Project], _Entries]
+
+
+def _column(value: Any) -> Any:  # noqa: ANN401
+    return None if value is None else value if isinstance(value, str | int) else str(value)
+
+
+class ProjectTagStore:
+    """
+    Keys and tags of all projects, in a SQLite database.
+
+    Lookups return the same types as the endpoints they replace, in the same default order.
+    """
+
+    __slots__ = ("_db",)
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        """
+        Open a store, which is empty if the database does not exist yet.
+
+        Args:
+            path: the database file, or ``":memory:"`` for a store that is not saved
+        """
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    @classmethod
+    async def download(
+        cls,
+        path: str | os.PathLike = ":memory:",
+        concurrency: int = 4,
+        session: ClientSession | Client | None = None,
+    ) -> "ProjectTagStore":
+        """
+        Download the keys and tags of all projects into a store.
+
+        Args:
+            path: the database file, or ``":memory:"`` for a store that is not saved;
+                  if it exists, its projects are replaced
+            concurrency: maximum number of projects that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+        """
+        store = cls(path)
+        store._replace(*await _download(concurrency=concurrency, session=session))
+        return store
+
+    @property
+    def data_until(self) -> datetime | None:
+        """All changes in the source until this date are reflected, or ``None`` if empty."""
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'data_until'").fetchone()
+        return None if row is None else datetime.fromisoformat(row[0])
+
+    def __len__(self) -> int:
+        """Number of entries of all projects."""
+        return self._db.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    def projects(self) -> list[Project]:
+        """All projects, ordered by name, like the ``projects/all`` endpoint returns them."""
+        rows = self._db.execute(
+            f"SELECT {', '.join(_PROJECT_COLUMNS)} FROM projects ORDER BY name"  # noqa: S608
+        )
+        return [Project(**dict(zip(_PROJECT_COLUMNS, row, strict=True))) for row in rows]
+
+    def project(self, project_id: str) -> Project | None:
+        """
+        The project with the given ID.
+
+        Returns:
+            ``None`` if there is no such project
+        """
+        row = self._db.execute(
+            f"SELECT {', '.join(_PROJECT_COLUMNS)} FROM projects WHERE id = ?",  # noqa: S608
+            (project_id,),
+        ).fetchone()
+        return None if row is None else Project(**dict(zip(_PROJECT_COLUMNS, row, strict=True)))
+
+    def project_tags(self, project_id: str) -> list[ProjectEntry] | None:
+        """
+        Keys and tags of a project, like the ``project/tags`` endpoint returns them.
+
+        Returns:
+            ``None`` if there is no such project
+        """
+        if self.project(project_id) is None:
+            return None
+        fields = (*_ENTRY_COLUMNS, "count_all", "in_wiki")
+        rows = self._db.execute(
+            f"SELECT {', '.join(fields)} FROM entries WHERE project_id = ?"  # noqa: S608
+            " ORDER BY key, value",
+            (project_id,),
+        )
+        return [ProjectEntry(**dict(zip(fields, row, strict=True))) for row in rows]
+
+    def key_projects(self, key: str) -> list[KeyProject]:
+        """Projects that use a key, with any value, like the ``key/projects`` endpoint."""
+        rows = self._db.execute(
+            f"{_PROJECT_ENTRY_SELECT} WHERE e.key = ? ORDER BY p.name, e.value",
+            (key,),
+        )
+        return [KeyProject(**dict(zip(_PROJECT_ENTRY_FIELDS, row, strict=True))) for row in rows]
+
+    def tag_projects(self, key: str, value: str) -> list[TagProject]:
+        """Projects that use a tag, like the ``tag/projects`` endpoint."""
+        rows = self._db.execute(
+            f"{_PROJECT_ENTRY_SELECT} WHERE e.key = ? AND e.value = ? ORDER BY p.name",
+            (key, value),
+        )
+        return [TagProject(**dict(zip(_PROJECT_ENTRY_FIELDS, row, strict=True))) for row in rows]
+
+    async def refresh(
+        self,
+        concurrency: int = 4,
+        session: ClientSession | Client | None = None,
+    ) -> bool:
+        """
+        Download the keys and tags of all projects again, if taginfo has newer data.
+
+        Only the first project of ``projects/all`` is requested to find out if taginfo
+        imported new data. The database keeps the old projects until all new ones arrived,
+        and replaces them in a single transaction.
+        Responses that a `aio_taginfo.client.Client` cached are requested again.
+
+        Args:
+            concurrency: maximum number of projects that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+
+        Returns:
+            ``True`` if the store was updated
+        """
+        latest = projects_all.call(page=1, rp=1, session=session)
+        if not await has_newer_data(latest, self.data_until):
+            return False
+        self._replace(*await _download(concurrency=concurrency, session=session, revalidate=True))
+        return True
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def _replace(
+        self,
+        data_until: datetime,
+        projects: Iterable[Project],
+        entries: Iterable[tuple[str, ProjectEntry]],
+    ) -> None:
+        with self._db:  # a single transaction, so lookups never see a partial download
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM projects")
+            self._db.executemany(
+                "INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    tuple(_column(getattr(project, c)) for c in _PROJECT_COLUMNS)
+                    for project in projects
+                ),
+            )
+            self._db.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        project_id,
+                        *(_column(getattr(entry, c)) for c in _ENTRY_COLUMNS),
+                        entry.count_all,
+                        entry.in_wiki,
+                    )
+                    for project_id, entry in entries
+                ),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('data_until', ?)", (data_until.isoformat(),)
+            )
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of entries and the data date."""
+        return f"{self.__class__.__name__}(len={len(self)}, data_until={self.data_until})"
+
+
+async def _download(
+    concurrency: int,
+    session: ClientSession | Client | None,
+    *,
+    revalidate: bool = False,
+) -> _DownloadedProjects:
+    assert concurrency > 0, "'concurrency' must be positive"
+    ephemeral_session = not session
+    session = session or ClientSession()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(project_id: str) -> Response[list[ProjectEntry]]:
+        async with semaphore:
+            return await project_tags.call(project=project_id, session=session)
+
+    async def attempt() -> tuple[tuple[list[Project], _Entries], list[datetime]]:
+        projects = await projects_all.call(session=session)
+        tasks = [asyncio.ensure_future(fetch(p.id)) for p in projects.data]
+        try:
+            responses = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        entries = [
+            (project.id, entry)
+            for project, response in zip(projects.data, responses, strict=True)
+            for entry in response.data
+        ]
+        data_until = [projects.data_until, *(r.data_until for r in responses)]
+        return (projects.data, entries), data_until
+
+    try:
+        with priority(Priority.BULK):
+            (projects, entries), data_until = await download_consistent(
+                attempt, revalidate=revalidate
+            )
+    finally:
+        if ephemeral_session:
+            await session.close()
+
+    return data_until, projects, entries
+
+
+__docformat__ = "google"
@@ -0,0 +1,216 @@
+"""
+Local replacement for the ``relation/roles`` endpoint.
+
+`RelationRoleIndex` downloads the list of all relation types from ``relations/all``,
+and then the roles of every relation type with a ``relation/roles`` request each, several
+at a time. Afterwards, the roles of any relation type are looked up without a request:
+
+```python
+index = await RelationRoleIndex.download(min_count=100, session=client)
+role = index.role("multipolygon", "outer")
+if role is None:
+    ...  # this role is not used in any multipolygon
+```
+
+Most relation types are only used by a handful of relations, so ``min_count``
+can save most of the requests if only common relation types are of interest.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.relation import roles as relation_roles
+from aio_taginfo.api.v4.relation.roles import RelationRole
+from aio_taginfo.api.v4.relations import all as relations_all
+from aio_taginfo.api.v4.relations.all import RelationListItem
+from aio_taginfo.client import Client
+from aio_taginfo.local._download import download_consistent, has_newer_data
+from aio_taginfo.scheduler import Priority, priority
+
+from aiohttp import ClientSession
+
+
+__all__ = ("RelationRoleIndex",)
+
+
+class RelationRoleIndex:
+    """
+    Relation types, and the roles of their members.
+
+    Attributes:
+        data_until: all changes in the source until this date are reflected in this index
+    """
+
+    __slots__ = ("_roles", "_types", "data_until", "min_count")
+
+    def __init__(
+        self,
+        types: Iterable[RelationListItem],
+        roles: Iterable[RelationRole],
+        data_until: datetime,
+        min_count: int = 1,
+    ) -> None:
+        """
+        Build an index.
+
+        Args:
+            types: the results of the ``relations/all`` endpoint
+            roles: the results of the ``relation/roles`` endpoint for those types
+            data_until: the ``data_until`` of those results
+            min_count: the types that are used by fewer relations are left out
+        """
+        self.min_count = min_count
+        self._set(types, roles, data_until)
+
+    def _set(
+        self,
+        types: Iterable[RelationListItem],
+        roles: Iterable[RelationRole],
+        data_until: datetime,
+    ) -> None:
+        indexed_types = {t.rtype: t for t in types if t.rtype and t.count >= self.min_count}
+        indexed_roles: dict[str, dict[str, RelationRole]] = {rtype: {} for rtype in indexed_types}
+        for role in roles:
+            if role.rtype in indexed_roles:
+                indexed_roles[role.rtype][role.role] = role
+        self.data_until = data_until
+        self._types = indexed_types
+        self._roles = indexed_roles
+
+    @classmethod
+    async def download(
+        cls,
+        min_count: int = 1,
+        concurrency: int = 4,
+        session: ClientSession | Client | None = None,
+    ) -> "RelationRoleIndex":
+        """
+        Download all relation types, and the roles of each of them.
+
+        Args:
+            min_count: only download the roles of types that are used by this many relations
+            concurrency: maximum number of requests at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+        """
+        types, roles, data_until = await _download(min_count, concurrency, session)
+        return cls(types, roles, data_until, min_count)
+
+    def __len__(self) -> int:
+        """Number of relation types."""
+        return len(self._types)
+
+    def __contains__(self, rtype: object) -> bool:
+        """Check if the given relation type is in the index."""
+        return rtype in self._types
+
+    def types(self) -> list[RelationListItem]:
+        """All relation types in the index, ordered by name."""
+        return [self._types[rtype] for rtype in sorted(self._types)]
+
+    def relation(self, rtype: str) -> RelationListItem | None:
+        """Statistics of a relation type, or ``None`` if it is not in the index."""
+        return self._types.get(rtype)
+
+    def roles(self, rtype: str) -> list[RelationRole] | None:
+        """
+        All roles of a relation type, like the ``relation/roles`` endpoint returns them.
+
+        Returns:
+            ``None`` if the relation type is not in the index
+        """
+        roles = self._roles.get(rtype)
+        return None if roles is None else [roles[role] for role in sorted(roles)]
+
+    def role(self, rtype: str, role: str) -> RelationRole | None:
+        """
+        Statistics of a role in relations of a type.
+
+        Returns:
+            ``None`` if the relation type is not in the index, or if it has no such role
+        """
+        return self._roles.get(rtype, {}).get(role)
+
+    async def refresh(
+        self,
+        concurrency: int = 4,
+        session: ClientSession | Client | None = None,
+    ) -> bool:
+        """
+        Download all relation types and roles again, if taginfo has newer data.
+
+        To find out if taginfo imported new data, only the first relation type
+        is requested. If it did, the roles of all types are requested again, and lookups
+        return the old roles in the meantime. Responses that a `aio_taginfo.client.Client`
+        cached are requested again.
+
+        Args:
+            concurrency: maximum number of requests at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+
+        Returns:
+            ``True`` if the index was updated
+        """
+        latest = relations_all.call(page=1, rp=1, session=session)
+        if not await has_newer_data(latest, self.data_until):
+            return False
+        self._set(*await _download(self.min_count, concurrency, session, revalidate=True))
+        return True
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of types and the data date."""
+        return f"{self.__class__.__name__}(len={len(self)}, data_until={self.data_until})"
+
+
+async def _download(
+    min_count: int,
+    concurrency: int,
+    session: ClientSession | Client | None,
+    *,
+    revalidate: bool = False,
+) -> tuple[list[RelationListItem], list[RelationRole], datetime]:
+    assert concurrency > 0, "'concurrency' must be positive"
+    ephemeral_session = not session
+    session = session or ClientSession()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(rtype: str) -> Response[list[RelationRole]]:
+        async with semaphore:
+            return await relation_roles.call(rtype=rtype, session=session)
+
+    async def attempt() -> tuple[tuple[list[RelationListItem], list[RelationRole]], list[datetime]]:
+        types = await relations_all.call(session=session)
+        # the roles of relations without a type cannot be requested
+        selected = [t for t in types.data if t.rtype and t.count >= min_count]
+        tasks = [asyncio.ensure_future(fetch(t.rtype)) for t in selected]
+        try:
+            responses = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        roles = [role for response in responses for role in response.data]
+        data_until = [types.data_until, *(r.data_until for r in responses)]
+        return (selected, roles), data_until
+
+    try:
+        with priority(Priority.BULK):
+            (selected, roles), data_until = await download_consistent(
+                attempt, revalidate=revalidate
+            )
+    finally:
+        if ephemeral_session:
+            await session.close()
+
+    return selected, roles, data_until
+
+
+__docformat__ = "google"
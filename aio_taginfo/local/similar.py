@@ -0,0 +1,225 @@
+"""
+Local replacement for the ``key/similar`` endpoint.
+
+Taginfo precomputes similar keys in its database with these rules, which are followed here:
+
+* Keys are compared without regard to case.
+* A key that contains the other one is similar, with a similarity of ``0``.
+* Otherwise, keys with an edit (Levenshtein) distance of at most ``2`` are similar,
+  and their similarity is that distance.
+* Very short and very long keys are not compared at all, since they would produce
+  mostly false positives, or take too long to compare.
+
+Keys that contain each other are found by scanning a single string of all keys.
+Keys within a small edit distance ``t`` are found with a partition index: every key is split
+into ``t + 1`` segments, and by the pigeonhole principle, any key within that distance
+contains at least one of those segments unchanged, close to its original position.
+Only keys that share such a segment are compared in full.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+from aio_taginfo.api.v4.key.similar import SimilarKey
+from aio_taginfo.client import Client
+from aio_taginfo.local.keys import download_counts
+
+from aiohttp import ClientSession
+
+
+__all__ = ("SimilarKeyIndex",)
+
+
+_MIN_LENGTH = 4
+_MAX_LENGTH = 120
+_MAX_DISTANCE = 2
+
+# separates keys in the string used for substring search
+_SEP = "\0"
+
+
+def _distance(a: str, b: str, cutoff: int) -> int:
+    """Levenshtein distance of two strings, or ``cutoff + 1`` if it is larger than ``cutoff``."""
+    if abs(len(a) - len(b)) > cutoff:
+        return cutoff + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        curr = [i]
+        for j, cb in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(curr) > cutoff:
+            return cutoff + 1
+        prev = curr
+
+    return min(prev[-1], cutoff + 1)
+
+
+class SimilarKeyIndex:
+    """Immutable index that finds similar keys the same way as taginfo's ``key/similar``."""
+
+    __slots__ = ("_blob", "_counts", "_max_distance", "_max_length", "_min_length", "_offsets",
+                 "_originals", "_segments", "_short", "_words")  # fmt: skip
+
+    def __init__(
+        self,
+        counts: Mapping[str, int] | Iterable[tuple[str, int]],
+        max_distance: int = _MAX_DISTANCE,
+        min_length: int = _MIN_LENGTH,
+        max_length: int = _MAX_LENGTH,
+    ) -> None:
+        """
+        Build an index.
+
+        Args:
+            counts: the number of uses of every key
+            max_distance: keys within this edit distance are similar
+            min_length: shorter keys are not compared
+            max_length: longer keys are not compared
+        """
+        self._counts = dict(counts)
+        self._max_distance = max_distance
+        self._min_length = min_length
+        self._max_length = max_length
+
+        # lowercase words, and the keys they stand for
+        originals: dict[str, list[str]] = defaultdict(list)
+        for key in sorted(self._counts):
+            if min_length <= len(key) <= max_length:
+                originals[key.lower()].append(key)
+        self._originals = dict(originals)
+
+        self._words = sorted(self._originals)
+        self._blob = _SEP.join(self._words)
+        self._offsets: list[int] = []
+        offset = 0
+        for word in self._words:
+            self._offsets.append(offset)
+            offset += len(word) + len(_SEP)
+
+        # (length, segment number, segment) -> words of that length with that segment
+        self._segments: dict[tuple[int, int, str], list[str]] = defaultdict(list)
+        # words too short to be split into segments
+        self._short: list[str] = []
+        for word in self._words:
+            if len(word) <= max_distance:
+                self._short.append(word)
+                continue
+            for i, (start, length) in enumerate(self._partition(len(word))):
+                self._segments[len(word), i, word[start : start + length]].append(word)
+
+    @classmethod
+    async def download(
+        cls,
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> "SimilarKeyIndex":
+        """
+        Build an index of all keys in the database.
+
+        Args:
+            rp: number of keys to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoError
+        """
+        return cls(await download_counts(rp=rp, concurrency=concurrency, session=session))
+
+    def __len__(self) -> int:
+        """Number of keys that can be similar to others."""
+        return sum(len(keys) for keys in self._originals.values())
+
+    def similar(self, key: str) -> list[SimilarKey]:
+        """
+        Find keys that are similar to a given key.
+
+        Args:
+            key: tag key, which does not have to be in the index itself
+
+        Returns:
+            similar keys, sorted by ``other_key`` like the ``key/similar`` endpoint does by default
+        """
+        if not self._min_length <= len(key) <= self._max_length:
+            return []
+
+        word = key.lower()
+        similarity: dict[str, int] = {}
+
+        for other in self._containing(word):
+            similarity[other] = 0
+        for other in self._contained(word):
+            similarity[other] = 0
+        for other, distance in self._within_distance(word):
+            similarity.setdefault(other, distance)
+
+        results = [
+            SimilarKey(other_key=other_key, count_all=self._counts[other_key], similarity=value)
+            for other, value in similarity.items()
+            for other_key in self._originals[other]
+            if other_key != key
+        ]
+        results.sort(key=lambda result: result.other_key)
+        return results
+
+    def _containing(self, word: str) -> Iterable[str]:
+        """Words that contain the given one."""
+        blob, offsets = self._blob, self._offsets
+        pos = blob.find(word)
+        while pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            yield self._words[i]
+            if i + 1 >= len(offsets):
+                break
+            pos = blob.find(word, offsets[i + 1])
+
+    def _contained(self, word: str) -> Iterable[str]:
+        """Words that the given one contains."""
+        n = len(word)
+        for length in range(self._min_length, n + 1):
+            for start in range(n - length + 1):
+                part = word[start : start + length]
+                if part in self._originals:
+                    yield part
+
+    def _within_distance(self, word: str) -> Iterable[tuple[str, int]]:
+        """Words within the maximum edit distance of the given one."""
+        t = self._max_distance
+        n = len(word)
+
+        candidates = set(self._short)
+        for length in range(max(n - t, t + 1), n + t + 1):
+            for i, (start, seg_length) in enumerate(self._partition(length)):
+                for pos in range(max(start - t, 0), min(start + t, n - seg_length) + 1):
+                    words = self._segments.get((length, i, word[pos : pos + seg_length]))
+                    if words:
+                        candidates.update(words)
+
+        for other in candidates:
+            d = _distance(word, other, cutoff=t)
+            if d <= t:
+                yield other, d
+
+    def _partition(self, length: int) -> list[tuple[int, int]]:
+        """Start and length of the segments of a word with the given length."""
+        n_segments = self._max_distance + 1
+        short, n_long = divmod(length, n_segments)
+        segments = []
+        start = 0
+        for i in range(n_segments):
+            seg_length = short + (i >= n_segments - n_long)
+            segments.append((start, seg_length))
+            start += seg_length
+        return segments
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of keys."""
+        return f"{self.__class__.__name__}(len={len(self)})"
+
+
+__docformat__ = "google"
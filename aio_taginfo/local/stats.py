@@ -0,0 +1,196 @@
+"""
+Local replacement for the ``key/stats`` endpoint.
+
+The ``keys/all`` endpoint lists the same object counts as ``key/stats`` for every key,
+so downloading it once replaces a ``key/stats`` request per key.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime
+
+from aio_taginfo.api.v4 import ObjectType
+from aio_taginfo.api.v4.key.stats import KeyStats
+from aio_taginfo.api.v4.keys import all as keys_all
+from aio_taginfo.api.v4.keys.all import KeyListItem
+from aio_taginfo.client import Client
+from aio_taginfo.local._download import download_consistent, has_newer_data
+
+from aiohttp import ClientSession
+
+
+__all__ = ("KeyStatsSnapshot",)
+
+
+_COUNT_FIELDS = ("count_all", "count_nodes", "count_ways", "count_relations")
+_OBJECT_TYPES = (ObjectType.ALL, ObjectType.NODES, ObjectType.WAYS, ObjectType.RELATIONS)
+
+
+class _Columns:
+    """Statistics of all keys, stored column-wise in arrays."""
+
+    __slots__ = ("counts", "data_until", "fractions", "keys", "values")
+
+    def __init__(self, items: Iterable[KeyListItem], data_until: datetime) -> None:
+        rows = sorted(items, key=lambda item: item.key)
+        self.data_until = data_until
+        self.keys = [item.key for item in rows]
+        self.counts = tuple(
+            array("q", (getattr(item, field) for item in rows)) for field in _COUNT_FIELDS
+        )
+        self.fractions = tuple(
+            array("d", (getattr(item, f"{field}_fraction") for item in rows))
+            for field in _COUNT_FIELDS
+        )
+        self.values = array("q", (item.values_all for item in rows))
+
+    def find(self, key: str) -> int | None:
+        i = bisect_left(self.keys, key)
+        return i if i < len(self.keys) and self.keys[i] == key else None
+
+
+class KeyStatsSnapshot:
+    """
+    Statistics of all keys, downloaded from the ``keys/all`` endpoint.
+
+    Lookups return the same `KeyStats` as the ``key/stats`` endpoint, with one exception:
+    ``keys/all`` does not count the different values per object type, so the ``values``
+    of the node, way and relation statistics are those of all objects, which is an upper bound.
+
+    The snapshot can be refreshed in place with `refresh()`, which only downloads
+    all keys again if taginfo has imported new data since the last download.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, items: Iterable[KeyListItem], data_until: datetime) -> None:
+        """
+        Create a snapshot.
+
+        Args:
+            items: the results of the ``keys/all`` endpoint
+            data_until: the ``data_until`` of those results
+        """
+        self._columns = _Columns(items, data_until)
+
+    @classmethod
+    async def download(
+        cls,
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> "KeyStatsSnapshot":
+        """
+        Download the statistics of all keys.
+
+        If taginfo imports new data while the pages are downloaded, they are downloaded again.
+
+        Args:
+            rp: number of keys to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+        """
+        snapshot = cls.__new__(cls)
+        snapshot._columns = await _download(rp=rp, concurrency=concurrency, session=session)
+        return snapshot
+
+    @property
+    def data_until(self) -> datetime:
+        """All changes in the source until this date are reflected in this snapshot."""
+        return self._columns.data_until
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._columns.keys)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the given key is in the snapshot."""
+        return isinstance(key, str) and self._columns.find(key) is not None
+
+    def stats(self, key: str) -> list[KeyStats] | None:
+        """
+        Statistics for the given key, like the ``key/stats`` endpoint returns them.
+
+        Returns:
+            ``None`` if the key is not in the snapshot
+        """
+        columns = self._columns
+        i = columns.find(key)
+        if i is None:
+            return None
+        return [
+            KeyStats(
+                type=object_type,
+                count=counts[i],
+                count_fraction=fractions[i],
+                values=columns.values[i],
+            )
+            for object_type, counts, fractions in zip(
+                _OBJECT_TYPES, columns.counts, columns.fractions, strict=True
+            )
+        ]
+
+    async def refresh(
+        self,
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> bool:
+        """
+        Download the statistics of all keys again, if taginfo has newer data.
+
+        Whether there is newer data is checked with the first page of ``keys/all`` with
+        a single key. If ``session`` is a `aio_taginfo.client.Client`, this check and
+        the download do not use its cached responses, but replace them. Until all keys
+        are downloaded again, lookups use the old statistics.
+
+        Args:
+            rp: number of keys to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+
+        Returns:
+            ``True`` if the statistics were updated
+        """
+        latest = keys_all.call(page=1, rp=1, session=session)
+        if not await has_newer_data(latest, self._columns.data_until):
+            return False
+        self._columns = await _download(
+            rp=rp, concurrency=concurrency, session=session, revalidate=True
+        )
+        return True
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of keys and the data date."""
+        return f"{self.__class__.__name__}(len={len(self)}, data_until={self.data_until})"
+
+
+async def _download(
+    rp: int,
+    concurrency: int,
+    session: ClientSession | Client | None,
+    *,
+    revalidate: bool = False,
+) -> _Columns:
+    async def attempt() -> tuple[list[KeyListItem], list[datetime]]:
+        items: list[KeyListItem] = []
+        data_until: list[datetime] = []
+        async for page in keys_all.call_pages(rp=rp, concurrency=concurrency, session=session):
+            items.extend(page.data)
+            data_until.append(page.data_until)
+        return items, data_until
+
+    items, data_until = await download_consistent(attempt, revalidate=revalidate)
+    return _Columns(items, data_until)
+
+
+__docformat__ = "google"
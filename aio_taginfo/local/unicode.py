@@ -0,0 +1,92 @@
+"""
+Local replacement for the ``unicode/characters`` endpoint.
+
+The general category and name of a character come from Python's `unicodedata`,
+and its script from a bundled table of Unicode's ``Scripts.txt``, which is searched
+with a binary search over the first code point of every range of the same script:
+
+```python
+>>> characters("ß")
+[UnicodeCharacter(char='ß', script='Latn', category='Ll', name='LATIN SMALL LETTER SHARP S')]
+```
+
+Results can differ from taginfo's for characters that were assigned in a version of Unicode
+that is newer than the one known to either side.
+"""
+
+import functools
+import importlib.resources
+import unicodedata
+from bisect import bisect_right
+
+from aio_taginfo.api.v4.unicode.characters import UnicodeCharacter
+
+
+__all__ = (
+    "character",
+    "characters",
+    "script",
+)
+
+
+class _Scripts:
+    """The bundled table of Unicode scripts."""
+
+    __slots__ = ("codes", "names", "starts")
+
+    def __init__(self, text: str) -> None:
+        self.names: dict[str, str] = {}
+        self.starts: list[int] = []
+        self.codes: list[str] = []
+        in_ranges = False
+        for line in text.splitlines():
+            if line.startswith("#"):
+                in_ranges = in_ranges or "code point" in line
+                continue
+            first, second = line.split(" ")
+            if in_ranges:
+                self.starts.append(int(first, 16))
+                self.codes.append(second)
+            else:
+                self.names[first] = second
+
+
+@functools.cache
+def _scripts() -> _Scripts:
+    text = importlib.resources.files(__package__).joinpath("unicode_scripts.txt").read_text()
+    return _Scripts(text)
+
+
+def script(char: str) -> tuple[str, str]:
+    """
+    The script of a character.
+
+    Returns:
+        its ISO 15924 code and name, like ``("Latn", "Latin")``
+    """
+    scripts = _scripts()
+    code = scripts.codes[bisect_right(scripts.starts, ord(char)) - 1]
+    return code, scripts.names[code]
+
+
+@functools.lru_cache(maxsize=4096)
+def character(char: str) -> UnicodeCharacter:
+    """Unicode properties of a single character, as ``unicode/characters`` would return them."""
+    assert len(char) == 1, "expected a single character"
+    code, name = script(char)
+    return UnicodeCharacter(
+        char=char,
+        codepoint=ord(char),
+        script=code,
+        script_name=name,
+        category=unicodedata.category(char),
+        name=unicodedata.name(char, None),
+    )
+
+
+def characters(string: str) -> list[UnicodeCharacter]:
+    """Unicode properties of all characters of a string, like ``unicode/characters``."""
+    return [character(char) for char in string]
+
+
+__docformat__ = "google"
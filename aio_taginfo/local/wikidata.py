@@ -0,0 +1,233 @@
+"""
+Local replacement for lookups in the ``wikidata/all`` endpoint.
+
+The OSM wiki links a few thousand Wikidata items to keys and tags. `WikidataIndex` downloads
+all of these links once, and finds them in both directions without another request:
+
+```python
+index = await WikidataIndex.download(lang="fr", session=client)
+index.links("Q16917")                       # keys and tags of an item, like "amenity=hospital"
+index.items("amenity", "hospital")          # items of a tag
+index.match({"amenity": "hospital", "operator:wikidata": "Q42"})  # items of an object's tags
+```
+
+Only the descriptions of the items depend on the language. The index can be saved to a file
+and loaded again, and `refresh()` only downloads all links again if taginfo has imported new
+data since the last download.
+"""
+
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+
+from aio_taginfo.api.v4.wikidata import all as wikidata_all
+from aio_taginfo.api.v4.wikidata.all import WikidataLink
+from aio_taginfo.client import Client
+from aio_taginfo.local._download import download_consistent, has_newer_data
+
+from aiohttp import ClientSession
+from pydantic import Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+
+
+__all__ = ("WikidataIndex",)
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Saved:
+    """The contents of a saved index."""
+
+    lang: str = Field(min_length=1)
+    data_until: datetime
+    links: list[WikidataLink]
+
+
+_SAVED = TypeAdapter(_Saved)
+
+
+class WikidataIndex:
+    """
+    Links between Wikidata items and keys or tags, with item descriptions in one language.
+
+    Attributes:
+        lang: the language of the item descriptions
+        data_until: all changes in the source until this date are reflected in this index
+    """
+
+    __slots__ = ("_by_item", "_by_tag", "_links", "data_until", "lang")
+
+    def __init__(self, links: Iterable[WikidataLink], data_until: datetime, lang: str) -> None:
+        """
+        Build an index.
+
+        Args:
+            links: the results of the ``wikidata/all`` endpoint
+            data_until: the ``data_until`` of those results
+            lang: the language that was requested
+        """
+        self.lang = lang
+        self._set(links, data_until)
+
+    def _set(self, links: Iterable[WikidataLink], data_until: datetime) -> None:
+        by_item: dict[str, list[WikidataLink]] = defaultdict(list)
+        by_tag: dict[tuple[str, str | None], list[WikidataLink]] = defaultdict(list)
+        links = list(links)
+        for link in links:
+            by_item[link.item].append(link)
+            by_tag[link.key, link.value].append(link)
+        self.data_until = data_until
+        self._links = links
+        self._by_item = dict(by_item)
+        self._by_tag = dict(by_tag)
+
+    @classmethod
+    async def download(
+        cls,
+        lang: str = "en",
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> "WikidataIndex":
+        """
+        Download all links between Wikidata items and keys or tags.
+
+        Args:
+            lang: the language of the item descriptions
+            rp: number of links to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+        """
+        links, data_until = await _download(lang, rp=rp, concurrency=concurrency, session=session)
+        return cls(links, data_until, lang)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "WikidataIndex":
+        """
+        Load an index that was saved with `save()`.
+
+        Raises:
+            pydantic.ValidationError: if the file does not contain a saved index
+        """
+        saved = _SAVED.validate_json(Path(path).read_bytes())
+        return cls(saved.links, saved.data_until, saved.lang)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save this index to a JSON file, which is replaced if it exists."""
+        saved = _Saved(lang=self.lang, data_until=self.data_until, links=self._links)
+        tmp = Path(f"{os.fspath(path)}.tmp")
+        tmp.write_bytes(_SAVED.dump_json(saved))
+        tmp.replace(path)
+
+    def __len__(self) -> int:
+        """Number of links."""
+        return len(self._links)
+
+    def __contains__(self, item: object) -> bool:
+        """Check if the given Wikidata item is linked to any key or tag."""
+        return item in self._by_item
+
+    def links(self, item: str) -> list[WikidataLink]:
+        """Keys and tags that the given Wikidata item is linked to."""
+        return list(self._by_item.get(item, ()))
+
+    def description(self, item: str) -> str | None:
+        """The description of the given Wikidata item, or ``None`` if it is not known."""
+        return next((link.description for link in self._by_item.get(item, ())), None)
+
+    def items(self, key: str, value: str | None = None) -> list[WikidataLink]:
+        """
+        Wikidata items that are linked to a key or tag.
+
+        Args:
+            key: tag key
+            value: tag value, or ``None`` for the items that are linked to the key itself
+        """
+        return list(self._by_tag.get((key, value), ()))
+
+    def match(self, tags: Mapping[str, str]) -> list[WikidataLink]:
+        """
+        Wikidata items that are linked to the keys and tags of an OSM object.
+
+        Args:
+            tags: the tags of the object
+        """
+        by_tag = self._by_tag
+        return [
+            link
+            for key, value in tags.items()
+            for tag in ((key, None), (key, value))
+            for link in by_tag.get(tag, ())
+        ]
+
+    async def refresh(
+        self,
+        rp: int = 1000,
+        concurrency: int = 2,
+        session: ClientSession | Client | None = None,
+    ) -> bool:
+        """
+        Download all links again, if taginfo has newer data.
+
+        A request for a single link tells whether taginfo imported new data since
+        the index was downloaded or saved. While the new links are downloaded,
+        lookups still find the old ones. Neither request uses the responses that
+        a `aio_taginfo.client.Client` cached.
+
+        Args:
+            rp: number of links to request per page
+            concurrency: maximum number of pages that are requested at the same time
+            session: request client session
+
+        Raises:
+            TaginfoDataChangedError: if the data kept changing during the download
+            TaginfoError
+
+        Returns:
+            ``True`` if the index was updated
+        """
+        latest = wikidata_all.call(lang=self.lang, page=1, rp=1, session=session)
+        if not await has_newer_data(latest, self.data_until):
+            return False
+        self._set(
+            *await _download(
+                self.lang, rp=rp, concurrency=concurrency, session=session, revalidate=True
+            )
+        )
+        return True
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of links and the data date."""
+        return (
+            f"{self.__class__.__name__}(lang={self.lang!r}, len={len(self)}, "
+            f"data_until={self.data_until})"
+        )
+
+
+async def _download(
+    lang: str,
+    rp: int,
+    concurrency: int,
+    session: ClientSession | Client | None,
+    *,
+    revalidate: bool = False,
+) -> tuple[list[WikidataLink], datetime]:
+    async def attempt() -> tuple[list[WikidataLink], list[datetime]]:
+        links: list[WikidataLink] = []
+        data_until: list[datetime] = []
+        async for page in wikidata_all.call_pages(
+            lang=lang, rp=rp, concurrency=concurrency, session=session
+        ):
+            links.extend(page.data)
+            data_until.append(page.data_until)
+        return links, data_until
+
+    return await download_consistent(attempt, revalidate=revalidate)
+
+
+__docformat__ = "google"
@@ -0,0 +1,277 @@
+"""
+Recorded responses, which a `aio_taginfo.client.Client` can make requests to instead of a server.
+
+A `Recorder` makes real requests, and keeps every response with its status, headers and
+latency. A `Replayer` answers the same requests from such a recording, without a network,
+after the recorded latency:
+
+```python
+recorder = Recorder()
+async with Client(transport=recorder) as client:
+    await run_workload(client)
+recorder.save("workload.replay.gz")
+
+replayer = Replayer.load("workload.replay.gz", latency_scale=0.5)
+async with Client(transport=replayer, cache=ResponseCache(max_entries=100)) as client:
+    await run_workload(client)  # the same requests, answered twice as fast
+```
+
+Since replayed requests go through the client like real ones, this makes it possible to
+compare cache, pagination and concurrency settings against the same traffic offline.
+
+Requests are matched by their path and parameters, regardless of the server they were
+made to. If the same request was recorded more than once, its responses are replayed
+in the recorded order, and the last one is repeated after that.
+"""
+
+import asyncio
+import base64
+import gzip
+import http
+import json
+import os
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aio_taginfo import _http
+from aio_taginfo.error import TaginfoCallError
+
+import aiohttp
+from aiohttp import ClientSession
+from aiohttp.typedefs import URL, CIMultiDict, CIMultiDictProxy  # not direct dependencies
+
+
+__all__ = (
+    "Exchange",
+    "Recorder",
+    "Replayer",
+)
+
+
+_FORMAT = "aio-taginfo-replay"
+_VERSION = 1
+
+
+@dataclass(kw_only=True, frozen=True)
+class Exchange:
+    """
+    A recorded request and its response.
+
+    Attributes:
+        request: the API path after "/api/4/", and the parameters of the request
+        status: HTTP status of the response
+        headers: headers of the response
+        body: body of the response
+        started: seconds between the start of the recording and the request
+        latency: seconds between the request and the complete response
+    """
+
+    request: str
+    status: int
+    headers: dict[str, str] = field(repr=False)
+    body: bytes = field(repr=False)
+    started: float
+    latency: float
+
+
+class Recorder:
+    """
+    Transport that makes requests with the client's session, and records their responses.
+
+    Attributes:
+        exchanges: all recorded requests and responses, in the order in which they completed
+    """
+
+    __slots__ = ("_start", "exchanges")
+
+    def __init__(self) -> None:
+        """Start an empty recording."""
+        self._start = time.monotonic()
+        self.exchanges: list[Exchange] = []
+
+    async def __call__(
+        self,
+        path: str,
+        content_type: str,
+        session: ClientSession | None,
+        params: dict | None,
+        base_url: str = _http.URL_BASE,
+    ) -> bytes:
+        """
+        Make a request, and record its response.
+
+        Requests that fail without a response, like on connection errors, are not recorded.
+
+        Raises:
+            TaginfoCallError
+        """
+        started = time.monotonic()
+
+        def record(response: aiohttp.ClientResponse, body: bytes) -> None:
+            self.exchanges.append(
+                Exchange(
+                    request=_http.cache_key(path, params),
+                    status=response.status,
+                    headers=dict(response.headers),
+                    body=body,
+                    started=started - self._start,
+                    latency=time.monotonic() - started,
+                )
+            )
+
+        return await _http.get(path, content_type, session, params, base_url, on_response=record)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the recording to a gzip-compressed file, which is replaced if it exists."""
+        tmp = Path(f"{os.fspath(path)}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"format": _FORMAT, "version": _VERSION}) + "\n")
+            for exchange in self.exchanges:
+                f.write(json.dumps(_to_json(exchange), ensure_ascii=False) + "\n")
+        tmp.replace(path)
+
+    def __len__(self) -> int:
+        """Number of recorded requests."""
+        return len(self.exchanges)
+
+    def __repr__(self) -> str:
+        """String representation that includes the number of recorded requests."""
+        return f"{self.__class__.__name__}(len={len(self)})"
+
+
+class Replayer:
+    """
+    Transport that answers requests from a recording.
+
+    Attributes:
+        exchanges: the recorded requests and responses
+        latency_scale: factor for the recorded latencies; ``0.0`` answers right away
+        requests: number of requests that were answered from the recording
+        misses: number of requests that were not recorded
+    """
+
+    __slots__ = ("_responses", "exchanges", "latency_scale", "misses", "requests")
+
+    def __init__(self, exchanges: Iterable[Exchange], latency_scale: float = 1.0) -> None:
+        """
+        Replay the given exchanges.
+
+        Args:
+            exchanges: recorded requests and responses, like `Recorder.exchanges`
+            latency_scale: factor for the recorded latencies; ``0.0`` answers right away
+        """
+        assert latency_scale >= 0, "'latency_scale' cannot be negative"
+        self.exchanges = list(exchanges)
+        self.latency_scale = latency_scale
+        self.requests = 0
+        self.misses = 0
+        responses: defaultdict[str, deque[Exchange]] = defaultdict(deque)
+        for exchange in self.exchanges:
+            responses[exchange.request].append(exchange)
+        self._responses = dict(responses)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, latency_scale: float = 1.0) -> "Replayer":
+        """
+        Replay a recording that was saved with `Recorder.save()`.
+
+        Raises:
+            ValueError: if the file does not contain a recording
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "null")
+            if not isinstance(header, dict) or header.get("format") != _FORMAT:
+                msg = f"{os.fspath(path)} does not contain a recording"
+                raise ValueError(msg)
+            if header.get("version") != _VERSION:
+                msg = f"unsupported recording version {header.get('version')}"
+                raise ValueError(msg)
+            exchanges = [_from_json(json.loads(line)) for line in f if line.strip()]
+        return cls(exchanges, latency_scale)
+
+    async def __call__(
+        self,
+        path: str,
+        content_type: str,  # noqa: ARG002
+        session: ClientSession | None,  # noqa: ARG002
+        params: dict | None,
+        base_url: str = _http.URL_BASE,
+    ) -> bytes:
+        """
+        Answer a request with its recorded response, after its recorded latency.
+
+        Raises:
+            TaginfoCallError: if the recorded response was an error, or if the request
+                              was not recorded
+        """
+        url = URL(_http.api_url(path, params, base_url=base_url))
+        responses = self._responses.get(_http.cache_key(path, params))
+        if not responses:
+            self.misses += 1
+            msg = f"no recorded response for {url}"
+            raise TaginfoCallError(cause=aiohttp.ClientConnectionError(msg))
+
+        exchange = responses.popleft() if len(responses) > 1 else responses[0]
+        self.requests += 1
+        if self.latency_scale:
+            await asyncio.sleep(exchange.latency * self.latency_scale)
+
+        if exchange.status >= 400:
+            headers = CIMultiDictProxy(CIMultiDict(exchange.headers))
+            request_info = aiohttp.RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url)
+            raise TaginfoCallError(
+                cause=aiohttp.ClientResponseError(
+                    request_info,
+                    (),
+                    status=exchange.status,
+                    message=_reason(exchange.status),
+                    headers=headers,
+                )
+            )
+        return exchange.body
+
+    def __repr__(self) -> str:
+        """String representation that includes the numbers of requests and misses."""
+        return f"{self.__class__.__name__}(requests={self.requests}, misses={self.misses})"
+
+
+def _reason(status: int) -> str:
+    try:
+        return http.HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def _to_json(exchange: Exchange) -> dict[str, Any]:
+    obj: dict[str, Any] = {
+        "request": exchange.request,
+        "status": exchange.status,
+        "headers": exchange.headers,
+        "started": exchange.started,
+        "latency": exchange.latency,
+    }
+    # JSON bodies are kept readable, and only images are encoded
+    try:
+        obj["body"] = exchange.body.decode("utf-8")
+    except UnicodeDecodeError:
+        obj["body_base64"] = base64.b64encode(exchange.body).decode("ascii")
+    return obj
+
+
+def _from_json(obj: dict[str, Any]) -> Exchange:
+    body = obj["body"].encode("utf-8") if "body" in obj else base64.b64decode(obj["body_base64"])
+    return Exchange(
+        request=obj["request"],
+        status=obj["status"],
+        headers=obj["headers"],
+        body=body,
+        started=obj["started"],
+        latency=obj["latency"],
+    )
+
+
+__docformat__ = "google"
@@ -0,0 +1,287 @@
+"""
+Composite calls, which gather the responses of several endpoints about the same subject.
+
+A `key_report` makes all calls for a key at the same time, over the same session,
+instead of one after the other, and a `tag_report` does the same for a tag:
+
+```python
+report = await key_report("highway", parts={KeyReportPart.OVERVIEW, KeyReportPart.STATS},
+                          timeout=5.0, session=client)
+if report.overview is not None:
+    ...
+for part, error in report.errors.items():
+    ...
+```
+
+Parts that fail, or are not done before the timeout, are missing from the report,
+and their errors are reported instead.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
+
+from aio_taginfo.api.v4 import PngResponse, Response
+from aio_taginfo.api.v4.key import (
+    chronology,
+    combinations,
+    overview,
+    prevalent_values,
+    projects,
+    similar,
+    stats,
+)
+from aio_taginfo.api.v4.key.chronology import KeyChronology
+from aio_taginfo.api.v4.key.combinations import KeyCombination
+from aio_taginfo.api.v4.key.overview import KeyOverview
+from aio_taginfo.api.v4.key.prevalent_values import PrevalentValue
+from aio_taginfo.api.v4.key.projects import KeyProject
+from aio_taginfo.api.v4.key.similar import SimilarKey
+from aio_taginfo.api.v4.key.stats import KeyStats
+from aio_taginfo.api.v4.tag import chronology as tag_chronology
+from aio_taginfo.api.v4.tag import combinations as tag_combinations
+from aio_taginfo.api.v4.tag import overview as tag_overview
+from aio_taginfo.api.v4.tag import projects as tag_projects
+from aio_taginfo.api.v4.tag import stats as tag_stats
+from aio_taginfo.api.v4.tag import wiki_pages as tag_wiki_pages
+from aio_taginfo.api.v4.tag.chronology import TagChronology
+from aio_taginfo.api.v4.tag.combinations import TagCombination
+from aio_taginfo.api.v4.tag.distribution import nodes as tag_distribution_nodes
+from aio_taginfo.api.v4.tag.distribution import ways as tag_distribution_ways
+from aio_taginfo.api.v4.tag.overview import TagOverview
+from aio_taginfo.api.v4.tag.projects import TagProject
+from aio_taginfo.api.v4.tag.stats import TagStats
+from aio_taginfo.api.v4.tag.wiki_pages import WikiPage
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError, TaginfoValidationError, TaginfoValueError
+
+from aiohttp import ClientSession
+
+
+__all__ = (
+    "KeyReport",
+    "KeyReportPart",
+    "PartError",
+    "TagReport",
+    "TagReportPart",
+    "key_report",
+    "tag_report",
+)
+
+
+PartError = TaginfoCallError | TaginfoValidationError | TaginfoValueError | TimeoutError
+"""Reason why a part is missing from a report."""
+
+P = TypeVar("P", bound=Enum)
+
+
+class KeyReportPart(str, Enum):
+    """Parts of a `KeyReport`, by the endpoint they are requested from."""
+
+    OVERVIEW = "overview"
+    STATS = "stats"
+    COMBINATIONS = "combinations"
+    PREVALENT_VALUES = "prevalent_values"
+    PROJECTS = "projects"
+    SIMILAR = "similar"
+    CHRONOLOGY = "chronology"
+
+
+@dataclass(kw_only=True, frozen=True)
+class KeyReport:
+    """
+    Responses of all endpoints about a key, as far as they were requested and successful.
+
+    Attributes:
+        key: the key of this report
+        overview: response of `aio_taginfo.api.v4.key.overview`
+        stats: response of `aio_taginfo.api.v4.key.stats`
+        combinations: all results of `aio_taginfo.api.v4.key.combinations`
+        prevalent_values: response of `aio_taginfo.api.v4.key.prevalent_values`
+        projects: all results of `aio_taginfo.api.v4.key.projects`
+        similar: all results of `aio_taginfo.api.v4.key.similar`
+        chronology: response of `aio_taginfo.api.v4.key.chronology`
+        errors: for every requested part that is missing, the reason why
+    """
+
+    key: str
+    overview: Response[KeyOverview] | None = None
+    stats: Response[list[KeyStats]] | None = None
+    combinations: Response[list[KeyCombination]] | None = None
+    prevalent_values: Response[list[PrevalentValue]] | None = None
+    projects: Response[list[KeyProject]] | None = None
+    similar: Response[list[SimilarKey]] | None = None
+    chronology: Response[list[KeyChronology]] | None = None
+    errors: dict[KeyReportPart, PartError] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all requested parts are included."""
+        return not self.errors
+
+
+_CALLS: dict[KeyReportPart, Callable[..., Awaitable[Response[Any]]]] = {
+    KeyReportPart.OVERVIEW: overview.call,
+    KeyReportPart.STATS: stats.call,
+    KeyReportPart.COMBINATIONS: combinations.call,
+    KeyReportPart.PREVALENT_VALUES: prevalent_values.call,
+    KeyReportPart.PROJECTS: projects.call,
+    KeyReportPart.SIMILAR: similar.call,
+    KeyReportPart.CHRONOLOGY: chronology.call,
+}
+
+
+async def key_report(
+    key: str,
+    parts: Iterable[KeyReportPart] = tuple(KeyReportPart),
+    timeout: float | None = None,  # noqa: ASYNC109
+    session: ClientSession | Client | None = None,
+) -> KeyReport:
+    """
+    Request data about a key from several endpoints at the same time.
+
+    Args:
+        key: tag key
+        parts: the parts to include in the report; all of them by default
+        timeout: seconds after which parts that are not done yet are given up on,
+                 or ``None`` to wait for all of them
+        session: request client session, which is used for all requests
+
+    Returns:
+        a report with all parts that were successful, and the errors of the others
+    """
+    results, errors = await _gather(_CALLS, parts, timeout, session, key=key)
+    return KeyReport(key=key, errors=errors, **results)
+
+
+class TagReportPart(str, Enum):
+    """Parts of a `TagReport`, by the endpoint they are requested from."""
+
+    OVERVIEW = "overview"
+    STATS = "stats"
+    COMBINATIONS = "combinations"
+    PROJECTS = "projects"
+    WIKI_PAGES = "wiki_pages"
+    CHRONOLOGY = "chronology"
+    DISTRIBUTION_NODES = "distribution_nodes"
+    DISTRIBUTION_WAYS = "distribution_ways"
+
+
+@dataclass(kw_only=True, frozen=True)
+class TagReport:
+    """
+    Responses of all endpoints about a tag, as far as they were requested and successful.
+
+    Attributes:
+        key: the key of this report
+        value: the value of this report
+        overview: response of `aio_taginfo.api.v4.tag.overview`
+        stats: response of `aio_taginfo.api.v4.tag.stats`
+        combinations: all results of `aio_taginfo.api.v4.tag.combinations`
+        projects: all results of `aio_taginfo.api.v4.tag.projects`
+        wiki_pages: response of `aio_taginfo.api.v4.tag.wiki_pages`
+        chronology: response of `aio_taginfo.api.v4.tag.chronology`
+        distribution_nodes: response of `aio_taginfo.api.v4.tag.distribution.nodes`
+        distribution_ways: response of `aio_taginfo.api.v4.tag.distribution.ways`
+        errors: for every requested part that is missing, the reason why
+    """
+
+    key: str
+    value: str
+    overview: Response[TagOverview] | None = None
+    stats: Response[list[TagStats]] | None = None
+    combinations: Response[list[TagCombination]] | None = None
+    projects: Response[list[TagProject]] | None = None
+    wiki_pages: Response[list[WikiPage]] | None = None
+    chronology: Response[list[TagChronology]] | None = None
+    distribution_nodes: PngResponse | None = None
+    distribution_ways: PngResponse | None = None
+    errors: dict[TagReportPart, PartError] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all requested parts are included."""
+        return not self.errors
+
+
+_TAG_CALLS: dict[TagReportPart, Callable[..., Awaitable[Response[Any] | PngResponse]]] = {
+    TagReportPart.OVERVIEW: tag_overview.call,
+    TagReportPart.STATS: tag_stats.call,
+    TagReportPart.COMBINATIONS: tag_combinations.call,
+    TagReportPart.PROJECTS: tag_projects.call,
+    TagReportPart.WIKI_PAGES: tag_wiki_pages.call,
+    TagReportPart.CHRONOLOGY: tag_chronology.call,
+    TagReportPart.DISTRIBUTION_NODES: tag_distribution_nodes.call,
+    TagReportPart.DISTRIBUTION_WAYS: tag_distribution_ways.call,
+}
+
+
+async def tag_report(
+    key: str,
+    value: str,
+    parts: Iterable[TagReportPart] = tuple(TagReportPart),
+    timeout: float | None = None,  # noqa: ASYNC109
+    session: ClientSession | Client | None = None,
+) -> TagReport:
+    """
+    Request data about a tag from several endpoints at the same time.
+
+    Args:
+        key: tag key
+        value: tag value
+        parts: the parts to include in the report; all of them by default
+        timeout: seconds after which parts that are not done yet are given up on,
+                 or ``None`` to wait for all of them
+        session: request client session, which is used for all requests
+
+    Returns:
+        a report with all parts that were successful, and the errors of the others
+    """
+    results, errors = await _gather(_TAG_CALLS, parts, timeout, session, key=key, value=value)
+    return TagReport(key=key, value=value, errors=errors, **results)
+
+
+async def _gather(
+    calls: Mapping[P, Callable[..., Awaitable[Any]]],
+    parts: Iterable[P],
+    timeout: float | None,  # noqa: ASYNC109
+    session: ClientSession | Client | None,
+    **kwargs: str,
+) -> tuple[dict[str, Any], dict[P, PartError]]:
+    """Make the calls of all parts at the same time, and sort their results from their errors."""
+    ephemeral_session = not session
+    session = session or ClientSession()
+    tasks = {
+        asyncio.ensure_future(calls[part](**kwargs, session=session)): part
+        for part in dict.fromkeys(parts)
+    }
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else (set(), set())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if ephemeral_session:
+            await session.close()
+
+    results: dict[str, Any] = {}
+    errors: dict[P, PartError] = {}
+    for task, part in tasks.items():
+        if task in pending:
+            errors[part] = TimeoutError(f"timed out after {timeout} seconds")
+            continue
+        error = task.exception()
+        if error is None:
+            results[part.value] = task.result()
+        elif isinstance(error, PartError):
+            errors[part] = error
+        else:
+            raise error
+    return results, errors
+
+
+__docformat__ = "google"
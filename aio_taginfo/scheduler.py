@@ -0,0 +1,228 @@
+"""
+Priority scheduler, which keeps bulk requests of a `aio_taginfo.client.Client` out of the way.
+
+Every request belongs to a priority class. While requests are waiting for a free slot,
+each class gets a share of the slots proportional to its weight (weighted fair queuing),
+and may also be capped to a number of concurrent requests, so that a crawl never occupies
+all connections:
+
+```python
+scheduler = Scheduler(concurrency=8, limits={Priority.BULK: 6})
+client = Client(scheduler=scheduler)
+
+async def crawl(keys):
+    with priority(Priority.BULK):
+        for key in keys:
+            await key_combinations(key=key, session=client)
+
+# not delayed by more than a few crawl requests
+overview = await key_overview(key="amenity", session=client)
+```
+
+Instead of a fixed number, the concurrency can also be an
+`aio_taginfo.limiter.AdaptiveConcurrency`, which adjusts itself to the server's load.
+
+The priority of a call is taken from the context it is made in, which is inherited by the
+tasks it creates. Calls outside of any `priority()` block have `Priority.DEFAULT`.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from enum import Enum
+from typing import TypeVar
+
+from aio_taginfo.limiter import AdaptiveConcurrency
+
+
+__all__ = (
+    "Priority",
+    "Scheduler",
+    "priority",
+)
+
+
+T = TypeVar("T")
+
+
+class Priority(str, Enum):
+    """Priority class of a request."""
+
+    INTERACTIVE = "interactive"
+    """Requests that a user is waiting for."""
+
+    DEFAULT = "default"
+    """Requests made outside of any `priority()` block."""
+
+    BULK = "bulk"
+    """Large numbers of requests that are not urgent, like crawls and exports."""
+
+
+DEFAULT_WEIGHTS: Mapping[Priority, float] = {
+    Priority.INTERACTIVE: 16.0,
+    Priority.DEFAULT: 4.0,
+    Priority.BULK: 1.0,
+}
+"""Default share of each priority class."""
+
+_PRIORITY: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "priority", default=Priority.DEFAULT
+)
+
+
+def priority(value: Priority) -> contextlib.AbstractContextManager[None]:
+    """Make calls in this block, and in tasks created in it, with the given priority."""
+    return _PriorityBlock(value)
+
+
+class _PriorityBlock(contextlib.AbstractContextManager[None]):
+    # not a generator-based context manager, since that would assign the traceback of
+    # errors raised in the block, which fails for the frozen error dataclasses
+    __slots__ = ("_token", "_value")
+
+    def __init__(self, value: Priority) -> None:
+        self._value = value
+        self._token: contextvars.Token[Priority] | None = None
+
+    def __enter__(self) -> None:
+        self._token = _PRIORITY.set(self._value)
+
+    def __exit__(self, *_: object) -> None:
+        assert self._token is not None
+        _PRIORITY.reset(self._token)
+
+
+class Scheduler:
+    """
+    Limits the number of concurrent requests, and orders waiting requests by priority.
+
+    Attributes:
+        concurrency: maximum number of requests in flight, or an adaptive limit
+        weights: share of slots of each priority class while requests are waiting
+        limits: maximum number of requests in flight of some priority classes
+    """
+
+    __slots__ = ("_active", "_in_flight", "_passes", "_virtual_time", "_waiting", "concurrency",
+                 "limits", "weights")  # fmt: skip
+
+    def __init__(
+        self,
+        concurrency: int | AdaptiveConcurrency = 10,
+        weights: Mapping[Priority, float] | None = None,
+        limits: Mapping[Priority, int] | None = None,
+    ) -> None:
+        """
+        Create a scheduler without any requests.
+
+        Args:
+            concurrency: maximum number of requests in flight, or an adaptive limit;
+                         this should not exceed the connection limit of the session
+            weights: share of slots of each priority class while requests are waiting;
+                     `DEFAULT_WEIGHTS` by default
+            limits: maximum number of requests in flight of some priority classes;
+                    by default, any class can use all slots
+        """
+        assert isinstance(concurrency, AdaptiveConcurrency) or concurrency > 0, (
+            "'concurrency' must be positive"
+        )
+        self.concurrency = concurrency
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.limits = dict(limits or {})
+        assert all(w > 0 for w in self.weights.values()), "weights must be positive"
+        assert all(n > 0 for n in self.limits.values()), "limits must be positive"
+
+        self._in_flight = 0
+        self._active = dict.fromkeys(Priority, 0)
+        self._waiting: dict[Priority, deque[asyncio.Future[None]]] = {p: deque() for p in Priority}
+        # stride scheduling: the class with the lowest pass is served next
+        self._passes = dict.fromkeys(Priority, 0.0)
+        self._virtual_time = 0.0
+        if isinstance(concurrency, AdaptiveConcurrency):
+            # requests wait for the limit to grow, not only for other requests to complete
+            concurrency.on_capacity_increase(self._dispatch)
+
+    def in_flight(self, value: Priority | None = None) -> int:
+        """Number of requests in flight, either in total or of the given priority class."""
+        return self._in_flight if value is None else self._active[value]
+
+    def waiting(self, value: Priority | None = None) -> int:
+        """Number of waiting requests, either in total or of the given priority class."""
+        if value is None:
+            return sum(len(queue) for queue in self._waiting.values())
+        return len(self._waiting[value])
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a call once a slot is free for the priority of the current context.
+
+        Args:
+            call: makes the request
+        """
+        value = _PRIORITY.get()
+        await self._acquire(value)
+        try:
+            if isinstance(self.concurrency, AdaptiveConcurrency):
+                return await self.concurrency.measure(call)
+            return await call()
+        finally:
+            self._release(value)
+
+    def _capacity(self) -> int:
+        if isinstance(self.concurrency, AdaptiveConcurrency):
+            return self.concurrency.capacity
+        return self.concurrency
+
+    def _can_start(self, value: Priority) -> bool:
+        limit = self.limits.get(value)
+        return self._in_flight < self._capacity() and (limit is None or self._active[value] < limit)
+
+    async def _acquire(self, value: Priority) -> None:
+        if not self._waiting[value]:
+            if self._can_start(value):
+                self._start(value)
+                return
+            # an idle class does not get to catch up on the slots it did not use
+            self._passes[value] = max(self._passes[value], self._virtual_time)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiting[value].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(value)  # the slot was already given to this request
+            else:
+                self._waiting[value].remove(waiter)
+            raise
+
+    def _start(self, value: Priority) -> None:
+        self._in_flight += 1
+        self._active[value] += 1
+        self._virtual_time = self._passes[value]
+        self._passes[value] += 1.0 / self.weights[value]
+
+    def _release(self, value: Priority) -> None:
+        self._in_flight -= 1
+        self._active[value] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self._capacity():
+            ready = [p for p in Priority if self._waiting[p] and self._can_start(p)]
+            if not ready:
+                return
+            value = min(ready, key=lambda p: self._passes[p])
+            self._start(value)
+            self._waiting[value].popleft().set_result(None)
+
+    def __repr__(self) -> str:
+        """String representation that includes the numbers of requests."""
+        return (
+            f"{self.__class__.__name__}(in_flight={self._in_flight}, waiting={self.waiting()}, "
+            f"concurrency={self._capacity()})"
+        )
+
+
+__docformat__ = "google"
@@ -0,0 +1,145 @@
+"""
+Bundled responses of static endpoints, for a cold start without any requests.
+
+Some endpoints describe the taginfo site itself, and hardly ever change, but are needed
+right after startup, like ``site/config/geodistribution`` to decode distribution maps.
+This package includes snapshots of their responses. `load_snapshots()` puts them into the
+cache of a `aio_taginfo.client.Client`, so that these calls are answered without waiting for
+a request:
+
+```python
+async with Client(stale_while_revalidate=True) as client:
+    load_snapshots(client)
+    geodistribution = await site_config_geodistribution(session=client)  # no request
+```
+
+Since the snapshots may be long outdated, they are put into the cache as stale responses,
+which a client only returns with ``stale_while_revalidate=True``, or when the circuit of
+their endpoint is open. They are requested again in the background right away, and until
+the requests are answered, or if they fail, the snapshots are used. With ``fresh=True``,
+the snapshots are used like fresh responses instead, for `SNAPSHOT_TTL` seconds after
+loading them. Either way, the cache's TTLs stay as they are, and apply to the responses
+that replace the snapshots.
+
+The bundled snapshots are updated with ``invoke snapshots``. Snapshots of the same calls
+can also be saved with `download_snapshots()`, and loaded from that file instead.
+
+The ``languages`` endpoint is not included, since its list of all language subtags is
+much larger than the responses of the other endpoints combined.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from aio_taginfo.api.v4.site import info as site_info
+from aio_taginfo.api.v4.site import sources as site_sources
+from aio_taginfo.api.v4.site.config import geodistribution as site_config_geodistribution
+from aio_taginfo.api.v4.wiki import languages as wiki_languages
+from aio_taginfo.client import Client, HotCall
+
+from aiohttp import ClientSession
+
+
+__all__ = (
+    "SNAPSHOT_CALLS",
+    "SNAPSHOT_TTL",
+    "download_snapshots",
+    "load_snapshots",
+)
+
+
+SNAPSHOT_CALLS: tuple[HotCall, ...] = (
+    site_config_geodistribution.call,
+    site_info.call,
+    site_sources.call,
+    wiki_languages.call,
+)
+"""The calls whose responses are bundled."""
+
+SNAPSHOT_TTL = 7 * 24 * 60 * 60.0
+"""Seconds after which snapshots loaded with ``fresh=True`` are no longer used."""
+
+_BUNDLED = Path(__file__).with_name("snapshots.json")
+
+
+def load_snapshots(
+    client: Client,
+    path: str | os.PathLike | None = None,
+    *,
+    revalidate: bool = True,
+    fresh: bool = False,
+) -> int:
+    """
+    Put snapshots into the cache of a client, unless it already has fresh responses.
+
+    Args:
+        client: the client whose cache is filled
+        path: a file saved with `download_snapshots()`; the bundled snapshots by default
+        revalidate: request the snapshots again in the background
+        fresh: use the snapshots like fresh responses for `SNAPSHOT_TTL` seconds, instead
+               of putting them into the cache as stale responses
+
+    Raises:
+        ValueError: if the file does not contain snapshots
+
+    Returns:
+        the number of snapshots that were put into the cache
+    """
+    responses = _read(Path(path) if path is not None else _BUNDLED)
+
+    cache = client.cache
+    loaded = 0
+    for key, payload in responses.items():
+        if key not in cache:
+            entry = cache.put(key, payload)
+            entry.ttl = SNAPSHOT_TTL
+            entry.stale = not fresh
+            loaded += 1
+
+    if revalidate:
+        client.revalidate(SNAPSHOT_CALLS)
+    return loaded
+
+
+async def download_snapshots(
+    path: str | os.PathLike,
+    session: ClientSession | None = None,
+) -> None:
+    """
+    Request the responses of all `SNAPSHOT_CALLS`, and save them to a file.
+
+    Args:
+        path: the file to save to, which is replaced if it exists
+        session: request client session
+
+    Raises:
+        TaginfoError
+    """
+    async with Client(session) as client:
+        for call in SNAPSHOT_CALLS:
+            await call(session=client)
+        responses = {
+            key: json.loads(entry.payload)
+            for key in sorted(client.cache.keys())
+            if (entry := client.cache.get(key)) is not None
+        }
+
+    snapshots = json.dumps({"responses": responses}, ensure_ascii=False, separators=(",", ":"))
+    tmp = Path(f"{os.fspath(path)}.tmp")
+    tmp.write_text(snapshots + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def _read(path: Path) -> dict[str, bytes]:
+    snapshots = json.loads(path.read_bytes())
+    if not isinstance(snapshots, dict) or not isinstance(snapshots.get("responses"), dict):
+        msg = f"{path} does not contain snapshots"
+        raise ValueError(msg)  # noqa: TRY004
+    return {
+        key: json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode()
+        for key, response in snapshots["responses"].items()
+    }
+
+
+__docformat__ = "google"
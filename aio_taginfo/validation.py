@@ -0,0 +1,109 @@
+"""
+Lenient validation of list responses.
+
+By default, a single item of a list response that fails validation makes the whole call
+fail with `aio_taginfo.error.TaginfoValidationError`. In a `lenient()` block, list responses
+are validated item by item instead, and only the invalid items are left out:
+
+```python
+with lenient() as report:
+    response = await key_combinations(key="highway", session=client)
+
+for rejected in report.rejected:
+    print(rejected.path, rejected.index, rejected.error)
+```
+
+The same response body is validated again, so no second request is made. The ``total``
+of a response still counts the rejected items. If a `aio_taginfo.client.Client` answers
+a page from all results that it cached, the rejected items of all results are reported
+for it, with their positions in all results. Responses that are not lists, and errors
+outside of the items, like a missing ``data_until``, still raise
+`aio_taginfo.error.TaginfoValidationError`.
+"""
+
+import contextlib
+import contextvars
+from dataclasses import dataclass, field
+from typing import Any
+
+import pydantic
+
+
+__all__ = (
+    "RejectedItem",
+    "ValidationReport",
+    "lenient",
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RejectedItem:
+    """
+    An item of a list response that failed validation.
+
+    Attributes:
+        path: the API path after "/api/4/", and the parameters of the request; if a
+              `aio_taginfo.client.Client` answered it from all results that it cached,
+              the parameters of the request for all results instead
+        index: the position of the item in the response, or in all results if those
+               answered the request
+        item: the item as it was decoded from JSON
+        error: the reason why it failed validation
+    """
+
+    path: str
+    index: int
+    item: Any = field(repr=False)
+    error: pydantic.ValidationError = field(repr=False)
+
+
+@dataclass(kw_only=True)
+class ValidationReport:
+    """
+    Items that were left out of the list responses in a `lenient()` block.
+
+    Attributes:
+        rejected: all rejected items, in the order in which their responses were returned
+    """
+
+    rejected: list[RejectedItem] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of rejected items."""
+        return len(self.rejected)
+
+
+_REPORT: contextvars.ContextVar[ValidationReport | None] = contextvars.ContextVar(
+    "validation_report", default=None
+)
+
+
+def lenient() -> contextlib.AbstractContextManager[ValidationReport]:
+    """Validate list responses item by item in this block, and in tasks created in it."""
+    return _LenientBlock()
+
+
+class _LenientBlock(contextlib.AbstractContextManager[ValidationReport]):
+    # not a generator-based context manager, since that would assign the traceback of
+    # errors raised in the block, which fails for the frozen error dataclasses
+    __slots__ = ("_token",)
+
+    def __init__(self) -> None:
+        self._token: contextvars.Token[ValidationReport | None] | None = None
+
+    def __enter__(self) -> ValidationReport:
+        report = ValidationReport()
+        self._token = _REPORT.set(report)
+        return report
+
+    def __exit__(self, *_: object) -> None:
+        assert self._token is not None
+        _REPORT.reset(self._token)
+
+
+def current_report() -> ValidationReport | None:
+    """The report of the innermost `lenient()` block, or ``None`` outside of any."""
+    return _REPORT.get()
+
+
+__docformat__ = "google"
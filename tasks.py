@@ -48,6 +48,55 @@ def lint(c: Context):
     c.run("pyright aio_taginfo/", echo=True, warn=True, pty=True)
 
 
+@task
+def loadtest(
+    c: Context,
+    users: int = 50,
+    duration: float = 10.0,
+    latency: float = 0.05,
+    error_rate: float = 0.0,
+    cache_entries: int = 1024,
+    connections: int = 100,
+    mix: str = "",
+    hedging: bool = False,
+    breaker: bool = False,
+    scheduler: bool = False,
+    adaptive_concurrency: bool = False,
+    json: bool = False,
+):
+    """Run a load test against a local stand-in server"""
+    args = (
+        f"--users {users} --duration {duration} --latency {latency} --error-rate {error_rate} "
+        f"--cache-entries {cache_entries} --connections {connections}"
+    )
+    if mix:
+        args += f" --mix {mix}"
+    for flag, enabled in (
+        ("--hedging", hedging),
+        ("--breaker", breaker),
+        ("--scheduler", scheduler),
+        ("--adaptive-concurrency", adaptive_concurrency),
+    ):
+        if enabled:
+            args += f" {flag}"
+    if json:
+        args += " --json"
+    c.run(f"python -m tests.v4.loadtest {args}", echo=True, pty=True)
+
+
+@task
+def snapshots(c: Context):
+    """Update the bundled snapshots of static endpoints"""
+    import asyncio
+    from pathlib import Path
+
+    from aio_taginfo.snapshots import download_snapshots
+
+    path = Path(__file__).parent / "aio_taginfo" / "snapshots.json"
+    asyncio.run(download_snapshots(path))
+    c.run(f"git diff --stat {path}", echo=True, pty=True)
+
+
 @task
 def test(c: Context):
     """Run tests"""
@@ -66,6 +115,56 @@ def tree(c: Context):
     c.run("poetry show --without=dev --tree", echo=True, pty=True)
 
 
+@task
+def unicode_scripts(c: Context, version: str = "latest"):
+    """Update the bundled table of Unicode scripts"""
+    import re
+    import urllib.request
+    from pathlib import Path
+
+    base_url = f"https://www.unicode.org/Public/{version}/ucd"
+
+    def read_lines(name: str) -> list[str]:
+        with urllib.request.urlopen(f"{base_url}/{name}") as response:
+            return response.read().decode("utf-8").splitlines()
+
+    codes = {}
+    for line in read_lines("PropertyValueAliases.txt"):
+        fields = [f.strip() for f in line.split("#")[0].split(";")]
+        if fields[0] == "sc":
+            codes[fields[2]] = fields[1]
+
+    script_lines = read_lines("Scripts.txt")
+    ranges = {}
+    for line in script_lines:
+        match = re.match(r"([0-9A-F]+)(?:\.\.([0-9A-F]+))?\s*;\s*(\w+)", line)
+        if match:
+            first, last, name = match.groups()
+            ranges[int(first, 16)] = (int(last or first, 16), codes[name])
+
+    lines = [
+        f"# Unicode scripts ({script_lines[0].lstrip('# ')}), generated with 'invoke unicode-scripts'",
+        "# ISO 15924 code and name of every script:",
+        *(f"{code} {name}" for name, code in sorted(codes.items(), key=lambda item: item[1])),
+        "# first code point (hex) and script code of every range:",
+    ]
+    prev_code, next_start = None, 0
+    for start in sorted(ranges):
+        last, code = ranges[start]
+        if start > next_start and prev_code != "Zzzz":
+            lines.append(f"{next_start:X} Zzzz")
+            prev_code = "Zzzz"
+        if code != prev_code:
+            lines.append(f"{start:X} {code}")
+            prev_code = code
+        next_start = last + 1
+    lines.append(f"{next_start:X} Zzzz")
+
+    path = Path(__file__).parent / "aio_taginfo" / "local" / "unicode_scripts.txt"
+    path.write_text("\n".join(lines) + "\n")
+    c.run(f"git diff --stat {path}", echo=True, pty=True)
+
+
 @task
 def update(c: Context):
     """Update dependencies"""
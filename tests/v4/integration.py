@@ -13,10 +13,38 @@ from aio_taginfo import (
     key_projects,
     key_similar,
     key_stats,
+    keys_all,
+    languages,
+    project_icon,
+    project_tags,
+    projects_all,
+    projects_keys,
+    projects_tags,
     relation_projects,
+    relation_roles,
+    relation_stats,
+    relations_all,
+    search_by_key_and_value,
+    search_by_keyword,
+    search_by_role,
+    search_by_value,
     site_config_geodistribution,
+    site_info,
+    site_sources,
+    tag_chronology,
+    tag_combinations,
+    tag_distribution_nodes,
+    tag_distribution_ways,
+    tag_overview,
     tag_projects,
+    tag_stats,
+    tag_wiki_pages,
+    tags_list,
     tags_popular,
+    unicode_characters,
+    wiki_languages,
+    wikidata_all,
+    wikidata_errors,
 )
 from aio_taginfo.api.v4 import ObjectType, Response, SortOrder
 from aio_taginfo.api.v4.key.similar import SimilarKeySorting
@@ -49,13 +77,44 @@ _CALLS = [
         ),
     ),
     (key_stats, dict(key="amenity")),
+    (keys_all, dict(query="addr", rp=10, page=2)),
+    (languages, dict(rp=10)),
+    (project_icon, dict(project="id_editor")),
+    (project_tags, dict(project="id_editor", rp=10)),
+    (projects_all, dict(rp=10)),
+    (projects_keys, dict(rp=10)),
+    (projects_tags, dict(rp=10)),
     (relation_projects, dict(rtype="route")),
+    (relation_roles, dict(rtype="multipolygon", rp=10)),
+    (relation_stats, dict(rtype="multipolygon")),
+    (relations_all, dict(rp=10)),
+    (search_by_key_and_value, dict(query="highway=residential", rp=10)),
+    (search_by_keyword, dict(query="fire", rp=10)),
+    (search_by_role, dict(query="foo", rp=10)),
+    (search_by_value, dict(query="foo", rp=10)),
     (site_config_geodistribution, dict()),
+    (site_info, dict()),
+    (site_sources, dict()),
+    (tag_chronology, dict(key="highway", value="primary")),
+    (tag_combinations, dict(key="highway", value="residential")),
+    (tag_distribution_nodes, dict(key="amenity", value="post_box")),
+    (tag_distribution_ways, dict(key="highway", value="residential")),
+    (tag_overview, dict(key="amenity", value="restaurant")),
     (tag_projects, dict(key="highway", value="residential")),
+    (tag_stats, dict(key="amenity", value="school")),
+    (tag_wiki_pages, dict(key="highway", value="residential")),
+    (
+        tags_list,
+        dict(tags=[("highway", "primary"), ("highway", "secondary"), ("amenity", "bench")]),
+    ),
     (
         tags_popular,
         dict(query="addr", sortname=PopularTagSorting.TAG, sortorder=SortOrder.ASC, rp=10, page=2),
     ),
+    (unicode_characters, dict(string="highway")),
+    (wiki_languages, dict()),
+    (wikidata_all, dict(lang="fr", rp=10)),
+    (wikidata_errors, dict(rp=10)),
 ]
 
 
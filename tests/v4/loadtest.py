@@ -0,0 +1,321 @@
+"""
+Load test of a Client against a local stand-in for the taginfo server.
+
+Run with ``invoke loadtest``, or ``python -m tests.v4.loadtest --help`` for all options.
+
+The stand-in server runs in a separate process, and answers every request with a fixture
+from ``tests/v4/responses`` after a random delay, or with an error at the given rate. Virtual
+users make calls from a weighted mix back to back, with keys and pages chosen from a
+skewed distribution so that some, but not all, calls are answered from the cache.
+
+The client's opt-in policies can be enabled to compare their effect on the same load:
+``--hedging``, ``--breaker``, ``--scheduler`` and ``--adaptive-concurrency``.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from aio_taginfo import (
+    key_chronology,
+    key_distribution_nodes,
+    key_distribution_ways,
+    key_overview,
+    tags_popular,
+)
+from aio_taginfo.breaker import CircuitBreaker
+from aio_taginfo.cache import ResponseCache
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoError
+from aio_taginfo.hedging import Hedging
+from aio_taginfo.limiter import AdaptiveConcurrency
+from aio_taginfo.scheduler import Scheduler
+
+import aiohttp
+from aiohttp import web
+from loguru import logger
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+_FIXTURES = {
+    "/api/4/key/overview": ("key_overview_amenity.json", "application/json"),
+    "/api/4/key/chronology": ("key_chronology_highway.json", "application/json"),
+    "/api/4/tags/popular": ("tags_popular.json", "application/json"),
+    "/api/4/key/distribution/nodes": ("key_distribtion_nodes_amenity.png", "image/png"),
+    "/api/4/key/distribution/ways": ("key_distribution_ways_highway.png", "image/png"),
+}
+
+_N_KEYS = 500
+_N_PAGES = 20
+
+
+def _key(rng: random.Random) -> str:
+    # a few keys are much more popular than others, like on the real server
+    return f"key{int(_N_KEYS ** rng.random())}"
+
+
+_Call = Callable[[random.Random, Client], Awaitable[Any]]
+
+_MIX: dict[str, _Call] = {
+    "key_overview": lambda rng, c: key_overview(key=_key(rng), session=c),
+    "tags_popular": lambda rng, c: tags_popular(
+        page=int(_N_PAGES ** rng.random()), rp=20, session=c
+    ),
+    "key_chronology": lambda rng, c: key_chronology(key=_key(rng), session=c),
+    "key_distribution_nodes": lambda rng, c: key_distribution_nodes(key=_key(rng), session=c),
+    "key_distribution_ways": lambda rng, c: key_distribution_ways(key=_key(rng), session=c),
+}
+
+_DEFAULT_MIX = "key_overview=5,tags_popular=3,key_chronology=2,key_distribution_nodes=1,key_distribution_ways=1"
+
+
+def _serve(latency: float, error_rate: float, ports: "multiprocessing.Queue[int]") -> None:
+    bodies = {path: (_RESPONSES / name).read_bytes() for path, (name, _) in _FIXTURES.items()}
+    rng = random.Random()  # noqa: S311
+
+    async def handle(request: web.Request) -> web.Response:
+        fixture = _FIXTURES.get(request.path)
+        if fixture is None:
+            return web.Response(status=404)
+        # exponentially distributed delays have the long tail of real server latencies
+        await asyncio.sleep(rng.expovariate(1 / latency) if latency else 0)
+        if rng.random() < error_rate:
+            return web.Response(status=503)
+        return web.Response(body=bodies[request.path], content_type=fixture[1])
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        ports.put(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+class _TimedClient(Client):
+    """Client that measures the CPU time spent validating responses."""
+
+    __slots__ = ("_timed", "validation_time")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.validation_time = 0.0
+        self._timed: dict[Callable, Callable] = {}
+
+    def _timed_decode(self, decode: Callable[[bytes], Any]) -> Callable[[bytes], Any]:
+        # the client caches decoded results by decode function, so wrap each one only once
+        timed = self._timed.get(decode)
+        if timed is None:
+
+            def timed(payload: bytes) -> Any:
+                start = time.thread_time()
+                try:
+                    return decode(payload)
+                finally:
+                    self.validation_time += time.thread_time() - start
+
+            self._timed[decode] = timed
+        return timed
+
+    async def _fetch(self, path, params, content_type, decode, key=None):
+        return await super()._fetch(path, params, content_type, self._timed_decode(decode), key)
+
+
+async def _run_users(
+    client: Client,
+    mix: dict[str, float],
+    users: int,
+    duration: float,
+    seed: int,
+) -> tuple[dict[str, list[float]], dict[str, int], float]:
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    deadline = time.monotonic() + duration
+
+    async def user(n: int) -> None:
+        rng = random.Random(seed + n)  # noqa: S311
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                await _MIX[name](rng, client)
+            except TaginfoError:
+                errors[name] += 1
+            latencies[name].append(time.perf_counter() - start)
+
+    start = time.monotonic()
+    await asyncio.gather(*(user(n) for n in range(users)))
+    return latencies, errors, time.monotonic() - start
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) < 2:
+        value = latencies[0] if latencies else float("nan")
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kibibytes on Linux, but bytes on macOS
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+_POLICIES = ("hedging", "breaker", "scheduler", "adaptive_concurrency")
+
+
+def _policies(args: argparse.Namespace) -> dict[str, Any]:
+    policies: dict[str, Any] = {
+        "hedging": Hedging() if args.hedging else None,
+        "breaker": CircuitBreaker() if args.breaker else None,
+    }
+    # the scheduler's slots are what the adaptive limit adjusts, if there is a scheduler
+    concurrency: int | AdaptiveConcurrency = args.connections
+    if args.adaptive_concurrency:
+        concurrency = AdaptiveConcurrency(max_limit=args.connections)
+    if args.scheduler:
+        policies["scheduler"] = Scheduler(concurrency=concurrency)
+    elif isinstance(concurrency, AdaptiveConcurrency):
+        policies["limiter"] = concurrency
+    return policies
+
+
+async def _load_test(args: argparse.Namespace, base_url: str) -> dict[str, Any]:
+    mix = {
+        name: float(weight) for name, _, weight in (p.partition("=") for p in args.mix.split(","))
+    }
+    unknown = set(mix) - set(_MIX)
+    if unknown:
+        msg = f"unknown calls in mix: {', '.join(sorted(unknown))}"
+        raise SystemExit(msg)
+
+    policies = _policies(args)
+    connector = aiohttp.TCPConnector(limit=args.connections)
+    async with (
+        aiohttp.ClientSession(connector=connector) as session,
+        _TimedClient(
+            session,
+            cache=ResponseCache(max_entries=args.cache_entries),
+            base_url=base_url,
+            **policies,
+        ) as client,
+    ):
+        cpu_start = time.process_time()
+        latencies, errors, elapsed = await _run_users(
+            client, mix, args.users, args.duration, args.seed
+        )
+        cpu_time = time.process_time() - cpu_start
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    by_call = {
+        name: {
+            "calls": len(latencies[name]),
+            "errors": errors[name],
+            "error_rate": errors[name] / len(latencies[name]) if latencies[name] else 0.0,
+            **_percentiles(latencies[name]),
+        }
+        for name in mix
+    }
+    return {
+        "users": args.users,
+        "policies": [name for name in _POLICIES if getattr(args, name)],
+        "duration": elapsed,
+        "calls": len(all_latencies),
+        "throughput": len(all_latencies) / elapsed,
+        "error_rate": sum(errors.values()) / len(all_latencies) if all_latencies else 0.0,
+        **_percentiles(all_latencies),
+        "cpu_time": cpu_time,
+        "validation_time": client.validation_time,
+        "peak_rss_mib": _peak_rss_mib(),
+        "by_call": by_call,
+    }
+
+
+def _log_report(report: dict[str, Any]) -> None:
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:8.1f}"
+
+    logger.info(
+        f"{'call':<24} {'calls':>9} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for name, stats in (*report["by_call"].items(), ("total", report)):
+        logger.info(
+            f"{name:<24} {stats['calls']:>9} {stats['error_rate']:>7.1%} "
+            f"{ms(stats['p50'])} {ms(stats['p95'])} {ms(stats['p99'])}"
+        )
+    logger.info(f"throughput:      {report['throughput']:.1f} calls/s with {report['users']} users")
+    logger.info(f"policies:        {', '.join(report['policies']) or 'none'}")
+    logger.info(f"CPU time:        {report['cpu_time']:.2f} s")
+    validation_share = report["validation_time"] / report["cpu_time"] if report["cpu_time"] else 0
+    logger.info(f"  in validation: {report['validation_time']:.2f} s ({validation_share:.0%})")
+    if report["peak_rss_mib"] is not None:
+        logger.info(f"peak RSS:        {report['peak_rss_mib']:.1f} MiB")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.v4.loadtest", description=__doc__)
+    parser.add_argument("--users", type=int, default=50, help="number of virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--mix", default=_DEFAULT_MIX, help="weights of calls, like 'a=2,b=1'")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean server latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of HTTP 503s")
+    parser.add_argument("--connections", type=int, default=100, help="connection pool size")
+    parser.add_argument("--cache-entries", type=int, default=1024, help="0 disables the cache")
+    parser.add_argument("--hedging", action="store_true", help="hedge slow requests")
+    parser.add_argument("--breaker", action="store_true", help="use a circuit breaker")
+    parser.add_argument("--scheduler", action="store_true", help="schedule requests by priority")
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        help="adapt the number of requests in flight, up to the connection pool size",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the virtual users")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    # the server runs in its own process, so that it does not add to the client's
+    # CPU time and memory usage
+    ctx = multiprocessing.get_context("spawn")
+    ports: multiprocessing.Queue[int] = ctx.Queue()
+    server = ctx.Process(target=_serve, args=(args.latency, args.error_rate, ports), daemon=True)
+    server.start()
+    try:
+        base_url = f"http://127.0.0.1:{ports.get(timeout=30)}/api/4/"
+        report = asyncio.run(_load_test(args, base_url))
+    finally:
+        server.terminate()
+        server.join()
+
+    if args.json:
+        sys.stdout.write(json.dumps(report, indent=2) + "\n")
+    else:
+        _log_report(report)
+
+
+if __name__ == "__main__":
+    main()
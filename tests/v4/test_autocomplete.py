@@ -0,0 +1,129 @@
+import asyncio
+import json
+import re
+from pathlib import Path
+
+from aio_taginfo import search_by_keyword, search_by_value
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.autocomplete import NO_DATA_UNTIL, Autocomplete
+
+import pytest
+from aioresponses import aioresponses
+
+
+def _response(query: str, data: list) -> Response[list[str]]:
+    return Response(
+        data=data,
+        data_until="2024-04-28T00:59:42Z",
+        url=f"https://taginfo.openstreetmap.org/api/4/search/by_value?query={query}",
+        total=len(data),
+    )
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_debounce():
+    queries = []
+
+    async def search(query, **_):
+        queries.append(query)
+        return _response(query, [query])
+
+    autocomplete = Autocomplete(search, delay=0.05)
+    results = await asyncio.gather(*(autocomplete.query(text) for text in ("f", "fo", "foo")))
+
+    assert queries == ["foo"]
+    assert [r.data if r else None for r in results] == [None, None, ["foo"]]
+    assert autocomplete.requests == 1
+
+    # same query again: answered from the cache
+    assert (await autocomplete.query("foo")).data == ["foo"]
+    assert autocomplete.cache_hits == 1
+    _ = repr(autocomplete)
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_cancels_superseded_requests():
+    cancelled = []
+
+    async def search(query, **_):
+        try:
+            await asyncio.sleep(1.0 if query == "slow" else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        return _response(query, [query])
+
+    autocomplete = Autocomplete(search, delay=0.0)
+    slow = asyncio.ensure_future(autocomplete.query("slow"))
+    await asyncio.sleep(0.01)
+    fast = await autocomplete.query("fast")
+
+    assert fast.data == ["fast"]
+    assert await slow is None
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_errors():
+    async def search(query, **_):
+        raise ValueError(query)
+
+    autocomplete = Autocomplete(search, delay=0.0)
+    with pytest.raises(ValueError, match="foo"):
+        await autocomplete.query("foo")
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_filters_complete_results():
+    test_dir = Path(__file__).resolve().parent
+    response = json.loads((test_dir / "responses" / "search_by_value_foo.json").read_text())
+    response["total"] = len(response["data"])
+
+    with aioresponses() as m:
+        m.get(
+            re.compile(r"https://taginfo\.openstreetmap\.org/api/4/search/by_value\?.*query=foo.*"),
+            body=json.dumps(response),
+            status=200,
+            content_type="application/json",
+        )
+        autocomplete = Autocomplete(search_by_value, rp=10, delay=0.0)
+        assert len((await autocomplete.query("foo")).data) == 10
+
+        # "foo@" contains "foo", of which all results are known
+        extended = await autocomplete.query("FOO@")
+
+    assert autocomplete.requests == 1
+    assert autocomplete.cache_hits == 1
+    assert [item.value for item in extended.data] == ["foo@vegecoffee.com"]
+    assert extended.total == 1
+    assert "query=FOO%40" in str(extended.url)
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_blank_text():
+    queries = []
+
+    async def search(query, **_):
+        queries.append(query)
+        return _response(query, [query])
+
+    autocomplete = Autocomplete(search, delay=0.0)
+    assert (await autocomplete.query("")).data_until == NO_DATA_UNTIL
+    assert NO_DATA_UNTIL.isoformat() == "1970-01-01T00:00:00+00:00"
+    assert (await autocomplete.query("  foo ")).data == ["foo"]
+    assert (await autocomplete.query("foo")).data == ["foo"]
+    assert queries == ["foo"]
+    assert autocomplete.cache_hits == 1
+
+    empty = await autocomplete.query("   ")
+    assert (empty.data, empty.total) == ([], 0)
+    assert empty.data_until.year == 2024
+    assert autocomplete.requests == 1
+
+    # the endpoints reject blank queries, but no request is made
+    autocomplete = Autocomplete(search_by_keyword, delay=0.0)
+    with aioresponses():
+        empty = await autocomplete.query(" ")
+    assert empty.data_until == NO_DATA_UNTIL
+    assert str(empty.url).startswith("https://taginfo.openstreetmap.org/api/4/search/by_keyword")
+    assert autocomplete.requests == 0
@@ -0,0 +1,76 @@
+import asyncio
+from itertools import pairwise
+from pathlib import Path
+
+from aio_taginfo._http import api_url
+from aio_taginfo.api.v4.tags.list import encode_tags
+from aio_taginfo.batch import TagBatcher, _pack
+from aio_taginfo.error import TaginfoCallError, TaginfoValueError
+
+import pytest
+from aioresponses import aioresponses
+
+
+_URL = "https://taginfo.openstreetmap.org/api/4/tags/list"
+
+
+def test_pack_respects_url_length():
+    tags = [(f"key{i % 7}", f"value{i}") for i in range(500)]
+    batches = _pack(tags, max_url_length=300)
+
+    assert sorted(tag for batch in batches for tag in batch) == sorted(tags)
+    for batch in batches:
+        assert batch == sorted(batch)
+        assert len(api_url("tags/list", {"tags": encode_tags(batch)})) <= 300
+
+    # every batch is as large as possible
+    for batch, next_batch in pairwise(batches):
+        assert len(api_url("tags/list", {"tags": encode_tags([*batch, next_batch[0]])})) > 300
+
+    assert _pack([("a", "b")], max_url_length=10) == [[("a", "b")]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_lookups():
+    test_dir = Path(__file__).resolve().parent
+    response_str = (test_dir / "responses" / "tags_list_highway_amenity.json").read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{_URL}?tags=amenity=post_box,highway=nonexistent,primary,secondary",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        async with TagBatcher() as batcher:
+            results = await asyncio.gather(
+                batcher.get("highway", "primary"),
+                batcher.get("amenity", "post_box"),
+                batcher.get("highway", "secondary"),
+                batcher.get("highway", "primary"),
+                batcher.get("highway", "nonexistent"),
+            )
+
+    primary, post_box, secondary, primary_again, nonexistent = results
+    assert (primary.key, primary.value) == ("highway", "primary")
+    assert (post_box.key, post_box.value) == ("amenity", "post_box")
+    assert (secondary.key, secondary.value) == ("highway", "secondary")
+    assert primary_again is primary
+    assert nonexistent is None
+
+
+@pytest.mark.asyncio
+async def test_batcher_errors():
+    with aioresponses() as m:
+        m.get(url=f"{_URL}?tags=a=1,2", status=500)
+        async with TagBatcher() as batcher:
+            with pytest.raises(TaginfoValueError):
+                await batcher.get("a", "1,2")
+
+            results = await asyncio.gather(
+                batcher.get("a", "1"),
+                batcher.get("a", "2"),
+                return_exceptions=True,
+            )
+
+    assert all(isinstance(result, TaginfoCallError) for result in results)
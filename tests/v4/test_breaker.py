@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+from aio_taginfo import key_stats
+from aio_taginfo.breaker import CircuitBreaker, CircuitState
+from aio_taginfo.cache import ResponseCache
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+
+def _fail(status: int):
+    async def call():
+        cause = aiohttp.ClientResponseError(None, (), status=status)  # type: ignore[arg-type]
+        raise TaginfoCallError(cause=cause)
+
+    return call
+
+
+async def _succeed():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_closes(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.breaker.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, open_duration=30.0)
+
+    assert await breaker.run("a", _succeed) == "ok"
+    for _ in range(3):
+        with pytest.raises(TaginfoCallError):
+            await breaker.run("a", _fail(503))
+    assert breaker.state("a") is CircuitState.OPEN
+    assert breaker.state("b") is CircuitState.CLOSED
+
+    # fail fast, without making the call
+    with pytest.raises(TaginfoCircuitOpenError) as err:
+        await breaker.run("a", _succeed)
+    assert err.value.retry_after == 30.0
+    assert err.value.cause is not None
+    assert err.value.cause.status == 503
+    assert await breaker.run("b", _succeed) == "ok"
+
+    # a failed trial call opens the circuit again
+    now = 30.0
+    assert breaker.state("a") is CircuitState.HALF_OPEN
+    with pytest.raises(TaginfoCallError):
+        await breaker.run("a", _fail(500))
+    assert breaker.state("a") is CircuitState.OPEN
+
+    # a successful trial call closes it
+    now = 60.0
+    assert await breaker.run("a", _succeed) == "ok"
+    assert breaker.state("a") is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_ignores_client_errors():
+    breaker = CircuitBreaker(window=4, min_calls=4)
+    for _ in range(4):
+        with pytest.raises(TaginfoCallError):
+            await breaker.run("a", _fail(404))
+    assert breaker.state("a") is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_falls_back_to_stale_responses(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.cache.time.monotonic", lambda: now)
+    monkeypatch.setattr("aio_taginfo.breaker.time.monotonic", lambda: now)
+
+    url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+    other_url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=highway"
+    response = json.loads((_RESPONSES / "key_stats_amenity.json").read_text())
+    breaker = CircuitBreaker(window=2, min_calls=2)
+
+    async with Client(cache=ResponseCache(ttl=10.0), breaker=breaker) as client:
+        with aioresponses() as m:
+            m.get(url=url, body=json.dumps(response), status=200, content_type="application/json")
+            cached = await key_stats(key="amenity", session=client)
+
+            now = 11.0
+            m.get(url=url, status=500, repeat=True)
+            m.get(url=other_url, status=500, repeat=True)
+            with pytest.raises(TaginfoCallError):
+                await key_stats(key="amenity", session=client)
+            with pytest.raises(TaginfoCallError):
+                await key_stats(key="highway", session=client)
+
+            assert breaker.state("taginfo.openstreetmap.org/key/stats") is CircuitState.OPEN
+            assert await key_stats(key="amenity", session=client) is cached
+            with pytest.raises(TaginfoCircuitOpenError):
+                await key_stats(key="highway", session=client)
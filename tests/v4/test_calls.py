@@ -1,4 +1,5 @@
 import datetime
+import json
 from pathlib import Path
 
 from aio_taginfo import (
@@ -11,19 +12,63 @@ from aio_taginfo import (
     key_projects,
     key_similar,
     key_stats,
+    keys_all,
+    languages,
+    project_icon,
+    project_tags,
+    projects_all,
+    projects_keys,
+    projects_tags,
     relation_projects,
+    relation_roles,
+    relation_stats,
+    relations_all,
+    search_by_key_and_value,
+    search_by_keyword,
+    search_by_role,
+    search_by_value,
     site_config_geodistribution,
+    site_info,
+    site_sources,
+    tag_chronology,
+    tag_combinations,
+    tag_distribution_nodes,
+    tag_distribution_ways,
+    tag_overview,
     tag_projects,
+    tag_stats,
+    tag_wiki_pages,
+    tags_list,
     tags_popular,
+    unicode_characters,
+    wiki_languages,
+    wikidata_all,
+    wikidata_errors,
 )
 from aio_taginfo.api.v4 import ObjectType, SortOrder
 from aio_taginfo.api.v4.key.combinations import KeyCombinationSorting
 from aio_taginfo.api.v4.key.projects import KeyProjectSorting
 from aio_taginfo.api.v4.key.similar import SimilarKeySorting
+from aio_taginfo.api.v4.keys.all import KeyListFilter, KeyListSorting
+from aio_taginfo.api.v4.keys.all import call_pages as keys_all_pages
+from aio_taginfo.api.v4.project.tags import call_pages as project_tags_pages
+from aio_taginfo.api.v4.projects.tags import ProjectTagSorting
 from aio_taginfo.api.v4.relation.projects import RelationProjectSorting
+from aio_taginfo.api.v4.tag.chronology import call_stream as tag_chronology_stream
+from aio_taginfo.api.v4.tag.combinations import TagCombinationSorting
+from aio_taginfo.api.v4.tag.distribution.nodes import call_stream as tag_distribution_nodes_stream
 from aio_taginfo.api.v4.tag.projects import TagProjectSorting
 from aio_taginfo.api.v4.tags.popular import PopularTagSorting
-from aio_taginfo.error import TaginfoCallError, TaginfoValidationError, TaginfoValueError
+from aio_taginfo.api.v4.wiki.languages import WikiLanguageSorting
+from aio_taginfo.client import Client
+from aio_taginfo.error import (
+    TaginfoCallError,
+    TaginfoCircuitOpenError,
+    TaginfoDataChangedError,
+    TaginfoError,
+    TaginfoValidationError,
+    TaginfoValueError,
+)
 
 import aiohttp
 import pytest
@@ -529,3 +574,627 @@ async def test_tag_projects():
             page=2,
             rp=10,
         )
+
+
+@pytest.mark.asyncio
+async def test_keys_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "keys_all.json"
+    response_str = data_file.read_text()
+
+    base_url = "https://taginfo.openstreetmap.org/api/4/keys/all"
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?page=1&rp=0&sortname=key&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await keys_all()
+
+    assert response.data[0].key == "*"
+    _, _ = str(response), repr(response)
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?filter=in_wiki&page=2&query=addr&rp=10&sortname=count_all&sortorder=desc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        _response = await keys_all(
+            query="addr",
+            filter=KeyListFilter.IN_WIKI,
+            sortname=KeyListSorting.COUNT_ALL,
+            sortorder=SortOrder.DESC,
+            page=2,
+            rp=10,
+        )
+
+    with pytest.raises(TaginfoValueError):
+        await keys_all(filter="something else")
+
+    with pytest.raises(TaginfoValueError):
+        await keys_all(rp=-1)
+
+
+@pytest.mark.asyncio
+async def test_keys_all_pages():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "keys_all.json"
+    response_str = data_file.read_text()  # total is 5443
+
+    base_url = "https://taginfo.openstreetmap.org/api/4/keys/all"
+
+    with aioresponses() as m:
+        for page in (1, 2):
+            m.get(
+                url=f"{base_url}?page={page}&rp=5000&sortname=key&sortorder=asc",
+                body=response_str,
+                status=200,
+                content_type="application/json",
+            )
+        pages = [page async for page in keys_all_pages(rp=5000, concurrency=2)]
+
+    assert len(pages) == 2
+    assert pages[0].data[0].key == "*"
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?page=1&rp=0&sortname=key&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        pages = [page async for page in keys_all_pages(rp=0)]
+
+    assert len(pages) == 1
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?page=1&rp=5000&sortname=key&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        m.get(
+            url=f"{base_url}?page=2&rp=5000&sortname=key&sortorder=asc",
+            status=500,
+        )
+        with pytest.raises(TaginfoCallError):
+            _pages = [page async for page in keys_all_pages(rp=5000)]
+
+
+@pytest.mark.asyncio
+async def test_tags_list():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tags_list_highway_amenity.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/tags/list?tags=highway=primary,secondary,amenity=post_box",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await tags_list(
+            tags=[("highway", "primary"), ("highway", "secondary"), ("amenity", "post_box")]
+        )
+
+    assert [item.value for item in response.data] == ["primary", "secondary", "post_box"]
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await tags_list(tags=[])
+
+    with pytest.raises(TaginfoValueError):
+        await tags_list(tags=[("highway", "primary,secondary")])
+
+    with pytest.raises(TaginfoValueError):
+        await tags_list(tags=[("a=b", "c")])
+
+    # whitespace around values is sent as given
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/tags/list?tags=name=Main+Street+",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        await tags_list(tags=[("name", "Main Street ")])
+
+
+@pytest.mark.asyncio
+async def test_unicode_characters():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "unicode_characters_highway.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/unicode/characters?string=highway",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await unicode_characters(string="highway")
+
+    assert "".join(item.char for item in response.data) == "highway"
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await unicode_characters(string="")
+
+
+@pytest.mark.asyncio
+async def test_project_icon():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "project_icon_id_editor.png"
+    image_bytes = data_file.read_bytes()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/project/icon?project=id_editor",
+            body=image_bytes,
+            status=200,
+            content_type="image/png",
+        )
+        response = await project_icon(project="id_editor")
+
+    assert response.data == image_bytes
+
+    with pytest.raises(TaginfoValueError):
+        await project_icon(project="")
+
+
+@pytest.mark.asyncio
+async def test_project_tags():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "project_tags_id_editor.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/project/tags?page=1&project=id_editor&rp=10&sortname=tag&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await project_tags(project="id_editor", rp=10)
+
+    assert response.data[0].key == "FIXME"
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await project_tags(project="")
+
+
+@pytest.mark.asyncio
+async def test_project_tags_pages():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "project_tags_id_editor.json"
+    response = json.loads(data_file.read_text())
+    response["total"] = 15
+
+    url = "https://taginfo.openstreetmap.org/api/4/project/tags?project=id_editor&rp=10&sortname=tag&sortorder=asc"
+    with aioresponses() as m:
+        m.get(
+            url=f"{url}&page=1",
+            body=json.dumps(response),
+            status=200,
+            content_type="application/json",
+        )
+        m.get(
+            url=f"{url}&page=2",
+            body=json.dumps({**response, "page": 2, "data": response["data"][:5]}),
+            status=200,
+            content_type="application/json",
+        )
+        pages = [page async for page in project_tags_pages(project="id_editor", rp=10)]
+
+    assert [len(page.data) for page in pages] == [10, 5]
+
+
+@pytest.mark.asyncio
+async def test_projects_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_all.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/projects/all?page=1&rp=10&sortname=name&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await projects_all(rp=10)
+
+    assert response.total == 207
+    assert response.data[0].id == "architects_in_osm"
+    _, _ = str(response), repr(response)
+
+
+@pytest.mark.asyncio
+async def test_projects_keys():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_keys.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/projects/keys?page=1&rp=10&sortname=key&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await projects_keys(rp=10)
+
+    assert response.data[0].key == "3dmr"
+    _, _ = str(response), repr(response)
+
+
+@pytest.mark.asyncio
+async def test_projects_tags():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_tags.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/projects/tags?page=1&rp=10&sortname=tag&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await projects_tags(rp=10, sortname=ProjectTagSorting.TAG)
+
+    assert response.total == 193215
+    assert response.data[0].value == "0.0"
+    _, _ = str(response), repr(response)
+
+
+@pytest.mark.asyncio
+async def test_wikidata_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "wikidata_all_fr.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/wikidata/all?lang=fr&page=1&rp=10&sortname=item&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await wikidata_all(lang="fr", rp=10)
+
+    assert response.total == 3006
+    assert response.data[0].item == "P17"
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await wikidata_all(lang="")
+
+
+@pytest.mark.asyncio
+async def test_wikidata_errors():
+    response = {
+        "url": "https://taginfo.openstreetmap.org/api/4/wikidata/errors?page=1&rp=10&sortname=code&sortorder=asc",
+        "data_until": "2024-04-28T00:59:42Z",
+        "page": 1,
+        "rp": 10,
+        "total": 1,
+        "data": [{"code": "tag", "item": "Q1", "propvalue": "amenity=", "description": ""}],
+    }
+
+    with aioresponses() as m:
+        m.get(
+            url=response["url"],
+            body=json.dumps(response),
+            status=200,
+            content_type="application/json",
+        )
+        errors = await wikidata_errors(rp=10)
+
+    assert errors.data[0].propvalue == "amenity="
+    assert errors.data[0].description is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "endpoint", "query", "fixture"),
+    [
+        (search_by_key_and_value, "by_key_and_value", "highway=residential", "highway_residential"),
+        (search_by_keyword, "by_keyword", "fire", "fire"),
+        (search_by_role, "by_role", "foo", "foo"),
+        (search_by_value, "by_value", "foo", "foo"),
+    ],
+)
+async def test_search(call, endpoint, query, fixture):
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / f"search_{endpoint}_{fixture}.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url=f"https://taginfo.openstreetmap.org/api/4/search/{endpoint}?page=1&query={query}&rp=10",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await call(query=query, rp=10)
+
+    assert len(response.data) == 10
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await call(query="")
+
+
+@pytest.mark.asyncio
+async def test_relation_roles():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relation_roles_multipolygon.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/relation/roles?page=1&rp=10&rtype=multipolygon&sortname=role&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await relation_roles(rtype="multipolygon", rp=10)
+
+    assert response.total == 237
+    _, _ = str(response), repr(response)
+
+    with pytest.raises(TaginfoValueError):
+        await relation_roles(rtype="")
+
+
+@pytest.mark.asyncio
+async def test_relation_stats():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relation_stats_multipolygon.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/relation/stats?rtype=multipolygon",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await relation_stats(rtype="multipolygon")
+
+    assert [s.type for s in response.data] == [
+        ObjectType.ALL,
+        ObjectType.NODES,
+        ObjectType.WAYS,
+        ObjectType.RELATIONS,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_relations_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relations_all.json"
+    response_str = data_file.read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/relations/all?page=1&rp=10&sortname=rtype&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await relations_all(rp=10)
+
+    assert response.total == 775
+    assert response.data[0].rtype == ""
+    _, _ = str(response), repr(response)
+
+
+@pytest.mark.asyncio
+async def test_tag_chronology():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_chronology_highway_primary.json"
+    response_str = data_file.read_text()
+
+    url = "https://taginfo.openstreetmap.org/api/4/tag/chronology?key=highway&value=primary"
+
+    with aioresponses() as m:
+        m.get(url=url, body=response_str, status=200, content_type="application/json")
+        response = await tag_chronology(key="highway", value="primary")
+
+    assert response.data[0].date == datetime.date(2007, 10, 7)
+    _, _ = str(response), repr(response)
+
+    with aioresponses() as m:
+        m.get(url=url, body=response_str, status=200, content_type="application/json")
+        streamed = [entry async for entry in tag_chronology_stream(key="highway", value="primary")]
+
+    assert streamed == response.data
+
+    with aioresponses() as m:
+        m.get(url=url, body=response_str, status=200, content_type="application/json")
+        async with Client() as client:
+            streamed = [
+                entry
+                async for entry in tag_chronology_stream(
+                    key="highway", value="primary", session=client
+                )
+            ]
+
+    assert streamed == response.data
+
+    with aioresponses() as m:
+        m.get(url=url, body=response_str[:-100], status=200, content_type="application/json")
+        with pytest.raises(TaginfoValidationError):
+            _ = [entry async for entry in tag_chronology_stream(key="highway", value="primary")]
+
+        m.get(url=url, status=503)
+        with pytest.raises(TaginfoCallError):
+            _ = [entry async for entry in tag_chronology_stream(key="highway", value="primary")]
+
+
+@pytest.mark.asyncio
+async def test_tag_combinations():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_combinations_highway_residential.json"
+    response_str = data_file.read_text()
+
+    base_url = "https://taginfo.openstreetmap.org/api/4/tag/combinations"
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?filter=all&key=highway&page=1&rp=0&sortname=together_count&sortorder=desc&value=residential",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        response = await tag_combinations(key="highway", value="residential")
+
+    assert response.data[0].together_count == 26583503
+    _, _ = str(response), repr(response)
+
+    with aioresponses() as m:
+        m.get(
+            url=f"{base_url}?filter=ways&key=highway&page=2&query=name&rp=10&sortname=other_tag&sortorder=asc&value=residential",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        _response = await tag_combinations(
+            key="highway",
+            value="residential",
+            query="name",
+            sortname=TagCombinationSorting.OTHER_TAG,
+            sortorder=SortOrder.ASC,
+            filter=ObjectType.WAYS,
+            page=2,
+            rp=10,
+        )
+
+
+@pytest.mark.asyncio
+async def test_tag_overview_stats_and_wiki_pages():
+    test_dir = Path(__file__).resolve().parent
+    base_url = "https://taginfo.openstreetmap.org/api/4/tag"
+
+    with aioresponses() as m:
+        for path, query, response_file in (
+            ("overview", "key=amenity&value=restaurant", "tag_overview_amenity_restaurant.json"),
+            ("stats", "key=amenity&value=school", "tag_stats_amenity_school.json"),
+            (
+                "wiki_pages",
+                "key=highway&value=residential",
+                "tag_wiki_pages_highway_residential.json",
+            ),
+        ):
+            m.get(
+                url=f"{base_url}/{path}?{query}",
+                body=(test_dir / "responses" / response_file).read_text(),
+                status=200,
+                content_type="application/json",
+            )
+        overview = await tag_overview(key="amenity", value="restaurant")
+        stats = await tag_stats(key="amenity", value="school")
+        wiki_pages = await tag_wiki_pages(key="highway", value="residential")
+
+    assert overview.data.key == "amenity"
+    assert stats.data[0].type == ObjectType.ALL
+    assert wiki_pages.total == len(wiki_pages.data)
+    _, _ = str(wiki_pages), repr(wiki_pages)
+
+    with pytest.raises(TaginfoValueError):
+        await tag_overview(key="amenity", value="")
+
+
+@pytest.mark.asyncio
+async def test_tag_distribution():
+    test_dir = Path(__file__).resolve().parent
+    base_url = "https://taginfo.openstreetmap.org/api/4/tag/distribution"
+    nodes_bytes = (
+        test_dir / "responses" / "tag_distribution_nodes_amenity_post_box.png"
+    ).read_bytes()
+    ways_bytes = (
+        test_dir / "responses" / "tag_distribution_ways_highway_residential.png"
+    ).read_bytes()
+    nodes_url = f"{base_url}/nodes?key=amenity&value=post_box"
+
+    with aioresponses() as m:
+        m.get(url=nodes_url, body=nodes_bytes, status=200, content_type="image/png")
+        m.get(
+            url=f"{base_url}/ways?key=highway&value=residential",
+            body=ways_bytes,
+            status=200,
+            content_type="image/png",
+        )
+        nodes = await tag_distribution_nodes(key="amenity", value="post_box")
+        ways = await tag_distribution_ways(key="highway", value="residential")
+
+    assert nodes.data == nodes_bytes
+    assert ways.data == ways_bytes
+
+    with aioresponses() as m:
+        m.get(url=nodes_url, body=nodes_bytes, status=200, content_type="image/png")
+        chunks = [c async for c in tag_distribution_nodes_stream(key="amenity", value="post_box")]
+
+    assert b"".join(chunks) == nodes_bytes
+
+    with aioresponses() as m:
+        m.get(url=nodes_url, body=b"nonsense", status=200, content_type="image/png")
+        with pytest.raises(TaginfoValidationError):
+            _ = [c async for c in tag_distribution_nodes_stream(key="amenity", value="post_box")]
+
+        m.get(url=nodes_url, status=404)
+        with pytest.raises(TaginfoCallError):
+            _ = [c async for c in tag_distribution_nodes_stream(key="amenity", value="post_box")]
+
+
+@pytest.mark.asyncio
+async def test_site_and_language_endpoints():
+    test_dir = Path(__file__).resolve().parent
+    base_url = "https://taginfo.openstreetmap.org/api/4"
+
+    with aioresponses() as m:
+        for path, response_file in (
+            ("languages?page=1&rp=10", "languages.json"),
+            ("site/info", "site_info.json"),
+            ("site/sources", "site_sources.json"),
+            ("wiki/languages?sortname=english_name&sortorder=asc", "wiki_languages.json"),
+        ):
+            m.get(
+                url=f"{base_url}/{path}",
+                body=(test_dir / "responses" / response_file).read_text(),
+                status=200,
+                content_type="application/json",
+            )
+        subtags = await languages(rp=10)
+        info = await site_info()
+        sources = await site_sources()
+        wiki = await wiki_languages(
+            sortname=WikiLanguageSorting.ENGLISH_NAME, sortorder=SortOrder.ASC
+        )
+
+    assert subtags.rp == 10
+    assert info.name == "OpenStreetMap Taginfo"
+    assert len(sources) == 6
+    assert wiki.total == 59
+    _, _ = str(wiki), repr(wiki)
+
+
+def test_taginfo_error_base_class():
+    for cls in (
+        TaginfoValueError,
+        TaginfoCallError,
+        TaginfoCircuitOpenError,
+        TaginfoDataChangedError,
+        TaginfoValidationError,
+    ):
+        assert issubclass(cls, TaginfoError)
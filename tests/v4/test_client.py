@@ -0,0 +1,389 @@
+import asyncio
+import functools
+import json
+import threading
+from pathlib import Path
+
+from aio_taginfo import (
+    key_combinations,
+    key_distribution_nodes,
+    key_similar,
+    key_stats,
+    tags_popular,
+)
+from aio_taginfo.api.v4 import ObjectType, SortOrder
+from aio_taginfo.api.v4.key.combinations import KeyCombinationSorting
+from aio_taginfo.api.v4.key.similar import SimilarKeySorting
+from aio_taginfo.api.v4.tags.popular import PopularTagSorting
+from aio_taginfo.cache import ResponseCache
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError, TaginfoValidationError
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+
+def test_response_cache(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.cache.time.monotonic", lambda: now)
+
+    cache = ResponseCache(max_entries=2, ttl=10.0)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a").payload == b"1"
+    cache.put("c", b"3")  # evicts "b", which was used least recently
+    assert "b" not in cache
+    assert "a" in cache
+    assert len(cache) == 2
+
+    now = 11.0
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+    cache.discard("a")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+    disabled = ResponseCache(max_entries=0)
+    disabled.put("a", b"1")
+    assert "a" not in disabled
+
+
+@pytest.mark.asyncio
+async def test_client_caches_responses():
+    image_bytes = (_RESPONSES / "key_distribtion_nodes_amenity.png").read_bytes()
+    url = "https://taginfo.openstreetmap.org/api/4/key/distribution/nodes?key=amenity"
+
+    async with Client() as client:
+        with aioresponses() as m:
+            m.get(url=url, body=image_bytes, status=200, content_type="image/png")
+            first = await key_distribution_nodes(key="amenity", session=client)
+            second = await key_distribution_nodes(key="amenity", session=client)
+
+        assert first is second
+        assert len(client.cache) == 1
+
+        # invalid responses are not cached
+        with aioresponses() as m:
+            m.get(url=f"{url}s", body=b"nonsense", status=200, content_type="image/png")
+            m.get(url=f"{url}s", body=image_bytes, status=200, content_type="image/png")
+            with pytest.raises(TaginfoValidationError):
+                await key_distribution_nodes(key="amenitys", session=client)
+            await key_distribution_nodes(key="amenitys", session=client)
+
+        assert len(client.cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_client_pages_from_cached_results():
+    response_str = (_RESPONSES / "key_similar_highway.json").read_text()
+    base_url = "https://taginfo.openstreetmap.org/api/4/key/similar"
+
+    async with Client() as client:
+        with aioresponses() as m:
+            # without all results cached, pages are requested
+            m.get(
+                url=f"{base_url}?key=highway&page=2&rp=10&sortname=other_key&sortorder=asc",
+                body=response_str,
+                status=200,
+                content_type="application/json",
+            )
+            await key_similar(key="highway", page=2, rp=10, session=client)
+
+            m.get(
+                url=f"{base_url}?key=highway&page=1&rp=0&sortname=other_key&sortorder=asc",
+                body=response_str,
+                status=200,
+                content_type="application/json",
+            )
+            everything = await key_similar(key="highway", session=client)
+
+            # no more requests after this point
+            page = await key_similar(
+                key="highway",
+                query="HIGH",
+                sortname=SimilarKeySorting.COUNT_ALL,
+                sortorder=SortOrder.DESC,
+                page=2,
+                rp=5,
+                session=client,
+            )
+            resorted = await key_similar(
+                key="highway",
+                sortname=SimilarKeySorting.SIMILARITY,
+                session=client,
+            )
+
+    matching = [item for item in everything.data if "high" in item.other_key.lower()]
+    matching.sort(key=lambda item: (item.count_all, item.other_key), reverse=True)
+    assert page.data == matching[5:10]
+    assert page.total == len(matching)
+    assert (page.page, page.rp) == (2, 5)
+    assert "query=HIGH" in str(page.url)
+
+    assert resorted.data == sorted(everything.data, key=lambda i: (i.similarity, i.other_key))
+    assert resorted.total == len(everything.data)
+    assert (resorted.page, resorted.rp) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_client_pages_with_other_parameters():
+    combinations_str = (_RESPONSES / "key_combinations_highway2.json").read_text()
+    combinations_url = "https://taginfo.openstreetmap.org/api/4/key/combinations"
+    popular_str = (_RESPONSES / "tags_popular.json").read_text()
+    popular_url = "https://taginfo.openstreetmap.org/api/4/tags/popular"
+
+    async with Client() as client:
+        with aioresponses() as m:
+            m.get(
+                url=f"{combinations_url}?filter=all&key=highway&page=1&rp=0&sortname=together_count&sortorder=desc",
+                body=combinations_str,
+                status=200,
+                content_type="application/json",
+            )
+            everything = await key_combinations(key="highway", session=client)
+            page = await key_combinations(
+                key="highway",
+                sortname=KeyCombinationSorting.OTHER_KEY,
+                sortorder=SortOrder.ASC,
+                rp=3,
+                session=client,
+            )
+
+            # a different filter needs another request
+            with pytest.raises(TaginfoCallError):
+                await key_combinations(key="highway", filter=ObjectType.NODES, rp=3, session=client)
+
+            m.get(
+                url=f"{popular_url}?page=1&rp=0&sortname=tag&sortorder=asc",
+                body=popular_str,
+                status=200,
+                content_type="application/json",
+            )
+            await tags_popular(
+                sortname=PopularTagSorting.TAG,
+                sortorder=SortOrder.ASC,
+                session=client,
+            )
+            tags = await tags_popular(
+                query="Bui",
+                sortname=PopularTagSorting.COUNT_WAYS,
+                rp=10,
+                session=client,
+            )
+
+    assert page.data == sorted(everything.data, key=lambda item: item.other_key)[:3]
+    assert page.total == len(everything.data)
+
+    assert tags.data
+    assert all("bui" in f"{tag.key} {tag.value}".lower() for tag in tags.data)
+    assert [tag.count_ways for tag in tags.data] == sorted(
+        (tag.count_ways for tag in tags.data), reverse=True
+    )
+
+
+def _key_stats_response(count: int) -> str:
+    response = json.loads((_RESPONSES / "key_stats_amenity.json").read_text())
+    response["data"][0]["count"] = count
+    return json.dumps(response)
+
+
+def _keys_all_response(data_until: str) -> str:
+    response = json.loads((_RESPONSES / "keys_all.json").read_text())
+    response["data_until"] = data_until
+    response["data"] = response["data"][:1]
+    return json.dumps(response)
+
+
+async def _revalidated(client: Client):
+    await asyncio.gather(*client._revalidations.values(), return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_client_stale_while_revalidate(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.cache.time.monotonic", lambda: now)
+    url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+
+    async with Client(cache=ResponseCache(ttl=10.0), stale_while_revalidate=True) as client:
+        with aioresponses() as m:
+            m.get(url=url, body=_key_stats_response(1), status=200, content_type="application/json")
+            m.get(url=url, body=_key_stats_response(2), status=200, content_type="application/json")
+
+            first = await key_stats(key="amenity", session=client)
+            assert first.data[0].count == 1
+
+            now = 11.0
+            stale = await key_stats(key="amenity", session=client)
+            assert stale is first
+            await _revalidated(client)
+
+            fresh = await key_stats(key="amenity", session=client)
+            assert fresh.data[0].count == 2
+
+            # failed revalidations keep the stale response
+            now = 22.0
+            assert await key_stats(key="amenity", session=client) is fresh
+            await _revalidated(client)
+            assert await key_stats(key="amenity", session=client) is fresh
+
+
+@pytest.mark.asyncio
+async def test_client_refresh():
+    data_until_url = (
+        "https://taginfo.openstreetmap.org/api/4/keys/all?page=1&rp=1&sortname=key&sortorder=asc"
+    )
+    stats_url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+    image_url = "https://taginfo.openstreetmap.org/api/4/key/distribution/nodes?key=amenity"
+    image_bytes = (_RESPONSES / "key_distribtion_nodes_amenity.png").read_bytes()
+    hot_calls = [functools.partial(key_stats, key="amenity")]
+
+    async with Client(stale_while_revalidate=True) as client:
+        with aioresponses() as m:
+            m.get(url=image_url, body=image_bytes, status=200, content_type="image/png")
+            await key_distribution_nodes(key="amenity", session=client)
+
+            # the first check warms up the cache
+            m.get(
+                url=data_until_url,
+                body=_keys_all_response("2024-04-28T00:59:42Z"),
+                status=200,
+                content_type="application/json",
+            )
+            m.get(
+                url=stats_url,
+                body=_key_stats_response(1),
+                status=200,
+                content_type="application/json",
+            )
+            assert await client.refresh(hot_calls) is True
+            assert client.data_until.day == 28
+            assert (await key_stats(key="amenity", session=client)).data[0].count == 1
+
+            m.get(
+                url=data_until_url,
+                body=_keys_all_response("2024-04-28T00:59:42Z"),
+                status=200,
+                content_type="application/json",
+            )
+            assert await client.refresh(hot_calls) is False
+
+            # new data: hot calls are requested again, everything else becomes stale
+            m.get(
+                url=data_until_url,
+                body=_keys_all_response("2024-04-29T00:59:42Z"),
+                status=200,
+                content_type="application/json",
+            )
+            m.get(
+                url=stats_url,
+                body=_key_stats_response(2),
+                status=200,
+                content_type="application/json",
+            )
+            assert await client.refresh(hot_calls) is True
+            assert (await key_stats(key="amenity", session=client)).data[0].count == 2
+            assert client.cache.is_fresh(client.cache.get("key/stats?key=amenity"))
+            assert not client.cache.is_fresh(
+                client.cache.get("key/distribution/nodes?key=amenity", stale=True)
+            )
+
+        # the background refresher ignores errors
+        client.start_refreshing(hot_calls, interval=0.01)
+        await asyncio.sleep(0.05)
+        assert client._refresher is not None
+        assert not client._refresher.done()
+
+
+class _SessionsTransport:
+    """Answers key/stats requests, and remembers the sessions they were made with."""
+
+    def __init__(self):
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    async def __call__(self, _path, _content_type, session, *_):
+        with self.lock:
+            self.sessions.append(session)
+        await asyncio.sleep(0)
+        return _key_stats_response(1).encode()
+
+
+def test_client_on_several_event_loops():
+    transport = _SessionsTransport()
+    client = Client(transport=transport)
+    sessions = []
+
+    async def work(key: str):
+        for _ in range(3):
+            assert (await key_stats(key=key, session=client)).data[0].count == 1
+        sessions.append(client.session)
+
+    # the cache is shared by all loops
+    asyncio.run(work("amenity"))
+    asyncio.run(work("amenity"))
+    assert len(transport.sessions) == 1
+
+    threads = [threading.Thread(target=asyncio.run, args=(work(f"key{i}"),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(transport.sessions) == 5
+    assert len({id(session) for session in sessions}) == 6
+    # every session was closed when its loop shut down
+    assert all(session.closed for session in sessions)
+    assert client._sessions == {}
+
+
+@pytest.mark.asyncio
+async def test_client_close_closes_sessions_of_other_loops():
+    client = Client(transport=_SessionsTransport())
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+
+        async def request():
+            await key_stats(key="amenity", session=client)
+            return client.session
+
+        other_session = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(request(), other_loop)
+        )
+        await key_stats(key="amenity", session=client)  # from the cache
+        session = client.session
+        assert session is not other_session
+
+        await client.close()
+        assert session.closed
+        assert other_session.closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+def test_response_cache_on_several_threads():
+    cache = ResponseCache(max_entries=10)
+
+    def work(n: int):
+        for i in range(2000):
+            key = f"{(n + i) % 20}"
+            cache.put(key, b"")
+            cache.get(key)
+            if i % 100 == 0:
+                cache.mark_stale()
+                cache.keys()
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 10
@@ -0,0 +1,150 @@
+import struct
+import zlib
+from array import array
+from pathlib import Path
+
+from aio_taginfo import distribution
+from aio_taginfo.api.v4 import PngResponse
+from aio_taginfo.api.v4.site.config.geodistribution import SiteConfigGeodistribution
+from aio_taginfo.distribution import BoundingBox, DistributionGrid
+
+import pytest
+from pydantic import TypeAdapter
+
+
+@pytest.fixture(params=["pure", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(distribution, "np", None)
+    else:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def _read_png(name: str) -> PngResponse:
+    test_dir = Path(__file__).resolve().parent
+    return PngResponse(data=(test_dir / "responses" / name).read_bytes())
+
+
+def _read_geodistribution() -> SiteConfigGeodistribution:
+    test_dir = Path(__file__).resolve().parent
+    response_str = (test_dir / "responses" / "site_config_geodistribution.json").read_text()
+    return TypeAdapter(SiteConfigGeodistribution).validate_json(response_str, strict=True)
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    return a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+
+
+def _encode_rgba(rows: list[bytes]) -> bytes:
+    """Encode 8-bit RGBA rows, cycling through all filter types."""
+    bpp = 4
+    raw = b""
+    prev = bytes(len(rows[0]))
+    for y, row in enumerate(rows):
+        filter_type = y % 5
+        out = bytearray()
+        for i, x in enumerate(row):
+            a = row[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            pred = [0, a, b, (a + b) >> 1, _paeth(a, b, c)][filter_type]
+            out.append((x - pred) & 0xFF)
+        raw += bytes([filter_type]) + out
+        prev = row
+
+    width, height = len(rows[0]) // bpp, len(rows)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(raw))
+        + _chunk(b"IEND", b"")
+    )
+
+
+@pytest.mark.usefixtures("backend")
+def test_decode_distribution():
+    png = _read_png("key_distribtion_nodes_amenity.png")
+    grid = DistributionGrid.from_png(png, _read_geodistribution())
+
+    assert (grid.width, grid.height) == (360, 180)
+    assert (grid.cell_width, grid.cell_height) == (1.0, 1.0)
+    assert set(grid.values) == {0.0, 1.0}
+
+    # central Berlin has amenities, Antarctica's interior does not
+    assert grid.value_at(lat=52.5, lon=13.4) == 1.0
+    assert grid.value_at(lat=-85.0, lon=0.0) == 0.0
+
+    bbox = grid.bbox()
+    assert bbox is not None
+    assert bbox.min_lon < bbox.max_lon
+    assert bbox.min_lat < bbox.max_lat
+
+    world = BoundingBox(min_lon=-180, min_lat=-90, max_lon=180, max_lat=90)
+    assert grid.sum(world) == grid.sum() == sum(grid.values)
+
+    west = BoundingBox(min_lon=-180, min_lat=-90, max_lon=0, max_lat=90)
+    east = BoundingBox(min_lon=0, min_lat=-90, max_lon=180, max_lat=90)
+    sums = grid.sums({"west": west, "east": east})
+    assert sums["west"] + sums["east"] == grid.sum()
+
+    pacific = BoundingBox(min_lon=170, min_lat=-50, max_lon=-170, max_lat=50)
+    assert grid.sum(pacific) == grid.sum(
+        BoundingBox(min_lon=170, min_lat=-50, max_lon=180, max_lat=50)
+    ) + grid.sum(BoundingBox(min_lon=-180, min_lat=-50, max_lon=-170, max_lat=50))
+
+    with pytest.raises(ValueError, match="out of range"):
+        grid.value_at(lat=0.0, lon=-181.0)
+
+
+@pytest.mark.usefixtures("backend")
+def test_normalized_difference():
+    nodes = DistributionGrid.from_png(_read_png("key_distribtion_nodes_amenity.png"))
+    ways = DistributionGrid.from_png(_read_png("key_distribution_ways_highway.png"))
+
+    same = nodes.normalized_difference(nodes)
+    assert set(same.values) == {0.0}
+
+    diff = nodes.normalized_difference(ways)
+    assert set(diff.values) <= {-1.0, 0.0, 1.0}
+    for a, b, d in zip(nodes.values, ways.values, diff.values, strict=True):
+        assert d == a - b
+
+    smaller = DistributionGrid(2, 1, array("d", [0.0, 1.0]))
+    with pytest.raises(ValueError, match="different sizes"):
+        nodes.normalized_difference(smaller)
+
+
+@pytest.mark.usefixtures("backend")
+def test_decode_filtered_rgba():
+    width, height = 7, 10
+    rows = [
+        bytes(v for x in range(width) for v in (x * 30, y * 20, 7, (x * 37 + y * 11) % 256))
+        for y in range(height)
+    ]
+    png = PngResponse(data=_encode_rgba(rows))
+    grid = DistributionGrid.from_png(png)
+
+    assert (grid.width, grid.height) == (width, height)
+    for y in range(height):
+        for x in range(width):
+            assert grid.values[y * width + x] == ((x * 37 + y * 11) % 256) / 255
+
+
+def test_decode_invalid():
+    with pytest.raises(ValueError, match="truncated"):
+        DistributionGrid.from_png(PngResponse(data=b"\x89PNG\r\n\x1a\nnonsense"))
+
+    with pytest.raises(ValueError, match="unexpected map size"):
+        DistributionGrid.from_png(_read_png("project_icon_id_editor.png"), _read_geodistribution())
+
+    with pytest.raises(ValueError, match="expected 3x3 values"):
+        DistributionGrid(3, 3, array("d", [0.0]))
@@ -0,0 +1,115 @@
+import json
+import re
+from pathlib import Path
+
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError
+from aio_taginfo.export import ENDPOINTS, _retry_delay, export_keys
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+
+_FIXTURES = {
+    "key_overview": "key_overview_amenity.json",
+    "key_stats": "key_stats_amenity.json",
+    "key_combinations": "key_combinations_highway.json",
+    "key_projects": "key_projects_highway.json",
+}
+
+
+def _mock_endpoints(m: aioresponses) -> None:
+    test_dir = Path(__file__).resolve().parent
+    for name, file_name in _FIXTURES.items():
+        path = name.replace("_", "/", 1)
+        m.get(
+            url=re.compile(rf"^https://taginfo\.openstreetmap\.org/api/4/{path}\?.*$"),
+            body=(test_dir / "responses" / file_name).read_text(),
+            status=200,
+            content_type="application/json",
+            repeat=True,
+        )
+
+
+def _read_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_and_resume(tmp_path):
+    with aioresponses() as m:
+        _mock_endpoints(m)
+        progress = await export_keys(["amenity", "highway"], tmp_path, rate=None)
+
+    assert progress.keys_done == 2
+    assert progress.requests == 2 * len(ENDPOINTS)
+    assert str(progress)
+
+    for name in ENDPOINTS:
+        lines = _read_lines(tmp_path / f"{name}.ndjson")
+        assert sorted(line["key"] for line in lines) == ["amenity", "highway"]
+
+    overview = _read_lines(tmp_path / "key_overview.ndjson")[0]
+    assert overview["response"]["data"]["key"] == "amenity"
+
+    # lines written after the last checkpoint are dropped when resuming
+    with (tmp_path / "key_stats.ndjson").open("a") as f:
+        f.write('{"key": "incomplete"')
+
+    with aioresponses() as m:
+        _mock_endpoints(m)
+        progress = await export_keys(["amenity", "highway", "shop"], tmp_path, rate=None)
+
+    assert progress.keys_skipped == 2
+    assert progress.keys_done == 1
+    assert progress.requests == len(ENDPOINTS)
+
+    for name in ENDPOINTS:
+        lines = _read_lines(tmp_path / f"{name}.ndjson")
+        assert sorted(line["key"] for line in lines) == ["amenity", "highway", "shop"]
+
+    # keys are appended to the checkpoint in the order they were done
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert sorted(checkpoint["done"][:2]) == ["amenity", "highway"]
+    assert checkpoint["done"][2] == "shop"
+
+
+@pytest.mark.asyncio
+async def test_export_retries(tmp_path):
+    url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+
+    with aioresponses() as m:
+        m.get(url=url, status=429, headers={"Retry-After": "0"})
+        m.get(url=url, status=404)
+        _mock_endpoints(m)
+
+        progress = await export_keys(["amenity"], tmp_path, endpoints=["key_stats"], rate=None)
+
+        assert progress.retries == 1
+        assert progress.keys_failed == 1
+        errors = _read_lines(tmp_path / "errors.ndjson")
+        assert errors[0]["endpoint"] == "key_stats"
+
+        # failed keys are retried in the next run
+        progress = await export_keys(["amenity"], tmp_path, endpoints=["key_stats"], rate=None)
+
+    assert progress.keys_done == 1
+    assert len(_read_lines(tmp_path / "key_stats.ndjson")) == 1
+
+    with pytest.raises(ValueError, match="unknown endpoints"):
+        await export_keys(["amenity"], tmp_path, endpoints=["key_values"])
+
+
+def test_export_retry_delay():
+    def error(status: int, headers: dict | None = None) -> TaginfoCallError:
+        cause = aiohttp.ClientResponseError(None, (), status=status, headers=headers)  # type: ignore[arg-type]
+        return TaginfoCallError(cause=cause)
+
+    assert _retry_delay(error(404), attempt=0) is None
+    assert _retry_delay(error(503), attempt=3) == 8.0
+    assert _retry_delay(error(429, {"Retry-After": "7"}), attempt=0) == 7.0
+    assert _retry_delay(TaginfoCallError(cause=aiohttp.ClientConnectionError()), attempt=10) == 60.0
+
+    # not before the circuit lets requests through again
+    circuit_open = TaginfoCircuitOpenError(endpoint="key/stats", retry_after=12.5)
+    assert _retry_delay(circuit_open, attempt=0) == 12.5
@@ -0,0 +1,114 @@
+import asyncio
+from pathlib import Path
+
+from aio_taginfo import key_distribution_nodes
+from aio_taginfo.client import Client
+from aio_taginfo.hedging import Hedging
+
+import pytest
+from aioresponses import aioresponses
+
+
+def test_hedging_delay():
+    hedging = Hedging(
+        percentile=0.9, initial_delay=2.0, min_delay=0.1, max_delay=5.0, min_samples=10
+    )
+    assert hedging.delay("a") == 2.0
+
+    for i in range(100):
+        hedging._record("a", i / 100)
+    assert hedging.delay("a") == pytest.approx(0.9)
+    assert hedging.delay("b") == 2.0
+
+    for _ in range(200):
+        hedging._record("a", 0.0)
+    assert hedging.delay("a") == 0.1
+
+
+@pytest.mark.asyncio
+async def test_hedging_takes_the_first_response():
+    hedging = Hedging(initial_delay=0.01)
+    started = []
+    cancelled = []
+
+    async def attempt():
+        n = len(started)
+        started.append(n)
+        try:
+            await asyncio.sleep(1.0 if n == 0 else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+        return n
+
+    assert await hedging.run("a", attempt) == 1
+    assert started == [0, 1]
+    assert cancelled == [0]
+    assert (hedging.requests, hedging.hedged) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_hedging_records_the_latency_of_the_used_response():
+    hedging = Hedging(initial_delay=0.2)
+    started = []
+
+    async def attempt():
+        n = len(started)
+        started.append(n)
+        await asyncio.sleep(1.0 if n == 0 else 0.0)
+        return n
+
+    assert await hedging.run("a", attempt) == 1
+    (latency,) = hedging._latencies["a"]
+    assert latency < 0.1  # not counting the 0.2 seconds before the request was hedged
+
+
+@pytest.mark.asyncio
+async def test_hedging_budget():
+    hedging = Hedging(initial_delay=0.0, budget=0.0, burst=2.0)
+    calls = 0
+
+    async def attempt():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.001)
+        return "ok"
+
+    for _ in range(5):
+        assert await hedging.run("a", attempt) == "ok"
+
+    assert hedging.hedged == 2
+    assert calls == 7
+
+
+@pytest.mark.asyncio
+async def test_hedging_errors():
+    hedging = Hedging(initial_delay=0.01)
+    attempts = 0
+
+    async def attempt():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.02)
+        raise ValueError(attempts)
+
+    with pytest.raises(ValueError, match="2"):
+        await hedging.run("a", attempt)
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_client_with_hedging():
+    test_dir = Path(__file__).resolve().parent
+    image_bytes = (test_dir / "responses" / "key_distribtion_nodes_amenity.png").read_bytes()
+    url = "https://taginfo.openstreetmap.org/api/4/key/distribution/nodes?key=amenity"
+
+    hedging = Hedging()
+    async with Client(hedging=hedging) as client:
+        with aioresponses() as m:
+            m.get(url=url, body=image_bytes, status=200, content_type="image/png")
+            await key_distribution_nodes(key="amenity", session=client)
+
+    assert (hedging.requests, hedging.hedged) == (1, 0)
+    assert hedging.delay("key/distribution/nodes") == hedging.initial_delay
+    assert len(hedging._latencies["key/distribution/nodes"]) == 1
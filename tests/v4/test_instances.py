@@ -0,0 +1,222 @@
+import asyncio
+from pathlib import Path
+
+from aio_taginfo import (
+    key_distribution_nodes,
+    key_stats,
+    project_icon,
+    site_config_geodistribution,
+    tag_distribution_ways,
+)
+from aio_taginfo.breaker import CircuitBreaker
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError, TaginfoCircuitOpenError
+from aio_taginfo.instances import Instance, Instances
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+_MIRROR = "https://taginfo.example.com/api/4/"
+_PUBLIC = "https://taginfo.openstreetmap.org/api/4/"
+_REGIONAL = "https://taginfo.geofabrik.de/europe:germany/api/4/"
+
+
+def _error(status: int) -> TaginfoCallError:
+    cause = aiohttp.ClientResponseError(None, (), status=status)  # type: ignore[arg-type]
+    return TaginfoCallError(cause=cause)
+
+
+@pytest.mark.asyncio
+async def test_instances_prefer_low_latency(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.instances.time.monotonic", lambda: now)
+    instances = Instances([_MIRROR, _PUBLIC])
+    latencies = {_MIRROR: 0.6, _PUBLIC: 0.1}
+
+    async def attempt(base_url: str):
+        nonlocal now
+        now += latencies[base_url]
+        return base_url
+
+    # instances without a known latency are tried in the given order
+    assert await instances.run(attempt) == _MIRROR
+    assert await instances.run(attempt) == _PUBLIC
+    assert await instances.run(attempt) == _PUBLIC
+    assert [i.base_url for i in instances.ranked()] == [_PUBLIC, _MIRROR]
+
+    latencies[_PUBLIC] = 1.0
+    for _ in range(3):
+        await instances.run(attempt)
+    assert instances.ranked()[0].base_url == _MIRROR
+
+
+@pytest.mark.asyncio
+async def test_instances_spill_over_under_load():
+    instances = Instances([Instance(base_url=_MIRROR, weight=3.0), Instance(base_url=_PUBLIC)])
+    gate = asyncio.Event()
+    used = []
+
+    async def attempt(base_url: str):
+        used.append(base_url)
+        await gate.wait()
+
+    tasks = [asyncio.create_task(instances.run(attempt)) for _ in range(4)]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert used == [_MIRROR, _MIRROR, _MIRROR, _PUBLIC]
+
+
+@pytest.mark.asyncio
+async def test_instances_fail_over():
+    instances = Instances([_MIRROR, _PUBLIC])
+    failing = {_MIRROR}
+
+    async def attempt(base_url: str):
+        if base_url in failing:
+            raise _error(503)
+        return base_url
+
+    assert await instances.run(attempt) == _PUBLIC
+    mirror, public = list(instances)
+    assert not mirror.healthy
+    assert public.healthy
+
+    # unhealthy instances are only used if no other instance is left
+    failing = {_MIRROR, _PUBLIC}
+    with pytest.raises(TaginfoCallError):
+        await instances.run(attempt)
+    assert not public.healthy
+    failing = {_PUBLIC}
+    assert await instances.run(attempt) == _MIRROR
+    assert mirror.healthy
+
+    # a health check makes an instance healthy again
+    failing = set()
+    await instances.check(attempt)
+    assert public.healthy
+
+    # other errors are not retried
+    async def not_found(_: str):
+        raise _error(404)
+
+    with pytest.raises(TaginfoCallError):
+        await instances.run(not_found)
+    assert mirror.healthy
+    assert public.healthy
+
+
+@pytest.mark.asyncio
+async def test_client_with_instances():
+    response_str = (_RESPONSES / "key_stats_amenity.json").read_text()
+    query = "key/stats?key=amenity"
+
+    async with Client(base_url=_MIRROR) as client:
+        with aioresponses() as m:
+            m.get(
+                url=_MIRROR + query, body=response_str, status=200, content_type="application/json"
+            )
+            await key_stats(key="amenity", session=client)
+
+    instances = Instances([_MIRROR, _PUBLIC])
+    async with Client(instances=instances) as client:
+        with aioresponses() as m:
+            m.get(url=_MIRROR + query, status=500)
+            m.get(
+                url=_PUBLIC + query, body=response_str, status=200, content_type="application/json"
+            )
+            await key_stats(key="amenity", session=client)
+
+            # cached responses do not depend on the instance
+            assert query in client.cache
+            await key_stats(key="amenity", session=client)
+
+            m.get(url=_MIRROR + "site/info", body="{}", status=200)
+            m.get(url=_PUBLIC + "site/info", body="{}", status=200)
+            client.start_health_checks(interval=60.0)
+            await asyncio.sleep(0.01)
+            assert all(instance.healthy for instance in instances)
+
+
+@pytest.mark.asyncio
+async def test_instances_keep_circuit_open_error():
+    instances = Instances([_MIRROR, _PUBLIC])
+
+    async def attempt(base_url: str):
+        if base_url == _MIRROR:
+            raise TaginfoCircuitOpenError(endpoint="key/stats", retry_after=10.0)
+        raise _error(503)
+
+    # not the error of the last instance, which was overloaded
+    with pytest.raises(TaginfoCircuitOpenError):
+        await instances.run(attempt)
+
+
+@pytest.mark.asyncio
+async def test_client_with_instances_returns_stale_response():
+    response_str = (_RESPONSES / "key_stats_amenity.json").read_text()
+    query = "key/stats?key=amenity"
+    breaker = CircuitBreaker(window=2, min_calls=2)
+
+    async def fail():
+        raise _error(503)
+
+    # the circuit of the mirror is open, while that of the other instance is not
+    for _ in range(2):
+        with pytest.raises(TaginfoCallError):
+            await breaker.run("taginfo.example.com/key/stats", fail)
+
+    # the mirror is tried first, and its open circuit is not the last error
+    instances = Instances([Instance(base_url=_MIRROR, weight=1000.0), _PUBLIC])
+    async with Client(instances=instances, breaker=breaker) as client:
+        with aioresponses() as m:
+            m.get(
+                url=_PUBLIC + query, body=response_str, status=200, content_type="application/json"
+            )
+            await key_stats(key="amenity", session=client)
+            client.cache.mark_stale()
+
+            m.get(url=_PUBLIC + query, status=503)
+            response = await key_stats(key="amenity", session=client)
+
+    assert response.data
+
+
+@pytest.mark.asyncio
+async def test_client_with_base_url_path():
+    png = (_RESPONSES / "key_distribtion_nodes_amenity.png").read_bytes()
+
+    async with Client(base_url=_REGIONAL) as client:
+        with aioresponses() as m:
+            m.get(
+                url=_REGIONAL + "site/config/geodistribution",
+                body=(_RESPONSES / "site_config_geodistribution.json").read_text(),
+                status=200,
+                content_type="application/json",
+            )
+            m.get(
+                url=_REGIONAL + "key/distribution/nodes?key=amenity",
+                body=png,
+                status=200,
+                content_type="image/png",
+            )
+            m.get(
+                url=_REGIONAL + "tag/distribution/ways?key=highway&value=residential",
+                body=png,
+                status=200,
+                content_type="image/png",
+            )
+            m.get(
+                url=_REGIONAL + "project/icon?project=id_editor",
+                body=(_RESPONSES / "project_icon_id_editor.png").read_bytes(),
+                status=200,
+                content_type="image/png",
+            )
+            await site_config_geodistribution(session=client)
+            await key_distribution_nodes(key="amenity", session=client)
+            await tag_distribution_ways(key="highway", value="residential", session=client)
+            await project_icon(project="id_editor", session=client)
@@ -0,0 +1,138 @@
+import asyncio
+from pathlib import Path
+
+from aio_taginfo import key_stats
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError
+from aio_taginfo.limiter import AdaptiveConcurrency
+from aio_taginfo.scheduler import Scheduler
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+
+def _fail(status: int):
+    async def call():
+        cause = aiohttp.ClientResponseError(None, (), status=status)  # type: ignore[arg-type]
+        raise TaginfoCallError(cause=cause)
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_limit_increases_and_decreases(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr("aio_taginfo.limiter.time.monotonic", lambda: now)
+    limiter = AdaptiveConcurrency(initial_limit=4, max_limit=5, backoff=0.5)
+
+    def taking(seconds: float):
+        async def call():
+            nonlocal now
+            now += seconds
+            return "ok"
+
+        return call
+
+    # additive increase: about one per 'limit' fast requests
+    for _ in range(4):
+        assert await limiter.run(taking(0.1)) == "ok"
+    assert 4.9 < limiter.limit <= 5.0
+    for _ in range(10):
+        await limiter.run(taking(0.1))
+    assert limiter.limit == 5.0
+
+    # multiplicative decrease on rate limiting
+    with pytest.raises(TaginfoCallError):
+        await limiter.run(_fail(429))
+    assert limiter.limit == 2.5
+    assert limiter.capacity == 2
+
+    # ...and when latencies rise
+    await limiter.run(taking(1.0))
+    assert limiter.limit == 1.25
+
+    # but not on other errors
+    with pytest.raises(TaginfoCallError):
+        await limiter.run(_fail(404))
+    assert limiter.limit == 1.25
+    assert limiter.decreases == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_decreases_once_per_round_trip():
+    limiter = AdaptiveConcurrency(initial_limit=8)
+    gate = asyncio.Event()
+
+    async def overloaded():
+        await gate.wait()
+        await _fail(503)()
+
+    tasks = [asyncio.create_task(limiter.run(overloaded)) for _ in range(9)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 8
+
+    gate.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    # once for the first 8 requests, once for the one that was made after the decrease
+    assert limiter.decreases == 2
+    assert limiter.limit == 2.0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_with_adaptive_concurrency():
+    url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+    response_str = (_RESPONSES / "key_stats_amenity.json").read_text()
+    limiter = AdaptiveConcurrency(initial_limit=2)
+
+    async with Client(scheduler=Scheduler(concurrency=limiter)) as client:
+        with aioresponses() as m:
+            m.get(url=url, status=503)
+            with pytest.raises(TaginfoCallError):
+                await key_stats(key="amenity", session=client)
+            assert limiter.limit == 1.0
+
+            m.get(url=url, body=response_str, status=200, content_type="application/json")
+            await key_stats(key="amenity", session=client)
+            assert limiter.limit == 2.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_starts_waiting_requests_when_limit_increases():
+    limiter = AdaptiveConcurrency(initial_limit=1)
+    scheduler = Scheduler(concurrency=limiter)
+    gate = asyncio.Event()
+    started = []
+
+    async def request(n: int):
+        async def call():
+            started.append(n)
+            await gate.wait()
+
+        await scheduler.run(call)
+
+    tasks = [asyncio.create_task(request(n)) for n in range(4)]
+    await asyncio.sleep(0)
+    assert (scheduler.in_flight(), scheduler.waiting()) == (1, 3)
+
+    # a request that increases the limit, while the scheduler's requests are still waiting
+    async def fast():
+        pass
+
+    await limiter.run(fast)
+    assert limiter.capacity == 2
+    await asyncio.sleep(0)
+    assert started == [0, 1]
+    assert (scheduler.in_flight(), scheduler.waiting()) == (2, 2)
+
+    limiter.limit = 4.0
+    await asyncio.sleep(0)
+    assert started == [0, 1, 2, 3]
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.in_flight() == 0
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.keys.all import KeyListItem
+from aio_taginfo.local.keys import KeyIndex
+
+import pytest
+from aioresponses import aioresponses
+from pydantic import TypeAdapter
+
+
+_COUNTS = {
+    "addr:city": 50,
+    "addr:street": 80,
+    "addr:housenumber": 90,
+    "amenity": 70,
+    "a": 1,
+    "building": 100,
+    "highway": 95,
+    "name": 60,
+    "name:en": 20,
+    "old_name": 5,
+}
+
+
+def test_key_index_queries():
+    index = KeyIndex(_COUNTS)
+
+    assert len(index) == len(_COUNTS)
+    assert "amenity" in index
+    assert "amenit" not in index
+    assert index.count("highway") == 95
+    assert index.count("nonexistent") is None
+
+    assert index.top(3) == ["building", "highway", "addr:housenumber"]
+
+    assert index.prefix("a", limit=3) == ["addr:housenumber", "addr:street", "amenity"]
+    assert index.prefix("a", limit=None) == [
+        "addr:housenumber",
+        "addr:street",
+        "amenity",
+        "addr:city",
+        "a",
+    ]
+    assert index.prefix("addr:", limit=2) == ["addr:housenumber", "addr:street"]
+    assert index.prefix("addr:s") == ["addr:street"]
+    assert index.prefix("x") == []
+    assert index.prefix("zzz") == []
+    assert index.prefix("", limit=1) == ["building"]
+
+    assert index.substring("name") == ["name", "name:en", "old_name"]
+    assert index.substring("e", limit=2) == ["addr:housenumber", "addr:street"]
+    assert index.substring("nothing") == []
+    assert index.substring("\0") == []
+
+
+def test_key_index_matches_brute_force():
+    keys = [f"{a}{b}{c}" for a in "abc" for b in "ab:" for c in ["", "x", "yz"]]
+    counts = {key: (i * 7919) % 101 for i, key in enumerate(keys)}
+    index = KeyIndex(counts)
+
+    def ranked(matching):
+        return sorted(matching, key=lambda k: (-counts[k], k))
+
+    for query in ["", "a", "ab", "a:", "b:x", "cbyz", "y", ":"]:
+        expected = ranked(k for k in keys if k.startswith(query))
+        assert index.prefix(query, limit=None) == expected
+        assert index.prefix(query, limit=3) == expected[:3]
+
+        expected = ranked(k for k in keys if query in k)
+        assert index.substring(query, limit=None) == expected
+
+
+@pytest.mark.asyncio
+async def test_key_index_download():
+    test_dir = Path(__file__).resolve().parent
+    response_str = (test_dir / "responses" / "keys_all.json").read_text()
+
+    with aioresponses() as m:
+        m.get(
+            url="https://taginfo.openstreetmap.org/api/4/keys/all?page=1&rp=10000&sortname=key&sortorder=asc",
+            body=response_str,
+            status=200,
+            content_type="application/json",
+        )
+        index = await KeyIndex.download(rp=10000)
+
+    assert len(index) == 10
+    assert index.prefix("*:b") == ["*:backward", "*:bicycle", "*:both_ways"]
+
+    response = TypeAdapter(Response[list[KeyListItem]]).validate_json(response_str, strict=True)
+    assert len(KeyIndex.from_items(response.data)) == 10
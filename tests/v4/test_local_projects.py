@@ -0,0 +1,170 @@
+import json
+import re
+from pathlib import Path
+
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoDataChangedError
+from aio_taginfo.local.projects import ProjectTagStore
+
+import pytest
+from aioresponses import aioresponses
+
+
+_URL = "https://taginfo.openstreetmap.org/api/4/"
+
+
+def _fixture(name: str) -> dict:
+    test_dir = Path(__file__).resolve().parent
+    return json.loads((test_dir / "responses" / f"{name}.json").read_text())
+
+
+def _projects(data_until: str) -> str:
+    response = _fixture("projects_all")
+    response["data_until"] = data_until
+    response["data"] = response["data"][:2]  # architects_in_osm, babykarte
+    response["total"] = 2
+    return json.dumps(response)
+
+
+def _project_tags(data_until: str, tags: list[tuple[str, str | None]]) -> str:
+    response = _fixture("project_tags_id_editor")
+    template = response["data"][0]
+    response["data_until"] = data_until
+    response["data"] = [{**template, "key": key, "value": value} for key, value in tags]
+    response["total"] = len(tags)
+    return json.dumps(response)
+
+
+_TAGS = {
+    "architects_in_osm": [("architect", None), ("building", "yes")],
+    "babykarte": [("amenity", "kindergarten"), ("building", "yes"), ("building", "house")],
+}
+
+
+def _mock(
+    m: aioresponses,
+    data_until: str,
+    *,
+    repeat: bool = False,
+    tags: dict[str, list[tuple[str, str | None]]] = _TAGS,
+) -> None:
+    m.get(
+        re.compile(re.escape(f"{_URL}projects/all?") + ".*"),
+        body=_projects(data_until),
+        content_type="application/json",
+        repeat=repeat,
+    )
+    for project_id, project_tags in tags.items():
+        m.get(
+            re.compile(re.escape(f"{_URL}project/tags?") + f".*project={project_id}.*"),
+            body=_project_tags(data_until, project_tags),
+            content_type="application/json",
+            repeat=repeat,
+        )
+
+
+@pytest.mark.asyncio
+async def test_project_tag_store(tmp_path: Path):
+    path = tmp_path / "projects.sqlite"
+    with aioresponses() as m:
+        _mock(m, "2024-04-28T00:59:42Z")
+        store = await ProjectTagStore.download(path, concurrency=2)
+
+    assert len(store) == 5
+    assert store.data_until is not None
+    assert store.data_until.isoformat() == "2024-04-28T00:59:42+00:00"
+    assert [p.id for p in store.projects()] == ["architects_in_osm", "babykarte"]
+    assert store.project("babykarte").unique_tags == 30
+    assert store.project("nonexistent") is None
+
+    assert [p.project_id for p in store.tag_projects("building", "yes")] == [
+        "architects_in_osm",
+        "babykarte",
+    ]
+    assert [p.project_name for p in store.tag_projects("building", "house")] == ["Babykarte"]
+    assert store.tag_projects("building", "nonexistent") == []
+    assert store.tag_projects("architect", "x") == []
+
+    key_projects = store.key_projects("architect")
+    assert [(p.project_id, p.value) for p in key_projects] == [("architects_in_osm", None)]
+    assert str(key_projects[0].project_icon_url) == "https://osm.ascolteo.fr/xref/favicon.png"
+    assert len(store.key_projects("building")) == 3
+
+    entries = store.project_tags("babykarte")
+    assert [(e.key, e.value) for e in entries] == [
+        ("amenity", "kindergarten"),
+        ("building", "house"),
+        ("building", "yes"),
+    ]
+    assert entries[0].on_way is True
+    assert store.project_tags("nonexistent") is None
+    _ = repr(store)
+    store.close()
+
+    # the database can be opened again without downloading anything
+    store = ProjectTagStore(path)
+    assert len(store) == 5
+    assert [e.value for e in store.project_tags("architects_in_osm")] == [None, "yes"]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_project_tag_store_refresh():
+    store = ProjectTagStore()
+    assert len(store) == 0
+    assert store.data_until is None
+
+    with aioresponses() as m:
+        _mock(m, "2024-04-28T00:59:42Z", repeat=True)
+        assert await store.refresh() is True
+        assert len(store) == 5
+        assert await store.refresh() is False
+
+    with aioresponses() as m:
+        _mock(m, "2024-04-29T00:59:42Z", repeat=True)
+        assert await store.refresh() is True
+        assert store.data_until.day == 29
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_project_tag_store_refresh_with_client():
+    store = ProjectTagStore()
+    async with Client() as client:
+        with aioresponses() as m:
+            _mock(m, "2024-04-28T00:59:42Z", repeat=True)
+            assert await store.refresh(session=client) is True
+            assert len(store) == 5
+
+        # new data: the cached responses are not used
+        with aioresponses() as m:
+            tags = {**_TAGS, "babykarte": [("amenity", "kindergarten")]}
+            _mock(m, "2024-04-29T00:59:42Z", repeat=True, tags=tags)
+            assert await store.refresh(session=client) is True
+
+    assert store.data_until.day == 29
+    assert len(store) == 3
+    assert [e.key for e in store.project_tags("babykarte")] == ["amenity"]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_project_tag_store_data_changed():
+    with aioresponses() as m:
+        m.get(
+            re.compile(re.escape(f"{_URL}projects/all?") + ".*"),
+            body=_projects("2024-04-28T00:59:42Z"),
+            content_type="application/json",
+            repeat=True,
+        )
+        m.get(
+            re.compile(re.escape(f"{_URL}project/tags?") + ".*"),
+            body=_project_tags("2024-04-29T00:59:42Z", [("building", "yes")]),
+            content_type="application/json",
+            repeat=True,
+        )
+        with pytest.raises(TaginfoDataChangedError) as err:
+            await ProjectTagStore.download()
+
+    assert [date.day for date in err.value.data_until] == [28, 29]
+    assert len([call for (method, url), calls in m.requests.items() for call in calls]) == 9
@@ -0,0 +1,133 @@
+import json
+import re
+from pathlib import Path
+
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoDataChangedError
+from aio_taginfo.local.relations import RelationRoleIndex
+
+import pytest
+from aioresponses import aioresponses
+
+
+_URL = "https://taginfo.openstreetmap.org/api/4/"
+
+
+def _fixture(name: str) -> dict:
+    test_dir = Path(__file__).resolve().parent
+    return json.loads((test_dir / "responses" / f"{name}.json").read_text())
+
+
+def _types(data_until: str) -> str:
+    response = _fixture("relations_all")
+    response["data_until"] = data_until
+    response["data"] = [
+        {**response["data"][0], "count": 5},  # no type
+        {**response["data"][1], "rtype": "multipolygon", "count": 1000},
+        {**response["data"][2], "rtype": "route", "count": 500},
+        {**response["data"][3], "rtype": "rare", "count": 1},
+    ]
+    response["total"] = len(response["data"])
+    return json.dumps(response)
+
+
+def _roles(data_until: str, rtype: str, roles: list[str]) -> str:
+    response = _fixture("relation_roles_multipolygon")
+    template = response["data"][0]
+    response["data_until"] = data_until
+    response["data"] = [{**template, "rtype": rtype, "role": role} for role in roles]
+    response["total"] = len(roles)
+    return json.dumps(response)
+
+
+_ROLES = {"multipolygon": ["outer", "inner", ""], "route": ["stop", "platform"], "rare": ["x"]}
+
+
+def _mock(m: aioresponses, data_until: str, roles: dict[str, list[str]] = _ROLES) -> None:
+    m.get(
+        re.compile(re.escape(f"{_URL}relations/all?") + ".*"),
+        body=_types(data_until),
+        content_type="application/json",
+        repeat=True,
+    )
+    for rtype, names in roles.items():
+        m.get(
+            re.compile(re.escape(f"{_URL}relation/roles?") + f".*rtype={rtype}.*"),
+            body=_roles(data_until, rtype, names),
+            content_type="application/json",
+            repeat=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_relation_role_index():
+    with aioresponses() as m:
+        _mock(m, "2024-04-28T00:59:42Z")
+        index = await RelationRoleIndex.download(min_count=100, concurrency=2)
+        requests = sum(len(calls) for calls in m.requests.values())
+
+    assert requests == 3  # no requests for the types without name, or with few relations
+    assert len(index) == 2
+    assert "multipolygon" in index
+    assert "rare" not in index
+    assert [t.rtype for t in index.types()] == ["multipolygon", "route"]
+    assert index.relation("route").count == 500
+    assert index.relation("rare") is None
+
+    assert [r.role for r in index.roles("multipolygon")] == ["", "inner", "outer"]
+    assert index.roles("rare") is None
+    assert index.role("multipolygon", "outer").count_all_members == 18060
+    assert index.role("multipolygon", "stop") is None
+    assert index.role("rare", "x") is None
+    _ = repr(index)
+
+
+@pytest.mark.asyncio
+async def test_relation_role_index_refresh():
+    with aioresponses() as m:
+        _mock(m, "2024-04-28T00:59:42Z")
+        index = await RelationRoleIndex.download()
+        assert len(index) == 3
+        assert await index.refresh() is False
+
+    with aioresponses() as m:
+        _mock(m, "2024-04-29T00:59:42Z")
+        assert await index.refresh() is True
+    assert index.data_until.day == 29
+
+
+@pytest.mark.asyncio
+async def test_relation_role_index_refresh_with_client():
+    async with Client() as client:
+        with aioresponses() as m:
+            _mock(m, "2024-04-28T00:59:42Z")
+            index = await RelationRoleIndex.download(session=client)
+
+        # new data: neither the check nor the download use the cached responses
+        with aioresponses() as m:
+            _mock(m, "2024-04-29T00:59:42Z", roles={**_ROLES, "route": ["stop"]})
+            assert await index.refresh(session=client) is True
+
+    assert index.data_until.day == 29
+    assert [r.role for r in index.roles("route")] == ["stop"]
+
+
+@pytest.mark.asyncio
+async def test_relation_role_index_data_changed():
+    with aioresponses() as m:
+        m.get(
+            re.compile(re.escape(f"{_URL}relations/all?") + ".*"),
+            body=_types("2024-04-28T00:59:42Z"),
+            content_type="application/json",
+            repeat=True,
+        )
+        m.get(
+            re.compile(re.escape(f"{_URL}relation/roles?") + ".*"),
+            body=_roles("2024-04-29T00:59:42Z", "multipolygon", ["outer"]),
+            content_type="application/json",
+            repeat=True,
+        )
+        with pytest.raises(TaginfoDataChangedError) as err:
+            await RelationRoleIndex.download(min_count=1000)
+
+    assert [date.day for date in err.value.data_until] == [28, 29]
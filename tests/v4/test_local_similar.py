@@ -0,0 +1,59 @@
+import random
+from pathlib import Path
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.key.similar import SimilarKey
+from aio_taginfo.local.similar import SimilarKeyIndex
+
+from pydantic import TypeAdapter
+
+
+def _levenshtein(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        curr = [i]
+        for j, cb in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = curr
+    return prev[-1]
+
+
+def _brute_force(counts: dict[str, int], key: str) -> list[tuple[str, int]]:
+    results = []
+    for other in sorted(counts):
+        if other == key or not 4 <= len(other) <= 120:
+            continue
+        a, b = key.lower(), other.lower()
+        if a in b or b in a:
+            results.append((other, 0))
+        elif (d := _levenshtein(a, b)) <= 2:
+            results.append((other, d))
+    return results
+
+
+def test_similar_keys_match_brute_force():
+    rng = random.Random(42)  # noqa: S311
+    parts = ["name", "addr", "street", "highway", "Highway", "note", "fixme", "ref", "x"]
+    keys = {":".join(rng.choices(parts, k=rng.randint(1, 3))) for _ in range(150)}
+    keys |= {"naem", "nmae", "adr:street", "hihgway", "abc", "highwya:ref"}
+    counts = {key: rng.randint(1, 1000) for key in keys}
+    index = SimilarKeyIndex(counts)
+
+    for key in [*sorted(keys), "nam", "strret", "highway:ref:name"]:
+        expected = _brute_force(counts, key) if len(key) >= 4 else []
+        actual = [(similar.other_key, similar.similarity) for similar in index.similar(key)]
+        assert actual == expected, key
+
+
+def test_similar_keys_fixture():
+    test_dir = Path(__file__).resolve().parent
+    response_str = (test_dir / "responses" / "key_similar_highway.json").read_text()
+    response = TypeAdapter(Response[list[SimilarKey]]).validate_json(response_str, strict=True)
+
+    counts = {similar.other_key: similar.count_all for similar in response.data}
+    counts["highway"] = 1
+    index = SimilarKeyIndex(counts)
+
+    assert len(index) == len(counts)
+    assert index.similar("highway") == response.data
+    assert index.similar("hwy") == []
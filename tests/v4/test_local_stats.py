@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+
+from aio_taginfo.api.v4 import ObjectType, Response
+from aio_taginfo.api.v4.key.stats import KeyStats
+from aio_taginfo.api.v4.keys import all as keys_all
+from aio_taginfo.api.v4.keys.all import KeyListItem
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoDataChangedError
+from aio_taginfo.local.stats import KeyStatsSnapshot
+
+import pytest
+from aioresponses import aioresponses
+from pydantic import TypeAdapter
+
+
+_URL = "https://taginfo.openstreetmap.org/api/4/keys/all"
+
+
+def _response(data_until: str, total: int = 10) -> str:
+    test_dir = Path(__file__).resolve().parent
+    response = json.loads((test_dir / "responses" / "keys_all.json").read_text())
+    response["data_until"] = data_until
+    response["data"] = response["data"][:total]
+    response["total"] = total
+    return json.dumps(response)
+
+
+def test_key_stats_snapshot():
+    response = TypeAdapter(Response[list[KeyListItem]]).validate_json(
+        _response("2024-04-28T00:59:42Z"), strict=True
+    )
+    snapshot = KeyStatsSnapshot(response.data, response.data_until)
+    item = response.data[3]
+
+    assert len(snapshot) == 10
+    assert item.key in snapshot
+    assert "nonexistent" not in snapshot
+    assert snapshot.stats("nonexistent") is None
+
+    stats = snapshot.stats(item.key)
+    assert [s.type for s in stats] == [
+        ObjectType.ALL,
+        ObjectType.NODES,
+        ObjectType.WAYS,
+        ObjectType.RELATIONS,
+    ]
+    assert stats[0] == KeyStats(
+        type=ObjectType.ALL,
+        count=item.count_all,
+        count_fraction=item.count_all_fraction,
+        values=item.values_all,
+    )
+    assert stats[2].count == item.count_ways
+    assert stats[3].count_fraction == item.count_relations_fraction
+    _, _ = str(snapshot), repr(snapshot)
+
+
+@pytest.mark.asyncio
+async def test_key_stats_snapshot_refresh():
+    with aioresponses() as m:
+        m.get(
+            url=f"{_URL}?page=1&rp=1000&sortname=key&sortorder=asc",
+            body=_response("2024-04-28T00:59:42Z"),
+            status=200,
+            content_type="application/json",
+        )
+        snapshot = await KeyStatsSnapshot.download()
+
+        # same data: nothing to download
+        m.get(
+            url=f"{_URL}?page=1&rp=1&sortname=key&sortorder=asc",
+            body=_response("2024-04-28T00:59:42Z", total=1),
+            status=200,
+            content_type="application/json",
+        )
+        assert await snapshot.refresh() is False
+
+        # new data
+        m.get(
+            url=f"{_URL}?page=1&rp=1&sortname=key&sortorder=asc",
+            body=_response("2024-04-29T00:59:42Z", total=1),
+            status=200,
+            content_type="application/json",
+        )
+        m.get(
+            url=f"{_URL}?page=1&rp=1000&sortname=key&sortorder=asc",
+            body=_response("2024-04-29T00:59:42Z", total=5),
+            status=200,
+            content_type="application/json",
+        )
+        assert await snapshot.refresh() is True
+
+    assert snapshot.data_until.day == 29
+    assert len(snapshot) == 5
+
+
+def _mock_pages(m: aioresponses, *data_until: str, total: int = 10) -> None:
+    for page, date in enumerate(data_until, start=1):
+        m.get(
+            url=f"{_URL}?page={page}&rp=5&sortname=key&sortorder=asc",
+            body=_response(date, total=total),
+            status=200,
+            content_type="application/json",
+        )
+
+
+@pytest.mark.asyncio
+async def test_key_stats_snapshot_download_retry():
+    with aioresponses() as m:
+        # new data was imported between the first and the second page
+        _mock_pages(m, "2024-04-28T00:59:42Z", "2024-04-29T00:59:42Z")
+        _mock_pages(m, "2024-04-29T00:59:42Z", "2024-04-29T00:59:42Z")
+        snapshot = await KeyStatsSnapshot.download(rp=5)
+
+    assert snapshot.data_until.day == 29
+    assert len(snapshot) == 20
+
+
+@pytest.mark.asyncio
+async def test_key_stats_snapshot_download_retry_bypasses_cache():
+    async with Client() as client:
+        with aioresponses() as m:
+            _mock_pages(m, "2024-04-28T00:59:42Z", "2024-04-29T00:59:42Z")
+            _mock_pages(m, "2024-04-29T00:59:42Z", "2024-04-29T00:59:42Z")
+            snapshot = await KeyStatsSnapshot.download(rp=5, session=client)
+
+            # the retried pages replaced the outdated ones in the cache
+            again = await KeyStatsSnapshot.download(rp=5, session=client)
+
+    assert snapshot.data_until.day == 29
+    assert again.data_until.day == 29
+
+
+@pytest.mark.asyncio
+async def test_key_stats_snapshot_download_data_changed():
+    with aioresponses() as m:
+        for day in (26, 27, 28):
+            _mock_pages(m, f"2024-04-{day}T00:59:42Z", f"2024-04-{day + 1}T00:59:42Z")
+        with pytest.raises(TaginfoDataChangedError) as err:
+            await KeyStatsSnapshot.download(rp=5)
+
+    assert [date.day for date in err.value.data_until] == [28, 29]
+
+
+@pytest.mark.asyncio
+async def test_key_stats_snapshot_refresh_with_client():
+    async with Client() as client:
+        with aioresponses() as m:
+            m.get(
+                url=f"{_URL}?page=1&rp=1&sortname=key&sortorder=asc",
+                body=_response("2024-04-28T00:59:42Z", total=1),
+                status=200,
+                content_type="application/json",
+            )
+            _mock_pages(m, "2024-04-28T00:59:42Z", "2024-04-28T00:59:42Z")
+            # cache the first page of the check, like a previous refresh would
+            await keys_all.call(page=1, rp=1, session=client)
+            snapshot = await KeyStatsSnapshot.download(rp=5, session=client)
+
+            # new data: neither the check nor the download use the cached responses
+            m.get(
+                url=f"{_URL}?page=1&rp=1&sortname=key&sortorder=asc",
+                body=_response("2024-04-29T00:59:42Z", total=1),
+                status=200,
+                content_type="application/json",
+            )
+            _mock_pages(m, "2024-04-29T00:59:42Z", "2024-04-29T00:59:42Z", total=6)
+            assert len(snapshot) == 20
+            assert await snapshot.refresh(rp=5, session=client) is True
+
+    assert snapshot.data_until.day == 29
+    assert len(snapshot) == 12
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.unicode.characters import UnicodeCharacter
+from aio_taginfo.local.unicode import character, characters, script
+
+from pydantic import TypeAdapter
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+
+def test_characters_like_the_endpoint():
+    response_str = (_RESPONSES / "unicode_characters_highway.json").read_text()
+    type_adapter = TypeAdapter(Response[list[UnicodeCharacter]])
+    response = type_adapter.validate_json(response_str, strict=True)
+
+    string = json.loads(response_str)["url"].rpartition("string=")[2]
+    assert characters(string) == response.data
+
+
+def test_scripts():
+    assert script("a") == ("Latn", "Latin")
+    assert script(" ") == ("Zyyy", "Common")
+    assert script("́") == ("Zinh", "Inherited")  # combining acute accent
+    assert script("ж") == ("Cyrl", "Cyrillic")
+    assert script("漢") == ("Hani", "Han")
+    assert script("\U0010ffff") == ("Zzzz", "Unknown")
+
+    assert character("\n").name is None
+    assert character("\n").category == "Cc"
+    assert characters("") == []
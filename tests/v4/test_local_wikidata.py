@@ -0,0 +1,158 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+from aio_taginfo.api.v4 import Response
+from aio_taginfo.api.v4.wikidata.all import WikidataLink, WikidataLinkType
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoDataChangedError
+from aio_taginfo.local.wikidata import WikidataIndex
+
+import pytest
+from aioresponses import aioresponses
+from pydantic import TypeAdapter
+
+
+_URL = "https://taginfo.openstreetmap.org/api/4/wikidata/all"
+
+
+def _response(data_until: str, total: int = 10) -> str:
+    test_dir = Path(__file__).resolve().parent
+    response = json.loads((test_dir / "responses" / "wikidata_all_fr.json").read_text())
+    response["data_until"] = data_until
+    response["data"] = [
+        *response["data"],
+        {
+            "type": "tag",
+            "item": "Q16917",
+            "description": "hôpital",
+            "key": "amenity",
+            "value": "hospital",
+        },
+    ][:total]
+    response["total"] = total
+    return json.dumps(response)
+
+
+def _index() -> WikidataIndex:
+    response = TypeAdapter(Response[list[WikidataLink]]).validate_json(
+        _response("2024-04-28T00:59:42Z", total=11), strict=True
+    )
+    return WikidataIndex(response.data, response.data_until, "fr")
+
+
+def test_wikidata_index():
+    index = _index()
+
+    assert len(index) == 11
+    assert "P17" in index
+    assert "Q1" not in index
+    assert [link.key for link in index.links("P17")] == ["country", "addr:country"]
+    assert index.links("Q1") == []
+    assert index.description("P140") == "religion ou conception du monde"
+    assert index.description("Q1") is None
+
+    assert [link.item for link in index.items("religion")] == ["P140"]
+    assert index.items("religion", "christian") == []
+    [hospital] = index.items("amenity", "hospital")
+    assert hospital.type == WikidataLinkType.TAG
+    assert index.items("amenity") == []
+
+    matches = index.match({"amenity": "hospital", "craft": "carpenter", "name": "x"})
+    assert [link.item for link in matches] == ["Q16917", "P101"]
+    _, _ = str(index), repr(index)
+
+
+def test_wikidata_index_save_load(tmp_path: Path):
+    index = _index()
+    path = tmp_path / "wikidata.json"
+    index.save(path)
+
+    loaded = WikidataIndex.load(path)
+    assert loaded.lang == "fr"
+    assert loaded.data_until == index.data_until
+    assert loaded.items("amenity", "hospital") == index.items("amenity", "hospital")
+    assert len(loaded) == len(index)
+
+
+@pytest.mark.asyncio
+async def test_wikidata_index_refresh():
+    with aioresponses() as m:
+        m.get(
+            url=f"{_URL}?lang=fr&page=1&rp=1000&sortname=item&sortorder=asc",
+            body=_response("2024-04-28T00:59:42Z"),
+            status=200,
+            content_type="application/json",
+        )
+        index = await WikidataIndex.download(lang="fr")
+        assert len(index) == 10
+
+        # same data: nothing to download
+        m.get(
+            url=f"{_URL}?lang=fr&page=1&rp=1&sortname=item&sortorder=asc",
+            body=_response("2024-04-28T00:59:42Z", total=1),
+            status=200,
+            content_type="application/json",
+        )
+        assert await index.refresh() is False
+
+        # new data
+        m.get(
+            url=f"{_URL}?lang=fr&page=1&rp=1&sortname=item&sortorder=asc",
+            body=_response("2024-04-29T00:59:42Z", total=1),
+            status=200,
+            content_type="application/json",
+        )
+        m.get(
+            url=f"{_URL}?lang=fr&page=1&rp=1000&sortname=item&sortorder=asc",
+            body=_response("2024-04-29T00:59:42Z", total=11),
+            status=200,
+            content_type="application/json",
+        )
+        assert await index.refresh() is True
+
+    assert len(index) == 11
+    assert index.data_until == datetime.fromisoformat("2024-04-29T00:59:42Z")
+
+
+@pytest.mark.asyncio
+async def test_wikidata_index_download_data_changed():
+    with aioresponses() as m:
+        for page, day in ((1, 28), (2, 29)):
+            m.get(
+                url=f"{_URL}?lang=fr&page={page}&rp=5&sortname=item&sortorder=asc",
+                body=_response(f"2024-04-{day}T00:59:42Z"),
+                status=200,
+                content_type="application/json",
+                repeat=True,
+            )
+        with pytest.raises(TaginfoDataChangedError) as err:
+            await WikidataIndex.download(lang="fr", rp=5)
+
+    assert [date.day for date in err.value.data_until] == [28, 29]
+
+
+def _mock(m: aioresponses, data_until: str, total: int) -> None:
+    for rp in (1, 1000):
+        m.get(
+            url=f"{_URL}?lang=fr&page=1&rp={rp}&sortname=item&sortorder=asc",
+            body=_response(data_until, total=1 if rp == 1 else total),
+            status=200,
+            content_type="application/json",
+        )
+
+
+@pytest.mark.asyncio
+async def test_wikidata_index_refresh_with_client():
+    async with Client() as client:
+        with aioresponses() as m:
+            _mock(m, "2024-04-28T00:59:42Z", total=10)
+            index = await WikidataIndex.download(lang="fr", session=client)
+            assert await index.refresh(session=client) is False
+
+            # new data: neither the check nor the download use the cached responses
+            _mock(m, "2024-04-29T00:59:42Z", total=11)
+            assert await index.refresh(session=client) is True
+
+    assert index.data_until == datetime.fromisoformat("2024-04-29T00:59:42Z")
+    assert len(index) == 11
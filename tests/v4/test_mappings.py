@@ -9,10 +9,34 @@ from aio_taginfo.api.v4.key.prevalent_values import PrevalentValue
 from aio_taginfo.api.v4.key.projects import KeyProject
 from aio_taginfo.api.v4.key.similar import SimilarKey
 from aio_taginfo.api.v4.key.stats import KeyStats
+from aio_taginfo.api.v4.keys.all import KeyListItem
+from aio_taginfo.api.v4.languages import LanguageList
+from aio_taginfo.api.v4.project.tags import ProjectEntry
+from aio_taginfo.api.v4.projects.all import Project
+from aio_taginfo.api.v4.projects.keys import ProjectKey
+from aio_taginfo.api.v4.projects.tags import ProjectTag
 from aio_taginfo.api.v4.relation.projects import RelationProject
+from aio_taginfo.api.v4.relation.roles import RelationRole
+from aio_taginfo.api.v4.relation.stats import RelationStats
+from aio_taginfo.api.v4.relations.all import PrevalentRole, RelationListItem
+from aio_taginfo.api.v4.search.by_key_and_value import TagMatch
+from aio_taginfo.api.v4.search.by_keyword import KeywordMatch
+from aio_taginfo.api.v4.search.by_role import RoleMatch
+from aio_taginfo.api.v4.search.by_value import ValueMatch
 from aio_taginfo.api.v4.site.config.geodistribution import SiteConfigGeodistribution
+from aio_taginfo.api.v4.site.info import SiteInfo
+from aio_taginfo.api.v4.site.sources import SiteSource
+from aio_taginfo.api.v4.tag.chronology import TagChronology
+from aio_taginfo.api.v4.tag.combinations import TagCombination
+from aio_taginfo.api.v4.tag.overview import TagOverview
 from aio_taginfo.api.v4.tag.projects import TagProject
+from aio_taginfo.api.v4.tag.stats import TagStats
+from aio_taginfo.api.v4.tag.wiki_pages import WikiPage
+from aio_taginfo.api.v4.tags.list import TagListItem, encode_tags
 from aio_taginfo.api.v4.tags.popular import PopularTag
+from aio_taginfo.api.v4.unicode.characters import UnicodeCharacter
+from aio_taginfo.api.v4.wiki.languages import WikiLanguage
+from aio_taginfo.api.v4.wikidata.all import WikidataLink, WikidataLinkType
 
 import pytest
 from pydantic import HttpUrl, TypeAdapter, ValidationError
@@ -190,3 +214,245 @@ def test_tag_projects():
             assert isinstance(project.project_icon_url, Url | None)
         else:
             assert isinstance(project.project_icon_url, HttpUrl | None)
+
+
+def test_keys_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "keys_all.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[KeyListItem]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].key == "*"
+    assert response.data[0].in_wiki is True
+
+
+def test_tags_list():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tags_list_highway_amenity.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[TagListItem]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].key == "highway"
+    assert response.data[0].in_wiki is True
+    assert response.data[0].on_way is True
+    assert response.data[0].wiki["en"].description == "A highway linking large towns."
+    assert response.data[0].wiki["en"].osmcarto_rendering.width == 125
+    assert response.data[0].wiki["ms"].image is None
+
+
+def test_encode_tags():
+    assert encode_tags([("a", "1"), ("a", "2"), ("b", "3"), ("a", "4")]) == "a=1,2,b=3,a=4"
+    assert encode_tags([("a", "1"), ("a", "x=y")]) == "a=1,a=x=y"
+
+
+def test_unicode_characters():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "unicode_characters_highway.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[UnicodeCharacter]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].codepoint == 104
+    assert response.data[0].script_name == "Latin"
+    assert response.data[0].name == "LATIN SMALL LETTER H"
+
+
+def test_projects_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_all.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[Project]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].id == "architects_in_osm"
+    assert response.data[2].icon_url is None
+
+
+def test_projects_keys():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_keys.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[ProjectKey]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].key == "3dmr"
+    assert response.data[0].count_all_fraction == 0.0
+
+
+def test_projects_tags():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "projects_tags.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[ProjectTag]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].key == "3dr:type"
+    assert response.data[0].value == "0.0"
+
+
+def test_project_tags():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "project_tags_id_editor.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[ProjectEntry]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].key == "FIXME"
+    assert response.data[0].value is None
+    assert response.data[0].in_wiki is True
+
+
+def test_wikidata_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "wikidata_all_fr.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[WikidataLink]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].type == WikidataLinkType.KEY
+    assert response.data[0].description == "pays"
+    assert response.data[0].value is None
+
+
+def test_search():
+    test_dir = Path(__file__).resolve().parent
+    responses = test_dir / "responses"
+
+    response = TypeAdapter(Response[list[TagMatch]]).validate_json(
+        (responses / "search_by_key_and_value_highway_residential.json").read_text(), strict=True
+    )
+    assert response.data[0].key == "his:1972-:highway"
+
+    response = TypeAdapter(Response[list[KeywordMatch]]).validate_json(
+        (responses / "search_by_keyword_fire.json").read_text(), strict=True
+    )
+    assert response.data[1].value == "fire_station"
+
+    response = TypeAdapter(Response[list[RoleMatch]]).validate_json(
+        (responses / "search_by_role_foo.json").read_text(), strict=True
+    )
+    assert response.data[0].role == "food court"
+
+    response = TypeAdapter(Response[list[ValueMatch]]).validate_json(
+        (responses / "search_by_value_foo.json").read_text(), strict=True
+    )
+    assert response.data[4].key == "footway"
+
+
+def test_relation_roles():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relation_roles_multipolygon.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[RelationRole]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].role == ""
+    assert response.data[0].count_way_members == 16642
+
+
+def test_relation_stats():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relation_stats_multipolygon.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[RelationStats]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[2].count == 36940553
+
+
+def test_relations_all():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "relations_all.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[RelationListItem]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[2].rtype == "AP_WiFi"
+    assert response.data[2].prevalent_roles is None
+
+    item = TypeAdapter(RelationListItem).validate_python(
+        {
+            "rtype": "route",
+            "count": 1,
+            "count_fraction": 0.1,
+            "prevalent_roles": [{"role": "stop", "count": 1, "fraction": 0.5}],
+        }
+    )
+    assert item.prevalent_roles == [PrevalentRole(role="stop", count=1, fraction=0.5)]
+
+
+def test_tag_chronology():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_chronology_highway_primary.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[TagChronology]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert len(response.data) == response.total == 6042
+    assert response.data[0].date == datetime.date(2007, 10, 7)
+
+
+def test_tag_combinations():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_combinations_highway_residential.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[TagCombination]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].other_key == "name"
+    assert response.data[0].other_value == ""
+
+
+def test_tag_overview():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_overview_amenity_restaurant.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[TagOverview])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data.value == "restaurant"
+    assert response.data.counts[1].count == 1105120
+    assert response.data.has_map
+
+
+def test_tag_stats():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_stats_amenity_school.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[TagStats]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[2].count == 779254
+
+
+def test_tag_wiki_pages():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "tag_wiki_pages_highway_residential.json"
+    response_str = data_file.read_text()
+    type_adapter = TypeAdapter(Response[list[WikiPage]])
+    response = type_adapter.validate_json(response_str, strict=True)
+    assert response.data[0].lang == "ca"
+    assert response.data[0].image is not None
+    assert response.data[0].image.title == "File:Residential.jpg"
+    assert response.data[0].on_way
+    assert all(page.description != "" for page in response.data)
+
+
+def test_site_info_and_sources():
+    test_dir = Path(__file__).resolve().parent
+    info = TypeAdapter(SiteInfo).validate_json(
+        (test_dir / "responses" / "site_info.json").read_text(), strict=True
+    )
+    assert info.area == "World"
+
+    sources = TypeAdapter(list[SiteSource]).validate_json(
+        (test_dir / "responses" / "site_sources.json").read_text(), strict=True
+    )
+    assert sources[0].id == "db"
+    assert sources[0].data_until == datetime.datetime(2024, 4, 28, 0, 59, 42, tzinfo=datetime.UTC)
+
+
+def test_languages():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "languages.json"
+    response = TypeAdapter(LanguageList).validate_json(data_file.read_text(), strict=True)
+    assert response.total == 8744
+    assert response.data[0].subtag == "1606nict"
+    assert response.data[-1].notes is None
+
+
+def test_wiki_languages():
+    test_dir = Path(__file__).resolve().parent
+    data_file = test_dir / "responses" / "wiki_languages.json"
+    type_adapter = TypeAdapter(Response[list[WikiLanguage]])
+    response = type_adapter.validate_json(data_file.read_text(), strict=True)
+    assert response.data[0].code == "en"
+    assert response.data[-1].wiki_key_pages_fraction == 0.0
+    assert any(language.english_name is None for language in response.data)
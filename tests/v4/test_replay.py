@@ -0,0 +1,109 @@
+import gzip
+import time
+from pathlib import Path
+
+from aio_taginfo import key_distribution_nodes, key_overview, site_info
+from aio_taginfo._http import is_overload
+from aio_taginfo.cache import ResponseCache
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError
+from aio_taginfo.replay import Exchange, Recorder, Replayer
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+_BASE_URL = "https://taginfo.openstreetmap.org/api/4"
+
+
+async def _record(path: Path) -> Recorder:
+    recorder = Recorder()
+    async with Client(transport=recorder) as client:
+        with aioresponses() as m:
+            m.get(
+                url=f"{_BASE_URL}/key/overview?key=amenity",
+                body=(_RESPONSES / "key_overview_amenity.json").read_text(),
+                status=200,
+                content_type="application/json",
+            )
+            m.get(
+                url=f"{_BASE_URL}/key/distribution/nodes?key=amenity",
+                body=(_RESPONSES / "tag_distribution_nodes_amenity_post_box.png").read_bytes(),
+                status=200,
+                content_type="image/png",
+            )
+            m.get(url=f"{_BASE_URL}/site/info", status=503)
+            await key_overview(key="amenity", session=client)
+            await key_distribution_nodes(key="amenity", session=client)
+            with pytest.raises(TaginfoCallError):
+                await site_info(session=client)
+    recorder.save(path)
+    return recorder
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(tmp_path):
+    path = tmp_path / "workload.replay.gz"
+    recorder = await _record(path)
+    assert [exchange.request for exchange in recorder.exchanges] == [
+        "key/overview?key=amenity",
+        "key/distribution/nodes?key=amenity",
+        "site/info",
+    ]
+    assert [exchange.status for exchange in recorder.exchanges] == [200, 200, 503]
+
+    replayer = Replayer.load(path, latency_scale=0.0)
+    assert replayer.exchanges == recorder.exchanges
+
+    async with Client(transport=replayer) as client:
+        with aioresponses():  # any request fails
+            overview = await key_overview(key="amenity", session=client)
+            png = await key_distribution_nodes(key="amenity", session=client)
+            with pytest.raises(TaginfoCallError) as err:
+                await site_info(session=client)
+
+    assert overview.data.key == "amenity"
+    assert png.data == (_RESPONSES / "tag_distribution_nodes_amenity_post_box.png").read_bytes()
+    assert err.value.cause.status == 503
+    assert is_overload(err.value)
+    assert (replayer.requests, replayer.misses) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_replay_miss():
+    replayer = Replayer([], latency_scale=0.0)
+    async with Client(transport=replayer) as client:
+        with pytest.raises(TaginfoCallError):
+            await site_info(session=client)
+    assert (replayer.requests, replayer.misses) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_replay_order_and_latency():
+    def exchange(name: str, latency: float) -> Exchange:
+        body = (_RESPONSES / "site_info.json").read_text().replace("OpenStreetMap Taginfo", name)
+        return Exchange(
+            request="site/info",
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=body.encode(),
+            started=0.0,
+            latency=latency,
+        )
+
+    replayer = Replayer([exchange("first", 0.0), exchange("second", 0.2)], latency_scale=0.25)
+    async with Client(transport=replayer, cache=ResponseCache(max_entries=0)) as client:
+        assert (await site_info(session=client)).name == "first"
+        start = time.monotonic()
+        assert (await site_info(session=client)).name == "second"
+        assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+        assert (await site_info(session=client)).name == "second"
+
+
+def test_load_invalid_recording(tmp_path):
+    path = tmp_path / "invalid.replay.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"responses": {}}\n')
+    with pytest.raises(ValueError, match="does not contain a recording"):
+        Replayer.load(path)
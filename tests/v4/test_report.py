@@ -0,0 +1,139 @@
+import asyncio
+from pathlib import Path
+
+from aio_taginfo import key_report, tag_report
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError
+from aio_taginfo.report import KeyReportPart, TagReportPart
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+_BASE_URL = "https://taginfo.openstreetmap.org/api/4/key"
+
+
+def _mock(m: aioresponses, path: str, query: str, response_file: str, **kwargs):
+    m.get(
+        url=f"{_BASE_URL}/{path}?{query}",
+        body=(_RESPONSES / response_file).read_text(),
+        status=200,
+        content_type="application/json",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_key_report():
+    async with Client() as client:
+        with aioresponses() as m:
+            _mock(m, "overview", "key=highway", "key_overview_amenity.json")
+            _mock(m, "stats", "key=highway", "key_stats_amenity.json")
+            _mock(
+                m,
+                "combinations",
+                "filter=all&key=highway&page=1&rp=0&sortname=together_count&sortorder=desc",
+                "key_combinations_highway2.json",
+            )
+            _mock(
+                m,
+                "prevalent_values",
+                "filter=all&key=highway&min_fraction=0.01",
+                "key_prevalent_values_highway.json",
+            )
+            _mock(
+                m,
+                "projects",
+                "filter=all&key=highway&page=1&rp=0&sortname=project_name&sortorder=asc",
+                "key_projects_highway.json",
+            )
+            _mock(
+                m,
+                "similar",
+                "key=highway&page=1&rp=0&sortname=other_key&sortorder=asc",
+                "key_similar_highway.json",
+            )
+            m.get(url=f"{_BASE_URL}/chronology?key=highway", status=503)
+
+            report = await key_report("highway", session=client)
+
+    assert report.overview is not None
+    assert report.stats is not None
+    assert report.combinations is not None
+    assert report.prevalent_values is not None
+    assert report.projects is not None
+    assert report.similar is not None
+    assert report.chronology is None
+    assert not report.complete
+    assert list(report.errors) == [KeyReportPart.CHRONOLOGY]
+    assert isinstance(report.errors[KeyReportPart.CHRONOLOGY], TaginfoCallError)
+
+
+@pytest.mark.asyncio
+async def test_key_report_timeout():
+    async def slow(*_, **__):
+        await asyncio.sleep(10)
+
+    with aioresponses() as m:
+        _mock(m, "stats", "key=highway", "key_stats_amenity.json")
+        m.get(url=f"{_BASE_URL}/overview?key=highway", callback=slow)
+
+        report = await key_report(
+            "highway",
+            parts=[KeyReportPart.STATS, KeyReportPart.OVERVIEW],
+            timeout=0.1,
+        )
+
+    assert report.stats is not None
+    assert report.overview is None
+    assert isinstance(report.errors[KeyReportPart.OVERVIEW], TimeoutError)
+    assert report.combinations is None
+    assert KeyReportPart.COMBINATIONS not in report.errors
+
+
+@pytest.mark.asyncio
+async def test_tag_report():
+    base_url = "https://taginfo.openstreetmap.org/api/4/tag"
+    query = "key=highway&value=residential"
+    with aioresponses() as m:
+        for path, response_file in (
+            ("overview", "tag_overview_amenity_restaurant.json"),
+            ("stats", "tag_stats_amenity_school.json"),
+            ("wiki_pages", "tag_wiki_pages_highway_residential.json"),
+        ):
+            m.get(
+                url=f"{base_url}/{path}?{query}",
+                body=(_RESPONSES / response_file).read_text(),
+                status=200,
+                content_type="application/json",
+            )
+        m.get(
+            url=f"{base_url}/distribution/ways?{query}",
+            body=(_RESPONSES / "tag_distribution_ways_highway_residential.png").read_bytes(),
+            status=200,
+            content_type="image/png",
+        )
+        m.get(url=f"{base_url}/chronology?{query}", status=503)
+
+        report = await tag_report(
+            "highway",
+            "residential",
+            parts=[
+                TagReportPart.OVERVIEW,
+                TagReportPart.STATS,
+                TagReportPart.WIKI_PAGES,
+                TagReportPart.DISTRIBUTION_WAYS,
+                TagReportPart.CHRONOLOGY,
+            ],
+        )
+
+    assert report.value == "residential"
+    assert report.overview is not None
+    assert report.stats is not None
+    assert report.wiki_pages is not None
+    assert report.distribution_ways is not None
+    assert report.chronology is None
+    assert report.combinations is None
+    assert list(report.errors) == [TagReportPart.CHRONOLOGY]
+    assert isinstance(report.errors[TagReportPart.CHRONOLOGY], TaginfoCallError)
@@ -0,0 +1,115 @@
+import asyncio
+from pathlib import Path
+
+from aio_taginfo import key_stats
+from aio_taginfo.client import Client
+from aio_taginfo.scheduler import Priority, Scheduler, priority
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_prefers_interactive_requests():
+    scheduler = Scheduler(concurrency=1)
+    release = asyncio.Event()
+    order = []
+
+    async def request(name: str):
+        async def call():
+            order.append(name)
+            await release.wait()
+
+        await scheduler.run(call)
+
+    async def enqueue(value: Priority, name: str):
+        with priority(value):
+            return asyncio.create_task(request(name))
+
+    first = await enqueue(Priority.BULK, "bulk0")
+    await asyncio.sleep(0)
+    tasks = [first]
+    tasks += [await enqueue(Priority.BULK, f"bulk{i}") for i in range(1, 4)]
+    tasks += [await enqueue(Priority.INTERACTIVE, f"interactive{i}") for i in range(2)]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight() == 1
+    assert scheduler.waiting(Priority.BULK) == 3
+    assert scheduler.waiting(Priority.INTERACTIVE) == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["bulk0", "interactive0", "interactive1", "bulk1", "bulk2", "bulk3"]
+    assert scheduler.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_shares_slots_by_weight():
+    scheduler = Scheduler(concurrency=1, weights={Priority.DEFAULT: 2.0, Priority.BULK: 1.0})
+    gate = asyncio.Event()
+    order = []
+
+    async def request(value: Priority):
+        async def call():
+            order.append(value)
+            await gate.wait()
+
+        with priority(value):
+            await scheduler.run(call)
+
+    blocker = asyncio.create_task(request(Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(request(Priority.BULK)) for _ in range(3)]
+    tasks += [asyncio.create_task(request(Priority.DEFAULT)) for _ in range(6)]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+
+    # bulk requests are not starved, but get half as many slots
+    served = order[1:]
+    assert served[:6].count(Priority.BULK) == 2
+    assert served.count(Priority.BULK) == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_limits_and_cancellation():
+    scheduler = Scheduler(concurrency=4, limits={Priority.BULK: 1})
+    gate = asyncio.Event()
+
+    async def call():
+        await gate.wait()
+
+    with priority(Priority.BULK):
+        bulk = [asyncio.create_task(scheduler.run(call)) for _ in range(3)]
+    default = asyncio.create_task(scheduler.run(call))
+    await asyncio.sleep(0)
+    assert scheduler.in_flight(Priority.BULK) == 1
+    assert scheduler.in_flight(Priority.DEFAULT) == 1
+    assert scheduler.waiting(Priority.BULK) == 2
+
+    bulk[1].cancel()
+    await asyncio.sleep(0)
+    assert scheduler.waiting(Priority.BULK) == 1
+
+    gate.set()
+    await asyncio.gather(*bulk, default, return_exceptions=True)
+    assert scheduler.in_flight() == 0
+    assert scheduler.waiting() == 0
+
+
+@pytest.mark.asyncio
+async def test_client_scheduler():
+    url = "https://taginfo.openstreetmap.org/api/4/key/stats?key=amenity"
+    response_str = (_RESPONSES / "key_stats_amenity.json").read_text()
+    scheduler = Scheduler(concurrency=2)
+
+    async with Client(scheduler=scheduler) as client:
+        with aioresponses() as m:
+            m.get(url=url, body=response_str, status=200, content_type="application/json")
+            with priority(Priority.INTERACTIVE):
+                response = await key_stats(key="amenity", session=client)
+
+    assert response.data
+    assert scheduler.in_flight() == 0
@@ -0,0 +1,112 @@
+import asyncio
+import json
+from pathlib import Path
+
+from aio_taginfo import site_config_geodistribution, site_info, site_sources, wiki_languages
+from aio_taginfo.cache import ResponseCache
+from aio_taginfo.client import Client
+from aio_taginfo.snapshots import SNAPSHOT_CALLS, SNAPSHOT_TTL, download_snapshots, load_snapshots
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+_BASE_URL = "https://taginfo.openstreetmap.org/api/4"
+
+
+def _mock_all(m: aioresponses) -> None:
+    for path, response_file in (
+        ("site/config/geodistribution", "site_config_geodistribution.json"),
+        ("site/info", "site_info.json"),
+        ("site/sources", "site_sources.json"),
+        ("wiki/languages?sortname=wiki_key_pages&sortorder=desc", "wiki_languages.json"),
+    ):
+        m.get(
+            url=f"{_BASE_URL}/{path}",
+            body=(_RESPONSES / response_file).read_text(),
+            status=200,
+            content_type="application/json",
+        )
+
+
+@pytest.mark.asyncio
+async def test_bundled_snapshots():
+    async with Client() as client:
+        with aioresponses():  # any request fails
+            assert load_snapshots(client, revalidate=False, fresh=True) == len(SNAPSHOT_CALLS)
+            geodistribution = await site_config_geodistribution(session=client)
+            info = await site_info(session=client)
+            sources = await site_sources(session=client)
+            languages = await wiki_languages(session=client)
+
+    assert geodistribution.width > 0
+    assert info.name
+    assert sources
+    assert languages.data
+    assert client.cache.get("site/info").ttl == SNAPSHOT_TTL
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_stale():
+    info = json.loads((_RESPONSES / "site_info.json").read_text())
+    info["name"] = "Another Taginfo"
+
+    async with Client() as client:
+        with aioresponses() as m:
+            m.get(f"{_BASE_URL}/site/info", payload=info, status=200)
+            assert load_snapshots(client, revalidate=False) == len(SNAPSHOT_CALLS)
+            assert "site/info" not in client.cache
+            assert client.cache.get("site/info", stale=True).stale
+
+            # without 'stale_while_revalidate', the snapshot is not used
+            assert (await site_info(session=client)).name == "Another Taginfo"
+
+    assert client.cache.ttls == {}
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_revalidated():
+    info = json.loads((_RESPONSES / "site_info.json").read_text())
+    info["name"] = "Another Taginfo"
+
+    async with Client(stale_while_revalidate=True) as client:
+        with aioresponses() as m:
+            m.get(f"{_BASE_URL}/site/info", payload=info, status=200)
+            load_snapshots(client)
+            assert (await site_info(session=client)).name == "OpenStreetMap Taginfo"
+
+            await asyncio.gather(*client._background, return_exceptions=True)
+            assert (await site_info(session=client)).name == "Another Taginfo"
+
+            # the other requests failed, and the snapshots are kept
+            assert (await site_sources(session=client))[0].id == "db"
+
+
+@pytest.mark.asyncio
+async def test_snapshots_do_not_replace_fresh_responses():
+    cache = ResponseCache(ttls={"site/info": 60.0})
+    async with Client(cache=cache) as client:
+        with aioresponses() as m:
+            _mock_all(m)
+            await site_info(session=client)
+            assert load_snapshots(client, revalidate=False) == len(SNAPSHOT_CALLS) - 1
+
+    assert cache.ttls == {"site/info": 60.0}
+
+
+@pytest.mark.asyncio
+async def test_download_snapshots(tmp_path: Path):
+    path = tmp_path / "snapshots.json"
+    with aioresponses() as m:
+        _mock_all(m)
+        await download_snapshots(path)
+
+    async with Client() as client:
+        with aioresponses():
+            assert load_snapshots(client, path, revalidate=False, fresh=True) == len(SNAPSHOT_CALLS)
+            assert (await wiki_languages(session=client)).data[0].code == "en"
+
+    path.write_text("[]")
+    with pytest.raises(ValueError, match="does not contain snapshots"):
+        load_snapshots(Client(), path)
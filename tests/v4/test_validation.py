@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+
+from aio_taginfo import key_combinations, key_overview
+from aio_taginfo.api.v4 import SortOrder
+from aio_taginfo.api.v4.key.chronology import call_stream as key_chronology_stream
+from aio_taginfo.api.v4.key.combinations import KeyCombinationSorting
+from aio_taginfo.client import Client
+from aio_taginfo.error import TaginfoCallError, TaginfoValidationError
+from aio_taginfo.validation import lenient
+
+import pytest
+from aioresponses import aioresponses
+
+
+_RESPONSES = Path(__file__).resolve().parent / "responses"
+_URL = (
+    "https://taginfo.openstreetmap.org/api/4/key/combinations"
+    "?filter=all&key=highway&page=1&rp=0&sortname=together_count&sortorder=desc"
+)
+
+
+def _response_with_invalid_item() -> tuple[str, int]:
+    response = json.loads((_RESPONSES / "key_combinations_highway2.json").read_text())
+    response["data"][1]["together_count"] = -1
+    return json.dumps(response), len(response["data"])
+
+
+@pytest.mark.asyncio
+async def test_lenient_list_validation():
+    body, n_items = _response_with_invalid_item()
+
+    with aioresponses() as m:
+        m.get(url=_URL, body=body, status=200, content_type="application/json")
+        with pytest.raises(TaginfoValidationError):
+            await key_combinations(key="highway")
+
+        m.get(url=_URL, body=body, status=200, content_type="application/json")
+        with lenient() as report:
+            response = await key_combinations(key="highway")
+
+    assert len(response.data) == n_items - 1
+    assert len(report) == 1
+    rejected = report.rejected[0]
+    assert rejected.index == 1
+    assert rejected.item["together_count"] == -1
+    assert rejected.path.startswith("key/combinations?")
+
+
+@pytest.mark.asyncio
+async def test_lenient_validation_with_client():
+    body, n_items = _response_with_invalid_item()
+
+    async with Client() as client:
+        with aioresponses() as m:
+            m.get(url=_URL, body=body, status=200, content_type="application/json")
+            with lenient() as report:
+                everything = await key_combinations(key="highway", session=client)
+                # answered from the cache, and reported again
+                page = await key_combinations(
+                    key="highway",
+                    sortname=KeyCombinationSorting.OTHER_KEY,
+                    sortorder=SortOrder.ASC,
+                    rp=5,
+                    session=client,
+                )
+
+            # responses that are not lists are not validated leniently
+            m.get(
+                url="https://taginfo.openstreetmap.org/api/4/key/overview?key=highway",
+                body="{}",
+                status=200,
+                content_type="application/json",
+            )
+            with pytest.raises(TaginfoValidationError), lenient():
+                await key_overview(key="highway", session=client)
+
+    assert len(everything.data) == n_items - 1
+    assert len(page.data) == 5
+    # the positions in all results, which answered the request for a page
+    assert [r.index for r in report.rejected] == [1, 1]
+    assert report.rejected[1].path == "key/combinations?filter=all&key=highway"
+
+
+@pytest.mark.asyncio
+async def test_lenient_stream_validation():
+    response = json.loads((_RESPONSES / "key_chronology_highway.json").read_text())
+    response["data"][2]["date"] = "yesterday"
+    body = json.dumps(response)
+    url = "https://taginfo.openstreetmap.org/api/4/key/chronology?key=highway"
+
+    with aioresponses() as m:
+        m.get(url=url, body=body, status=200, content_type="application/json")
+        with pytest.raises(TaginfoValidationError):
+            _ = [entry async for entry in key_chronology_stream(key="highway")]
+
+        m.get(url=url, body=body, status=200, content_type="application/json")
+        with lenient() as report:
+            entries = [entry async for entry in key_chronology_stream(key="highway")]
+
+    assert len(entries) == len(response["data"]) - 1
+    assert len(report) == 1
+    assert report.rejected[0].index == 2
+    assert report.rejected[0].item["date"] == "yesterday"
+
+
+@pytest.mark.asyncio
+async def test_lenient_call_error():
+    with aioresponses() as m:
+        m.get(url=_URL, status=503)
+        with pytest.raises(TaginfoCallError), lenient():
+            await key_combinations(key="highway")